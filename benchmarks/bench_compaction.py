@@ -0,0 +1,92 @@
+"""
+What description_compactor saves, and what it costs in ranking quality, on
+the sectioned fixture postings from corpus.build_postings.
+
+Reports the characters / estimated tokens / batchEmbedContents payload
+bytes of the raw vs compacted descriptions and the compaction time per
+description. It then scores every posting against corpus.RESUME_TEXT both
+ways and reports the Spearman correlation and top-10 overlap of the two
+rankings: always with the offline local_scoring scorer, and with Gemini
+too (plus the wall time of each embedding pass) when GEMINI_API_KEY is
+set. Exits 1 if any correlation is below --min-rho.
+
+Run: PYTHONPATH=src python benchmarks/bench_compaction.py [--n 60] [--min-rho 0.9]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import semantic_scoring
+from corpus import RESUME_TEXT, build_postings
+from description_compactor import CHARS_PER_TOKEN, compact_description
+from local_scoring import LocalScorer
+from ranking import spearman, top_k_overlap
+
+
+def payload_bytes(texts) -> int:
+    """Size of the batchEmbedContents request bodies for `texts`."""
+    model = f"models/{semantic_scoring.EMBEDDING_MODEL}"
+    total = 0
+    for start in range(0, len(texts), semantic_scoring.EMBED_BATCH_LIMIT):
+        body = {"requests": [
+            {"model": model, "content": {"parts": [{"text": t}]}}
+            for t in texts[start:start + semantic_scoring.EMBED_BATCH_LIMIT]
+        ]}
+        total += len(json.dumps(body).encode("utf-8"))
+    return total
+
+
+def compare(label, raw_scores, compact_scores, min_rho):
+    rho = spearman(raw_scores, compact_scores)
+    print(
+        f"  {label:<7} Spearman {rho:.3f}, top-10 overlap "
+        f"{top_k_overlap(raw_scores, compact_scores):.0%}"
+    )
+    return rho >= min_rho
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--n", type=int, default=60)
+    parser.add_argument("--min-rho", type=float, default=0.9)
+    args = parser.parse_args(argv)
+
+    raw = [p["description"] for p in build_postings(args.n)]
+    started = time.perf_counter()
+    compact = [compact_description(d) for d in raw]
+    per_ms = (time.perf_counter() - started) / len(raw) * 1000
+
+    raw_chars, compact_chars = sum(map(len, raw)), sum(map(len, compact))
+    raw_bytes, compact_bytes = payload_bytes(raw), payload_bytes(compact)
+    print(f"{len(raw)} postings, compaction {per_ms:.2f} ms each")
+    print(
+        f"  chars   {raw_chars:>9,} -> {compact_chars:>9,} "
+        f"(~{raw_chars // CHARS_PER_TOKEN:,} -> ~{compact_chars // CHARS_PER_TOKEN:,} tokens)"
+    )
+    print(f"  payload {raw_bytes:>9,} -> {compact_bytes:>9,} bytes ({1 - compact_bytes / raw_bytes:.0%} saved)")
+
+    print("Ranking raw vs compacted:")
+    local = LocalScorer(resume_text=RESUME_TEXT)
+    ok = compare("local", local.score_many(raw), local.score_many(compact), args.min_rho)
+
+    if os.environ.get(semantic_scoring.GEMINI_API_KEY_ENV):
+        timings, scores = {}, {}
+        for name, compact_flag in (("raw", False), ("compact", True)):
+            scorer = semantic_scoring.SemanticScorer(resume_text=RESUME_TEXT, compact=compact_flag)
+            scorer.resume_embedding  # embed the resume outside the timed pass
+            started = time.perf_counter()
+            scores[name] = scorer.score_many(raw)
+            timings[name] = time.perf_counter() - started
+        print(f"  embedding pass {timings['raw']:.2f}s raw, {timings['compact']:.2f}s compacted")
+        ok = compare("gemini", scores["raw"], scores["compact"], args.min_rho) and ok
+    else:
+        print(f"  gemini  skipped ({semantic_scoring.GEMINI_API_KEY_ENV} not set)")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
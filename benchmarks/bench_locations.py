@@ -0,0 +1,97 @@
+"""
+Throughput benchmark for scoring.is_us_location against the original
+per-state regex loop, over location strings in the shapes JobSpy boards
+(LinkedIn/Indeed/Glassdoor/ZipRecruiter/Google) and the SimplifyJobs /
+new-grad GitHub tables actually produce.
+
+Also reports where the two disagree -- every disagreement should be a
+location the old loop missed (full state name, bare city, "United States"),
+never one it accepted.
+
+Run: PYTHONPATH=src python benchmarks/bench_locations.py [rounds]
+"""
+
+import re
+import sys
+import time
+
+import scoring
+
+# A scrape run sees a few hundred distinct strings, each many times.
+CORPUS = [
+    # JobSpy: LinkedIn / Indeed / Glassdoor / ZipRecruiter
+    "San Francisco, CA", "San Francisco, CA, US", "New York, NY", "New York, NY, US",
+    "Seattle, WA", "Seattle, WA, US", "Austin, TX", "Austin, TX, US",
+    "Mountain View, CA, US", "Sunnyvale, CA", "Redmond, WA", "Boston, MA, US",
+    "Cambridge, MA", "Chicago, IL", "Atlanta, GA, US", "Denver, CO",
+    "Raleigh, NC, US", "Pittsburgh, PA", "Washington, DC", "Arlington, VA, US",
+    "Salt Lake City, UT", "Columbus, OH", "Minneapolis, MN, US", "Phoenix, AZ",
+    "Remote", "Remote, US", "United States", "US", "USA",
+    "Toronto, ON, Canada", "Vancouver, BC, Canada", "London, England, United Kingdom",
+    "Bengaluru, Karnataka, India", "Berlin, Germany", "Dublin, Ireland",
+    "Austin, Texas", "Atlanta, Georgia", "New York, New York, United States",
+    "San Jose, California, United States", "Texas", "California", "Georgia",
+    "Tbilisi, Georgia", "San Francisco Bay Area", "Greater Seattle Area",
+    "New York City Metropolitan Area", "Hybrid - Seattle, WA", "", "Multiple Locations",
+    # SimplifyJobs / new-grad GitHub tables
+    "NYC", "SF", "SFNYC", "Seattle", "Boston", "Chicago", "Los Angeles",
+    "Menlo Park, CA", "Palo Alto, CA", "New York, NY", "Remote in USA",
+    "San Francisco, CA</br>New York, NY", "Remote in Canada", "Toronto, Canada",
+    "Bellevue, WA", "Cupertino, CA", "Irvine, CA", "Durham, NC", "Madison, WI",
+]
+
+
+def legacy_is_us_location(location: str) -> bool:
+    """scoring.is_us_location before the resolver rewrite."""
+    loc = location.lower()
+
+    if "canada" in loc:
+        return False
+
+    if "remote" in loc:
+        return True
+
+    has_state = any(re.search(rf",\s*{s}\b", loc) for s in scoring.US_STATES)
+    if not has_state and loc in ("nyc", "sf", "sfnyc"):
+        has_state = True
+
+    return has_state
+
+
+def _time(fn, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for loc in CORPUS:
+            fn(loc)
+    return time.perf_counter() - start
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    calls = rounds * len(CORPUS)
+
+    legacy = _time(legacy_is_us_location, rounds)
+    scoring._resolve_us_location.cache_clear()
+    cold = _time(scoring.is_us_location, 1)
+    current = _time(scoring.is_us_location, rounds)
+
+    print(f"{len(CORPUS)} locations x {rounds} rounds = {calls} calls")
+    print(f"  legacy regex loop : {calls / legacy:12,.0f} calls/s")
+    print(f"  resolver (cached) : {calls / current:12,.0f} calls/s  ({legacy / current:.1f}x)")
+    print(f"  resolver (cold)   : {len(CORPUS) / cold:12,.0f} calls/s")
+
+    diffs = [
+        (loc, legacy_is_us_location(loc), scoring.is_us_location(loc))
+        for loc in CORPUS
+        if legacy_is_us_location(loc) != scoring.is_us_location(loc)
+    ]
+    if diffs:
+        print("Changed verdicts (legacy -> resolver):")
+        for loc, old, new in diffs:
+            print(f"  {loc!r}: {old} -> {new}")
+    if any(old and not new for _, old, new in diffs):
+        sys.exit("resolver rejected a location the legacy loop accepted")
+
+
+if __name__ == "__main__":
+    main()
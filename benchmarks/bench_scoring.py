@@ -0,0 +1,252 @@
+"""
+Micro-benchmarks for scoring.py and the scrapers' per-candidate
+_passes_filters / _build_raw_job (JobSpy's column-wise _frame_to_jobs, after
+checking it against jobspy_reference.py), over the synthetic corpus in
+corpus.py.
+
+For each case it reports ops/sec (best of --rounds, scoring caches cleared
+before every round so memoized functions are measured at the corpus's own
+repeat rate, not 100% hits) and the tracemalloc peak of one round. Results
+are compared to benchmarks/baseline.json; a case whose throughput drops
+more than --tolerance below its baseline fails the run (exit 1).
+
+Machines differ, so every throughput is divided by the speed of a fixed
+pure-Python calibration loop timed alongside it, and baselines store those
+normalized numbers -- a baseline recorded on a laptop still means
+something in CI. Scraper cases whose dependencies (jobspy, bs4, ...) aren't
+installed are skipped, not failed.
+
+Run: PYTHONPATH=src python benchmarks/bench_scoring.py [--update-baseline]
+         [--tolerance 0.5] [--rounds 7] [--jobs 2000] [--only substring]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+import scoring
+from corpus import RESUME_TEXT, build_corpus
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+# Even best-of-7 and normalized, unchanged code lands up to ~40% below its
+# baseline on a busy single-core runner (the regex-heavy cases the most);
+# flag only clear regressions. The checked-in baseline is the median of six
+# runs.
+DEFAULT_TOLERANCE = 0.5
+
+SETTINGS = {"entry_level_only": True, "us_only": True, "remote_allowed": False}
+MIN_START = date(2027, 5, 1)
+
+
+_CALIBRATION_WORDS = [f"word{i}" for i in range(200)]
+CALIBRATION_REPS = 200
+
+
+def _calibration_seconds():
+    """Time a fixed dict/str workload -- the unit throughputs are scaled by."""
+    start = time.perf_counter()
+    for _ in range(CALIBRATION_REPS):
+        counts = {}
+        for w in _CALIBRATION_WORDS:
+            key = w.lower()
+            counts[key] = counts.get(key, 0) + len(key)
+    return time.perf_counter() - start
+
+
+# ----------------------------
+# Cases
+# ----------------------------
+
+def scoring_cases(jobs):
+    skills = scoring.resume_skills(RESUME_TEXT)
+    texts = [f"{j['title']} {j['description']}" for j in jobs]
+    cases = {
+        "is_us_location": lambda: [scoring.is_us_location(j["location"]) for j in jobs],
+        "classify_role": lambda: [scoring.classify_role(j["title"]) for j in jobs],
+        "compute_relevance_score": lambda: [
+            scoring.compute_relevance_score(j["title"], j["location"]) for j in jobs
+        ],
+        "has_senior_title": lambda: [scoring.has_senior_title(j["title"]) for j in jobs],
+        "is_entry_level": lambda: [scoring.is_entry_level(j["title"], j["description"]) for j in jobs],
+        "is_new_grad_or_entry": lambda: [
+            scoring.is_new_grad_or_entry(j["title"], j["description"]) for j in jobs
+        ],
+        "text_signals": lambda: [scoring.text_signals(j["title"], j["description"]) for j in jobs],
+        "compute_confidence": lambda: [scoring.compute_confidence(s, True) for s in range(len(jobs))],
+        "extract_start_date": lambda: [scoring.extract_start_date(t) for t in texts],
+        "extract_grad_year": lambda: [scoring.extract_grad_year(t) for t in texts],
+        "extract_timing": lambda: [scoring.extract_timing(t) for t in texts],
+        "passes_start_date_filter": lambda: [
+            scoring.passes_start_date_filter(j["title"], j["description"], MIN_START) for j in jobs
+        ],
+        "blend_scores": lambda: [scoring.blend_scores(s % 100, (s * 7) % 100) for s in range(len(jobs))],
+        "resume_skills": lambda: [scoring.resume_skills(j["description"]) for j in jobs],
+        "resume_match_boost": lambda: [scoring.resume_match_boost(skills, t) for t in texts],
+        "resume_match_boosts": lambda: scoring.resume_match_boosts(skills, texts),
+    }
+    try:
+        import pandas as pd
+    except ImportError:
+        return cases
+
+    titles = pd.Series([j["title"] for j in jobs])
+    descriptions = pd.Series([j["description"] for j in jobs])
+    locations = pd.Series([j["location"].lower() for j in jobs])
+    cases.update({
+        "relevance_scores": lambda: scoring.relevance_scores(titles),
+        "new_grad_or_entry_mask": lambda: scoring.new_grad_or_entry_mask(titles, descriptions),
+        "role_types": lambda: scoring.role_types(titles),
+        "us_location_mask": lambda: scoring.us_location_mask(locations),
+    })
+    return cases
+
+
+def _scraper_case(scraper, candidates):
+    scraper.settings = SETTINGS
+
+    def run():
+        return [scraper._build_raw_job(c) for c in candidates if scraper._passes_filters(c)]
+
+    return run
+
+
+def scraper_cases(jobs):
+    """(cases, skipped) for every scraper whose module imports here."""
+    cases, skipped = {}, []
+
+    try:
+        from scrapers.jobspy_source import JobSpyScraper
+    except ImportError as e:
+        skipped.append(f"jobspy ({e})")
+    else:
+        from jobspy_reference import jobspy_frame, reference_frame_to_jobs
+
+        jobspy = JobSpyScraper()
+        jobspy.settings = SETTINGS
+        frame = jobspy_frame(jobs)
+        if jobspy._frame_to_jobs(frame, "Chicago, IL") != reference_frame_to_jobs(
+            jobspy, frame, "Chicago, IL"
+        ):
+            sys.exit("JobSpyScraper._frame_to_jobs disagrees with jobspy_reference")
+        cases["JobSpyScraper"] = lambda: jobspy._frame_to_jobs(frame, "Chicago, IL")
+
+    try:
+        from scrapers.google_search import GoogleSearchScraper
+    except ImportError as e:
+        skipped.append(f"google_search ({e})")
+    else:
+        candidates = [{
+            "job_title": j["title"], "company": j["company"], "location": j["location"],
+            "job_url": "https://example.com/job", "description": j["description"],
+            "date_posted": "", "schedule_type": "Full-time",
+        } for j in jobs]
+        cases["GoogleSearchScraper"] = _scraper_case(GoogleSearchScraper(api_key="bench"), candidates)
+
+    rows = [{
+        "company": j["company"], "role": j["title"], "location": j["location"],
+        "apply": "https://example.com/job", "age": j["age"],
+    } for j in jobs]
+    for module, cls in (("new_grad_github", "NewGradGitHubScraper"), ("simplify_github", "SimplifyGitHubScraper")):
+        try:
+            scraper = getattr(__import__(f"scrapers.{module}", fromlist=[cls]), cls)()
+        except ImportError as e:
+            skipped.append(f"{module} ({e})")
+        else:
+            cases[cls] = _scraper_case(scraper, rows)
+
+    return cases, skipped
+
+
+# ----------------------------
+# Measurement
+# ----------------------------
+
+def measure(fn, calls, rounds):
+    """
+    (ops/sec, normalized ops, tracemalloc peak bytes). Each round times the
+    calibration workload right next to the case; the normalized figure is
+    the best case round over the best calibration round. Interference only
+    ever slows a round down, so best-of-N is far steadier than a per-round
+    ratio, where a stall in either timing skews it.
+    """
+    best = best_calibration = float("inf")
+    for _ in range(rounds):
+        best_calibration = min(best_calibration, _calibration_seconds())
+        scoring.clear_scoring_caches()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    scoring.clear_scoring_caches()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return calls / best, (calls / best) / (CALIBRATION_REPS / best_calibration), peak
+
+
+def _load_baseline():
+    try:
+        with open(BASELINE_PATH, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--only", help="run only cases whose name contains this")
+    args = parser.parse_args(argv)
+
+    jobs = build_corpus(args.jobs)
+    cases = scoring_cases(jobs)
+    more, skipped = scraper_cases(jobs)
+    cases.update(more)
+    if args.only:
+        cases = {k: v for k, v in cases.items() if args.only in k}
+
+    baseline = _load_baseline().get("cases", {})
+    results, regressions = {}, []
+
+    print(f"{len(jobs)} jobs, {args.rounds} rounds per case")
+    print(f"{'case':28} {'ops/s':>12} {'norm':>9} {'vs base':>8} {'peak KiB':>9}")
+    for name, fn in cases.items():
+        ops, norm, peak = measure(fn, len(jobs), args.rounds)
+        results[name] = round(norm, 4)
+
+        ratio = ""
+        if name in baseline:
+            change = norm / baseline[name] - 1
+            ratio = f"{change:+.0%}"
+            if change < -args.tolerance:
+                regressions.append(f"{name}: {change:+.0%} vs baseline")
+        print(f"{name:28} {ops:12,.0f} {norm:9.3f} {ratio:>8} {peak / 1024:9.0f}")
+
+    for reason in skipped:
+        print(f"skipped {reason}")
+
+    if args.update_baseline:
+        merged = dict(baseline, **results)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as fh:
+            json.dump({"jobs": args.jobs, "cases": merged}, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return
+
+    if regressions:
+        print(f"Slower than baseline by more than {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
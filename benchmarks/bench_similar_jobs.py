@@ -0,0 +1,104 @@
+"""
+Top-k latency of store.similar_jobs at 10k and 100k stored jobs, against a
+throwaway local libSQL file filled with synthetic clustered embeddings.
+
+For each size it reports the bytes stored per embedding, the time to write
+them (store.put_job_embeddings) and to load the in-memory index cold, the
+p50/p95 latency of similar_jobs() once the index is warm, and recall@k of
+the int8 index against an exact float32 cosine search over the original
+vectors.
+
+Run: PYTHONPATH=src python benchmarks/bench_similar_jobs.py
+         [--sizes 10000,100000] [--dims 768] [--k 10] [--queries 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import job_index
+import store
+
+
+def synthetic_vectors(n, dims, seed=0, clusters=200):
+    """Unit-ish vectors around `clusters` centres, like postings that come in
+    families (same company / role)."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dims)).astype(np.float32)
+    labels = rng.integers(0, clusters, n)
+    vectors = centres[labels] + 0.6 * rng.standard_normal((n, dims)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def fill(conn, vectors):
+    ids = [f"bench-{i}" for i in range(len(vectors))]
+    conn.executemany(
+        "INSERT INTO jobs (job_id, job_title, company, job_url, source, archived) "
+        "VALUES (?, ?, ?, ?, 'bench', 0)",
+        [(job_id, f"Engineer {i}", f"Company {i % 500}", f"https://example.com/{i}")
+         for i, job_id in enumerate(ids)],
+    )
+    conn.commit()
+    started = time.perf_counter()
+    for start in range(0, len(ids), 5000):
+        store.put_job_embeddings(
+            job_index.embedding_rows(ids[start:start + 5000], vectors[start:start + 5000]),
+            conn=conn,
+        )
+    return ids, time.perf_counter() - started
+
+
+def bench_size(n, dims, k, queries):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = store.init_schema(store.libsql.connect(os.path.join(tmp, "bench.db")))
+        vectors = synthetic_vectors(n, dims)
+        ids, write_s = fill(conn, vectors)
+        stored = conn.execute("SELECT AVG(LENGTH(vector)) FROM job_embeddings").fetchone()[0]
+
+        job_index._INDEXES.clear()
+        started = time.perf_counter()
+        job_index.index_for(conn)
+        load_s = time.perf_counter() - started
+
+        rng = np.random.default_rng(1)
+        picks = rng.choice(n, size=queries, replace=False)
+        latencies, recalls = [], []
+        for i in picks:
+            started = time.perf_counter()
+            hits = store.similar_jobs(ids[i], k=k, conn=conn)
+            latencies.append(time.perf_counter() - started)
+
+            exact = vectors @ vectors[i]
+            exact[i] = -np.inf
+            truth = {ids[j] for j in np.argpartition(-exact, k)[:k]}
+            recalls.append(len(truth & {h["job_id"] for h in hits}) / k)
+
+        latencies.sort()
+        print(
+            f"{n:>7,} jobs x {dims} dims: {stored:.0f} B/embedding "
+            f"(float32 would be {4 * dims}), write {write_s:.1f}s, "
+            f"cold index load {load_s:.2f}s\n"
+            f"          similar_jobs(k={k}) p50 {1000 * statistics.median(latencies):.1f} ms, "
+            f"p95 {1000 * latencies[int(0.95 * (len(latencies) - 1))]:.1f} ms, "
+            f"recall@{k} vs exact float32 {statistics.mean(recalls):.3f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--dims", type=int, default=768)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args(argv)
+    for n in (int(s) for s in args.sizes.split(",")):
+        bench_size(n, args.dims, args.k, args.queries)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+Deterministic synthetic job corpus for the benchmarks.
+
+Shaped after real JobSpy / SimplifyJobs output: titles are built from the
+level prefixes, role nouns and suffixes boards actually use (so the same
+few hundred titles recur, as they do across a run's title x location
+queries), locations come from bench_locations.CORPUS, and descriptions are
+~6000-char postings assembled from boilerplate paragraphs plus the phrasing
+scoring.py reacts to -- skills, start dates, grad years, seniority
+requirements, ASAP wording. No real postings are included.
+
+    from corpus import build_corpus
+    jobs = build_corpus(2000)   # same list on every call / machine
+"""
+
+import random
+
+from bench_locations import CORPUS as LOCATIONS
+
+LEVELS = [
+    "", "", "", "Junior ", "Senior ", "Sr. ", "Staff ", "Associate ", "Entry Level ",
+    "Lead ", "Principal ", "New Grad ", "Graduate ",
+]
+ROLES = [
+    "Software Engineer", "Software Developer", "Backend Engineer", "Frontend Developer",
+    "Full Stack Engineer", "Machine Learning Engineer", "ML Engineer", "AI Engineer",
+    "Data Engineer", "Data Scientist", "Data Analyst", "Research Engineer",
+    "Site Reliability Engineer", "Platform Engineer", "Product Manager",
+    "Software Engineer I", "Software Engineer II", "Engineer III",
+    "Software Engineering Intern", "Quantitative Developer",
+]
+SUFFIXES = [
+    "", "", "", ", New Grad", " - 2027 Start", " (Remote)", ", Early Career",
+    " - Infrastructure", ", University Graduate", " II", " (L4)", " - Payments",
+]
+COMPANIES = [
+    "Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries",
+    "Wayne Enterprises", "Wonka", "Cyberdyne", "Soylent", "Tyrell", "Aperture",
+]
+SITES = ["linkedin", "indeed", "glassdoor", "zip_recruiter", "google"]
+
+BOILERPLATE = [
+    "We are building the next generation of developer tooling for teams of every size. ",
+    "Our platform processes billions of events per day across multiple regions. ",
+    "You will collaborate with product, design and research to ship features end to end. ",
+    "We value ownership, clear writing and a bias toward simple, well-tested solutions. ",
+    "Benefits include health coverage, a learning budget and flexible hours. ",
+    "We are an equal opportunity employer and welcome applicants of all backgrounds. ",
+    "The team maintains services that power search, recommendations and billing. ",
+    "You will write design documents, review code and mentor interns. ",
+]
+SIGNALS = [
+    "Experience with Python, Java or Go is required. ",
+    "Familiarity with SQL, Postgres and Redis is a plus. ",
+    "You have shipped React and TypeScript applications. ",
+    "Hands-on with AWS, Docker and Kubernetes. ",
+    "Background in machine learning, PyTorch or TensorFlow. ",
+    "Exposure to distributed systems and microservices. ",
+    "Start date: June 2027. ",
+    "This role starts in Summer 2027. ",
+    "Positions begin January 2026. ",
+    "Open to the Class of 2027. ",
+    "For students graduating in 2026. ",
+    "2027 new grads are encouraged to apply. ",
+    "We need someone to start immediately. ",
+    "Start date: ASAP. ",
+    "Requires 5+ years of professional experience. ",
+    "Recent graduates welcome; no experience required. ",
+    "Ideal for new grads and entry-level engineers. ",
+]
+
+DESCRIPTION_CHARS = 6000
+
+
+def _description(rnd: random.Random) -> str:
+    parts = []
+    size = 0
+    while size < DESCRIPTION_CHARS:
+        part = rnd.choice(SIGNALS) if rnd.random() < 0.15 else rnd.choice(BOILERPLATE)
+        parts.append(part)
+        size += len(part)
+    return "".join(parts)[:DESCRIPTION_CHARS]
+
+
+def build_corpus(n: int = 2000, seed: int = 0) -> list:
+    """n job dicts: title, company, location, description, is_remote, site, age."""
+    rnd = random.Random(seed)
+    # Boards syndicate postings, so descriptions repeat too -- draw from a pool.
+    descriptions = [_description(rnd) for _ in range(max(1, n // 4))]
+    jobs = []
+    for _ in range(n):
+        location = rnd.choice(LOCATIONS)
+        jobs.append({
+            "title": f"{rnd.choice(LEVELS)}{rnd.choice(ROLES)}{rnd.choice(SUFFIXES)}",
+            "company": rnd.choice(COMPANIES),
+            "location": location,
+            "description": rnd.choice(descriptions),
+            "is_remote": "remote" in location.lower(),
+            "site": rnd.choice(SITES),
+            "age": f"{rnd.randint(0, 40)}d",
+        })
+    return jobs
+
+
+RESUME_TEXT = (
+    "Computer science student graduating May 2027. Python, Java, SQL, React, "
+    "TypeScript, AWS, Docker, PyTorch, pandas, NumPy, Linux, Git. Built REST "
+    "APIs with FastAPI and a distributed systems course project."
+)
+
+
+# Sectioned postings, as JSON-LD descriptions and fallback page text come
+# back from description_fetcher (whitespace collapsed): a company pitch,
+# the role's own content, then benefits / compensation / EEO, with page
+# chrome around the fallback ones. Roles span close and far matches for
+# RESUME_TEXT so similarity rankings have something to order.
+POSTING_ROLES = [
+    ("Backend Software Engineer", [
+        "Design, build and operate REST APIs and services in Python and Go.",
+        "Own features end to end, from design documents to production monitoring.",
+        "Improve the reliability and latency of distributed systems handling millions of requests.",
+        "Work with Postgres, Redis and Kafka on AWS; deploy with Docker and Kubernetes.",
+    ], [
+        "BS in Computer Science or a related field, or graduating by 2027.",
+        "Experience with Python, Java or Go and SQL databases.",
+        "Familiarity with Linux, Git and automated testing.",
+    ]),
+    ("Machine Learning Engineer", [
+        "Train, evaluate and ship ranking and recommendation models.",
+        "Build data pipelines with pandas, NumPy and Spark.",
+        "Serve PyTorch models behind low-latency APIs.",
+    ], [
+        "Coursework or projects in machine learning and statistics.",
+        "Strong Python; experience with PyTorch or TensorFlow.",
+        "Comfort with SQL and large datasets.",
+    ]),
+    ("Frontend Developer", [
+        "Build accessible web applications in React and TypeScript.",
+        "Collaborate with designers on component libraries and design systems.",
+        "Profile and improve page load performance.",
+    ], [
+        "Experience shipping React and TypeScript applications.",
+        "Understanding of HTML, CSS and browser APIs.",
+    ]),
+    ("Data Analyst", [
+        "Build dashboards and reports for the sales and finance teams.",
+        "Write SQL to answer business questions and define metrics.",
+        "Present findings to stakeholders.",
+    ], [
+        "Strong SQL and Excel; Tableau or Looker a plus.",
+        "Degree in statistics, economics or a quantitative field.",
+    ]),
+    ("Registered Nurse", [
+        "Provide direct patient care on a medical-surgical unit.",
+        "Administer medications and document care in the EHR.",
+        "Coordinate with physicians and families on care plans.",
+    ], [
+        "Active RN license and BLS certification.",
+        "One year of acute care experience preferred.",
+    ]),
+    ("Retail Sales Associate", [
+        "Greet customers, process transactions and restock merchandise.",
+        "Maintain store presentation and inventory accuracy.",
+    ], [
+        "Customer service experience; weekend availability.",
+        "Able to lift 25 lbs.",
+    ]),
+    ("Site Reliability Engineer", [
+        "Run and automate the infrastructure behind our core platform on AWS.",
+        "Own incident response, SLOs and capacity planning.",
+        "Write tooling in Python and Go; manage Kubernetes clusters with Terraform.",
+    ], [
+        "Experience with Linux, networking and containers.",
+        "Scripting in Python or Bash.",
+    ]),
+    ("Accountant", [
+        "Prepare monthly close, reconciliations and journal entries.",
+        "Support audits and tax filings.",
+    ], [
+        "CPA or progress toward CPA; GAAP knowledge.",
+        "Advanced Excel.",
+    ]),
+]
+POSTING_PITCH = [
+    "{company} is on a mission to make work simpler for millions of people.",
+    "Founded in 2012, {company} has grown to over 3,000 employees across 14 offices.",
+    "We are backed by leading investors and were named a Best Place to Work three years running.",
+    "Our culture is built on ownership, curiosity and kindness.",
+]
+POSTING_BENEFITS = [
+    "Competitive salary and equity.", "Medical, dental and vision insurance for you and your family.",
+    "401(k) with company match.", "Unlimited PTO and 16 weeks of paid parental leave.",
+    "Annual learning stipend and home office budget.", "Commuter benefits and catered lunches.",
+]
+POSTING_LEGAL = [
+    "{company} is an equal opportunity employer. All qualified applicants will receive consideration "
+    "for employment without regard to race, color, religion, sex, sexual orientation, gender identity, "
+    "national origin, disability or protected veteran status.",
+    "If you need a reasonable accommodation during the application process, please contact us.",
+    "{company} participates in E-Verify.",
+    "The expected base pay range for this role is $95,000 - $145,000, per our pay transparency policy.",
+]
+POSTING_CHROME = [
+    "Skip to main content", "Sign in", "Apply now", "Share this job", "Back to all jobs",
+    "We use cookies to improve your experience. By clicking Accept you agree to our Cookie Policy.",
+    "Privacy Policy Terms of Use © 2026 All rights reserved", "Similar jobs", "Get job alerts",
+]
+
+
+def build_postings(n: int = 60, seed: int = 0) -> list:
+    """n {"title", "description"} postings with labelled sections and the
+    boilerplate around them, same on every call / machine."""
+    rnd = random.Random(seed)
+    postings = []
+    for i in range(n):
+        title, duties, reqs = POSTING_ROLES[i % len(POSTING_ROLES)]
+        company = rnd.choice(COMPANIES)
+        heading = lambda options: rnd.choice(options) + rnd.choice([": ", " "])  # noqa: E731
+        parts = []
+        fallback_page = rnd.random() < 0.4
+        if fallback_page:
+            parts += rnd.sample(POSTING_CHROME, 4) + [f"{title} {company}"]
+        parts.append(heading(["About Us", f"About {company}", "Who We Are"]))
+        parts += rnd.sample(POSTING_PITCH, 3)
+        parts.append(heading(["Responsibilities", "What You'll Do", "Key Responsibilities"]))
+        parts += [f"• {d}" for d in rnd.sample(duties, len(duties))]
+        parts.append(heading(["Requirements", "Qualifications", "Minimum Qualifications"]))
+        parts += [f"• {r}" for r in rnd.sample(reqs, len(reqs))]
+        parts.append(heading(["Benefits", "What We Offer", "Perks and Benefits"]))
+        parts += [f"• {b}" for b in rnd.sample(POSTING_BENEFITS, 4)]
+        parts += rnd.sample(POSTING_LEGAL, 3)
+        if fallback_page:
+            parts += rnd.sample(POSTING_CHROME, 4) + rnd.sample(POSTING_CHROME, 2)
+        text = " ".join(p.format(company=company) for p in parts)
+        postings.append({"title": title, "description": " ".join(text.split())[:DESCRIPTION_CHARS]})
+    return postings
@@ -0,0 +1,157 @@
+"""
+What smaller Gemini embeddings (outputDimensionality) and cheaper cache
+encodings cost in ranking quality, on the fixture postings from
+corpus.build_postings scored against corpus.RESUME_TEXT.
+
+The reference is the production default: 3072-dim float32 vectors. For
+every --dims size and every cache encoding (float32 / float16 / int8, as
+semantic_scoring.EmbeddingCache stores them) it reports the bytes per
+cached vector and the reduction vs the reference, and -- against the
+reference ranking of the postings -- the Spearman correlation of the
+resume similarities, the top-10 overlap and the largest 0-100 score change.
+
+Vectors come from Gemini (one batched pass per size, job descriptions
+compacted as SemanticScorer sends them) when GEMINI_API_KEY is set, or from
+an --vectors file saved by an earlier run with --save. With --truncate only
+the 3072-dim pass is requested and smaller sizes are taken as its
+renormalized prefix (the model is trained so the two agree closely). With
+no key and no file only the storage columns are printed.
+
+With --min-rho, exits 1 if any configuration's Spearman is below it.
+
+Run: PYTHONPATH=src python benchmarks/eval_embedding_dims.py
+         [--n 60] [--dims 3072,1536,768,256,128] [--truncate]
+         [--vectors vectors.npz] [--save vectors.npz] [--min-rho 0.95]
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+import semantic_scoring
+from corpus import RESUME_TEXT, build_postings
+from description_compactor import compact_description
+from ranking import spearman, top_k_overlap
+
+FULL_DIMS = 3072
+
+
+def embed_all(texts, dims):
+    """{dims: (n, dims) float32 array} for the requested sizes from Gemini,
+    row 0 being the resume; None if any text failed to embed."""
+    api_key = os.environ.get(semantic_scoring.GEMINI_API_KEY_ENV)
+    out = {}
+    for size in dims:
+        # The model's default output is the full size; ask for it explicitly
+        # only when reducing.
+        embedder = semantic_scoring.GeminiEmbedder(
+            api_key, dims=size if size != FULL_DIMS else None
+        )
+        vectors = embedder.embed_many(texts)
+        if any(v is None for v in vectors):
+            print(f"  {size}-dim pass failed ({embedder.breaker.reason or 'missing vectors'})")
+            return None
+        out[size] = np.asarray(vectors, dtype=np.float32)
+    return out
+
+
+def truncated(full, size):
+    """The first `size` components of each row, renormalized."""
+    prefix = full[:, :size]
+    return prefix / np.linalg.norm(prefix, axis=1, keepdims=True)
+
+
+def encoded(vectors, encoding):
+    """`vectors` as they read back from an EmbeddingCache with `encoding`."""
+    rows = []
+    for vector in vectors:
+        blob, scale = semantic_scoring._pack_vector(vector, encoding)
+        rows.append(semantic_scoring._unpack_vector(blob, encoding, scale))
+    return np.stack(rows)
+
+
+def resume_similarities(vectors):
+    """Cosine similarity of rows 1.. (jobs) to row 0 (the resume)."""
+    units = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return units[1:] @ units[0]
+
+
+def to_scores(sims):
+    return [semantic_scoring._similarity_to_score(float(s)) for s in sims]
+
+
+def vector_bytes(size, encoding):
+    return len(semantic_scoring._pack_vector(np.zeros(size, dtype=np.float32), encoding)[0])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--n", type=int, default=60)
+    parser.add_argument("--dims", default="3072,1536,768,256,128")
+    parser.add_argument("--truncate", action="store_true")
+    parser.add_argument("--vectors", help="npz of vectors saved by --save (skips the API)")
+    parser.add_argument("--save", help="write the embedded vectors here (npz)")
+    parser.add_argument("--min-rho", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    dims = sorted({int(d) for d in args.dims.split(",")} | {FULL_DIMS}, reverse=True)
+    texts = [RESUME_TEXT] + [compact_description(p["description"]) for p in build_postings(args.n)]
+
+    vectors = None
+    if args.vectors:
+        with np.load(args.vectors) as saved:
+            vectors = {int(k): saved[k] for k in saved.files}
+        print(f"{len(next(iter(vectors.values()))) - 1} postings, vectors from {args.vectors}")
+    elif os.environ.get(semantic_scoring.GEMINI_API_KEY_ENV):
+        print(f"{args.n} postings, embedding with {semantic_scoring.EMBEDDING_MODEL}")
+        vectors = embed_all(texts, [FULL_DIMS] if args.truncate else dims)
+        if vectors is not None and args.save:
+            np.savez(args.save, **{str(k): v for k, v in vectors.items()})
+    else:
+        print(
+            f"{args.n} postings; ranking columns skipped "
+            f"({semantic_scoring.GEMINI_API_KEY_ENV} not set, no --vectors)"
+        )
+    if vectors is not None and args.truncate:
+        if FULL_DIMS not in vectors:
+            raise SystemExit(f"--truncate needs {FULL_DIMS}-dim vectors")
+        vectors = {d: truncated(vectors[FULL_DIMS], d) for d in dims}
+    if vectors is not None and any(d not in vectors for d in dims):
+        raise SystemExit(f"no vectors for dims {sorted(set(dims) - set(vectors))}; try --truncate")
+
+    reference_bytes = vector_bytes(FULL_DIMS, "float32")
+    reference = resume_similarities(vectors[FULL_DIMS]) if vectors is not None else None
+    reference_scores = to_scores(reference) if reference is not None else None
+    print(
+        f"{'dims':>5} {'encoding':<8} {'B/vector':>9} {'smaller':>8}   "
+        f"{'spearman':>8} {'top-10':>7} {'max Δscore':>10}"
+    )
+    ok = True
+    for size in dims:
+        for encoding in semantic_scoring.VECTOR_ENCODINGS:
+            size_bytes = vector_bytes(size, encoding)
+            line = f"{size:>5} {encoding:<8} {size_bytes:>9,} {reference_bytes / size_bytes:>7.0f}x"
+            if vectors is not None:
+                sims = resume_similarities(encoded(vectors[size], encoding))
+                scores = to_scores(sims)
+                rho = spearman(reference.tolist(), sims.tolist())
+                drift = max(abs(a - b) for a, b in zip(reference_scores, scores))
+                line += (
+                    f"   {rho:>8.3f} {top_k_overlap(reference.tolist(), sims.tolist()):>7.0%} "
+                    f"{drift:>10}"
+                )
+                if args.min_rho is not None and rho < args.min_rho:
+                    ok = False
+                    line += "  < min-rho"
+            print(line)
+    print(
+        "Stored job embeddings (job_embeddings) are always int8; the encoding "
+        "column applies to the embedding cache."
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Row-by-row reference for JobSpyScraper._frame_to_jobs: the per-row parse ->
+filter -> build path the scraper used before it went column-wise, kept here
+(not in the scraper) so bench_scoring.py can check the two still agree.
+
+    reference_frame_to_jobs(scraper, df, query_location) == scraper._frame_to_jobs(df, query_location)
+
+jobspy_frame(jobs) turns corpus.build_corpus() jobs into a JobSpy-shaped
+result frame, with the missing/NaN cells real boards return.
+"""
+
+import pandas as pd
+
+import filter_plan
+import scoring
+from scrapers.jobspy_source import _SITE_BY_NORM, _norm
+
+
+def parse_row(scraper, row, query_location):
+    title = scraper._clean(row.get("title"))
+    company = scraper._clean(row.get("company"))
+    location = scraper._normalize_location(scraper._clean(row.get("location")) or query_location)
+    # Prefer the direct employer link when JobSpy resolved one.
+    link = scraper._clean(row.get("job_url_direct")) or scraper._clean(row.get("job_url"))
+    description = scraper._clean(row.get("description"))
+    date_posted = scraper._parse_date(row.get("date_posted"))
+    is_remote = bool(row.get("is_remote")) if pd.notna(row.get("is_remote")) else False
+    site_raw = scraper._clean(row.get("site"))
+    source = _SITE_BY_NORM.get(_norm(site_raw), site_raw) or scraper.SOURCE_NAME
+
+    if not title or not company or not link:
+        return None
+
+    return {
+        "job_title": title,
+        "company": company,
+        "location": location,
+        "job_url": link,
+        "description": description,
+        "date_posted": date_posted,
+        "is_remote": is_remote,
+        "source": source,
+    }
+
+
+def passes_filters(scraper, candidate):
+    plan = filter_plan.for_settings(scraper.settings, scraper.FILTER_RULES)
+    return plan.passes(
+        candidate["job_title"], candidate["location"],
+        candidate.get("description", ""), is_remote=candidate.get("is_remote"),
+    )
+
+
+def build_raw_job(scraper, candidate):
+    title = candidate["job_title"]
+    description = candidate.get("description", "")
+
+    signals = scoring.text_signals(title, description)
+    score = signals["relevance_score"]
+    if signals["new_grad_or_entry"]:
+        score = min(score + 20, 100)
+
+    return {
+        "job_title": title,
+        "company": candidate["company"],
+        "location": candidate["location"],
+        "job_url": candidate["job_url"],
+        "source": candidate.get("source") or scraper.SOURCE_NAME,
+        "date_posted": candidate.get("date_posted", ""),
+        "description": description,
+        "relevance_score": score,
+        "role_type": signals["role_type"],
+        "confidence": scoring.compute_confidence(score, True),
+    }
+
+
+def reference_frame_to_jobs(scraper, df, query_location):
+    out = []
+    for _, row in df.iterrows():
+        candidate = parse_row(scraper, row, query_location)
+        if candidate is not None and passes_filters(scraper, candidate):
+            out.append(build_raw_job(scraper, candidate))
+    return out
+
+
+def jobspy_frame(jobs):
+    """A JobSpy result frame for `jobs`: some rows lack a direct link, a
+    company, a location or a posting date, as board results do."""
+    return pd.DataFrame([{
+        "site": j["site"],
+        "title": j["title"],
+        "company": None if i % 11 == 5 else j["company"],
+        "location": float("nan") if i % 13 == 7 else j["location"],
+        "job_url": f"https://example.com/job/{i}",
+        "job_url_direct": float("nan") if i % 3 else f"https://careers.example.com/{i}",
+        "description": j["description"],
+        "is_remote": None if i % 17 == 3 else j["is_remote"],
+        "date_posted": pd.NaT if i % 5 == 2 else pd.Timestamp("2026-09-01") + pd.Timedelta(days=i % 30),
+    } for i, j in enumerate(jobs)])
@@ -0,0 +1,44 @@
+"""
+Rank-agreement helpers shared by the benchmarks that compare two scorings of
+the same fixture set (bench_compaction.py, eval_embedding_dims.py).
+"""
+
+import numpy as np
+
+
+def _ranks(values) -> np.ndarray:
+    """1-based ranks, ties given their average rank."""
+    values = np.asarray(values, dtype=np.float64)
+    order = np.argsort(values, kind="stable")
+    ranks = np.empty(len(values), dtype=np.float64)
+    ranks[order] = np.arange(1, len(values) + 1)
+    for value in np.unique(values):
+        tied = values == value
+        if tied.sum() > 1:
+            ranks[tied] = ranks[tied].mean()
+    return ranks
+
+
+def spearman(a, b) -> float:
+    """Spearman rank correlation of two aligned score lists (NaN if either
+    is constant). Items None in either list are left out."""
+    pairs = [(x, y) for x, y in zip(a, b) if x is not None and y is not None]
+    if len(pairs) < 2:
+        return float("nan")
+    ra, rb = _ranks([p[0] for p in pairs]), _ranks([p[1] for p in pairs])
+    if ra.std() == 0 or rb.std() == 0:
+        return float("nan")
+    return float(np.corrcoef(ra, rb)[0, 1])
+
+
+def top_k_overlap(a, b, k=10) -> float:
+    """Share of the k best items under `a` that are also among the k best
+    under `b`."""
+    def top(scores):
+        ranked = sorted(
+            (i for i, s in enumerate(scores) if s is not None), key=lambda i: -scores[i]
+        )
+        return set(ranked[:k])
+
+    best = top(a)
+    return len(best & top(b)) / max(1, len(best))
@@ -17,7 +17,7 @@ CREATE TABLE IF NOT EXISTS jobs (
     relevance_score    INTEGER,
     role_type          TEXT,
     confidence         REAL,
-    semantic_scored    INTEGER DEFAULT 0,
+    semantic_scored    INTEGER DEFAULT 0,   -- 0 none, 1 Gemini, 2 local offline scorer
     archived           INTEGER DEFAULT 0,
     last_updated       TEXT,
     -- freeze switch (agent never overwrites a locked row)
@@ -38,12 +38,31 @@ CREATE TABLE IF NOT EXISTS jobs (
     summary            TEXT,      -- brief role summary
     company_summary    TEXT,
     skills             TEXT,      -- JSON array of skill strings
-    enriched_at        TEXT
+    enriched_at        TEXT,
+    -- score components, so a scoring-rules change can be re-applied to stored
+    -- rows without a re-scrape (see src/rescore_jobs.py). Added after the
+    -- first release: store.init_schema ALTERs them into older databases.
+    keyword_score      INTEGER,   -- title/keyword score before semantic blend + resume boost
+    semantic_score     INTEGER,   -- raw resume-similarity score (NULL = never embedded)
+    scoring_version    TEXT,      -- scoring.rules_version() that produced relevance_score
+    -- description-derived features (scoring.extract_features), written at
+    -- ingestion / backfill so filters can be re-applied in SQL later
+    start_date         TEXT,      -- ISO date (first of month) or NULL
+    grad_year          INTEGER,
+    immediate_start    INTEGER,   -- 1 = "start ASAP" phrasing
+    entry_level        INTEGER,   -- scoring.is_new_grad_or_entry verdict
+    senior_title       INTEGER,
+    skill_hits         TEXT,      -- JSON array of scoring._RESUME_SKILLS labels
+    features_at        TEXT       -- NULL = features never extracted
 );
 
 CREATE INDEX IF NOT EXISTS idx_jobs_status  ON jobs(application_status);
 CREATE INDEX IF NOT EXISTS idx_jobs_applied ON jobs(applied);
 CREATE INDEX IF NOT EXISTS idx_jobs_score   ON jobs(relevance_score);
+-- retroactive min_start_date / entry_level_only filters (store.start_date_filter_sql)
+CREATE INDEX IF NOT EXISTS idx_jobs_start_date  ON jobs(start_date);
+CREATE INDEX IF NOT EXISTS idx_jobs_grad_year   ON jobs(grad_year);
+CREATE INDEX IF NOT EXISTS idx_jobs_entry_level ON jobs(entry_level);
 
 -- Append-only history of status changes (rendered as the job's timeline).
 CREATE TABLE IF NOT EXISTS status_events (
@@ -86,3 +105,73 @@ CREATE TABLE IF NOT EXISTS resume (
     id      INTEGER PRIMARY KEY CHECK (id = 1),
     content TEXT
 );
+
+-- Lease-based work queue for the per-job background passes (description
+-- fetching, semantic backfill, enrichment). One row per (task, job_id);
+-- workers claim rows atomically with a lease, so concurrent runs (or a
+-- matrix of workers) drain the backlog without double-processing a job.
+CREATE TABLE IF NOT EXISTS work_queue (
+    task          TEXT NOT NULL,     -- 'describe' | 'semantic' | 'semantic_upgrade' | 'enrich'
+    job_id        TEXT NOT NULL REFERENCES jobs(job_id),
+    status        TEXT NOT NULL DEFAULT 'pending',  -- pending | leased | done | failed
+    priority      TEXT,              -- sort key; newest date_found first
+    lease_owner   TEXT,
+    lease_token   TEXT,
+    lease_expires INTEGER,           -- unix epoch seconds
+    attempts      INTEGER DEFAULT 0,
+    last_error    TEXT,
+    created_at    TEXT,
+    updated_at    TEXT,
+    PRIMARY KEY (task, job_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_work_queue_claim ON work_queue(task, status, priority);
+
+-- Run-level single-flight leases: a runner must hold its row (by name) before
+-- it starts, so overlapping dashboard-triggered runs don't scrape the same
+-- boards concurrently. A crashed holder's lease simply expires.
+CREATE TABLE IF NOT EXISTS run_leases (
+    name        TEXT PRIMARY KEY,   -- e.g. 'jobspy_scrape'
+    holder      TEXT NOT NULL,
+    acquired_at TEXT,
+    expires_at  INTEGER NOT NULL    -- unix epoch seconds
+);
+
+-- Small key/value store for agent bookkeeping that isn't a user setting
+-- (e.g. bulk-import resume cursors). Never surfaced on the dashboard.
+CREATE TABLE IF NOT EXISTS agent_state (
+    key        TEXT PRIMARY KEY,
+    value      TEXT,
+    updated_at TEXT
+);
+
+-- Content-addressed cache of Gemini embeddings (semantic_scoring.EmbeddingCache),
+-- so backfill / re-scrapes / the resume never pay to embed the same text twice.
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    key          TEXT PRIMARY KEY,  -- sha256 of model (+ encoding) + normalized text
+    model        TEXT NOT NULL,     -- embedding space, e.g. "gemini-embedding-001@768"
+    dims         INTEGER NOT NULL,
+    vector       BLOB NOT NULL,     -- dims values stored as `encoding`
+    encoding     TEXT,              -- float32 (NULL on older rows), float16 or int8
+    scale        REAL,              -- int8 only: vector ~= scale * int8 values
+    created_at   TEXT,
+    last_used_at INTEGER            -- unix epoch seconds; eviction is oldest-first
+);
+
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_lru ON embedding_cache(last_used_at);
+
+-- Each job's Gemini embedding, for "similar jobs" (store.similar_jobs via
+-- job_index) and rescoring without the API: the unit vector quantized to int8.
+CREATE TABLE IF NOT EXISTS job_embeddings (
+    job_id     TEXT PRIMARY KEY REFERENCES jobs(job_id),
+    model      TEXT NOT NULL,
+    dims       INTEGER NOT NULL,
+    scale      REAL NOT NULL,       -- unit vector ~= scale * int8 values
+    vector     BLOB NOT NULL,       -- int8 x dims
+    updated_at INTEGER NOT NULL,    -- unix epoch ms
+    seq        INTEGER              -- write order, 1 + the max at write time;
+                                    -- job_index reloads rows above the last seen
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_embeddings_model ON job_embeddings(model, updated_at);
+CREATE INDEX IF NOT EXISTS idx_job_embeddings_seq ON job_embeddings(seq);
@@ -0,0 +1,80 @@
+"""
+Re-apply the current min_start_date / entry_level_only settings to jobs
+already in the database, from their stored feature columns (see
+scoring.extract_features) -- no descriptions, no page fetches. Use it after
+tightening either setting: ingestion only filters what it scrapes from then
+on.
+
+entry_level_only is re-applied per source the way its scraper gates it:
+the strict entry-level verdict for JobSpy boards and Google Search, only
+senior titles for the curated new-grad list, nothing for simplify_github.
+
+Report-only by default: counts the jobs that now fail each filter. With
+--archive, those jobs are archived -- except applied or locked ones, which
+are never touched. Jobs whose features were never extracted count as
+passing (nothing is known about them); backfill_worker.py describe fills
+them in.
+
+Run: PYTHONPATH=src python src/apply_filters.py [--archive]
+"""
+
+import sys
+from datetime import datetime, timezone
+
+import store
+
+
+def failing_filters_sql(settings):
+    """(sql, params) matching active, unlocked, not-applied jobs that fail
+    the configured filters, or None when no filter is configured."""
+    clauses, params = [], []
+    if settings.get("min_start_date"):
+        sql, p = store.start_date_filter_sql(settings["min_start_date"])
+        clauses.append(sql)
+        params.extend(p)
+    if settings.get("entry_level_only"):
+        sql, p = store.entry_level_filter_sql()
+        clauses.append(sql)
+        params.extend(p)
+    if not clauses:
+        return None
+    return (
+        "archived = 0 AND locked = 0 AND applied = 0 "
+        f"AND NOT ({' AND '.join(clauses)})",
+        params,
+    )
+
+
+def main():
+    conn = store.get_connection()
+    settings = store.get_settings(conn)
+
+    failing = failing_filters_sql(settings)
+    if failing is None:
+        print("Neither min_start_date nor entry_level_only is set; nothing to apply.")
+        return
+    where, params = failing
+
+    total = conn.execute("SELECT COUNT(*) FROM jobs WHERE archived = 0").fetchone()[0]
+    unextracted = conn.execute(
+        "SELECT COUNT(*) FROM jobs WHERE archived = 0 AND features_at IS NULL"
+    ).fetchone()[0]
+    n = conn.execute(f"SELECT COUNT(*) FROM jobs WHERE {where}", tuple(params)).fetchone()[0]
+    print(
+        f"{n}/{total} active job(s) fail min_start_date={settings.get('min_start_date')} "
+        f"entry_level_only={settings.get('entry_level_only')} "
+        f"({unextracted} without extracted features, kept)"
+    )
+
+    if "--archive" not in sys.argv or not n:
+        return
+    cur = conn.execute(
+        f"UPDATE jobs SET archived = 1, last_updated = ? WHERE {where}",
+        (datetime.now(timezone.utc).isoformat(), *params),
+    )
+    conn.commit()
+    print(f"Archived {getattr(cur, 'rowcount', 0) or 0} job(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Queue-driven backfill workers: drain the Turso work_queue (see store.py) for
+one task without ever processing the same job twice.
+
+Each worker claims a small batch under a lease, heartbeats while it works,
+marks rows done/failed, and hands unfinished rows back if it has to stop
+early. That makes it safe to run several of these at once -- an inline pass
+at the end of run_jobspy_ingestion.py, a manual run, or N GitHub Actions
+matrix workers -- with no duplicated page fetches or embedding spend.
+
+Tasks handled here:
+  semantic         -- fetch the description, resume-score it, promote the
+                      blended score
+  semantic_upgrade -- the same for jobs only scored offline, with Gemini
+  describe         -- fetch the description and store it on the row
+
+All three also store the description's extracted features
+(store.set_features), so start-date / entry-level filters can later be
+re-applied in SQL.
+
+The 'enrich' task (LLM summary/skills) is claimed by the dashboard against the
+same table; it is not processed from Python.
+
+Run: PYTHONPATH=src python src/backfill_worker.py [semantic|describe] [max_items]
+"""
+
+import sys
+
+import scoring
+import store
+from description_fetcher import fetch_job_description
+
+# Sources eligible for resume-score backfill (JobSpy boards + legacy sources).
+BACKFILL_SOURCES = [
+    "linkedin", "indeed", "glassdoor", "zip_recruiter", "google",
+    "google_search", "new_grad_github",
+]
+
+CLAIM_BATCH = 10
+
+
+def drain_semantic(scorer, max_items=25, sources=BACKFILL_SOURCES,
+                   worker_id=None, conn=None) -> int:
+    """
+    Resume-score queued jobs with `scorer` (a semantic_scoring.ScorerChain,
+    or a single scorer), attempting at most `max_items` -- failed fetches
+    count too, so a run against rate-limiting sites stays bounded. Returns
+    the number promoted. Each claimed batch is scored in one batched call;
+    if any of it can't be scored, the unscored rows are released and the
+    drain stops -- if credits ran out mid-pass there's no point hammering
+    the API.
+
+    Then, while Gemini is up, the rest of the budget goes to upgrading jobs
+    that were only scored by the offline local scorer.
+    """
+    if not scorer.available:
+        print("Backfill skipped (semantic scoring unavailable)")
+        return 0
+
+    from semantic_scoring import ScorerChain
+
+    if not isinstance(scorer, ScorerChain):
+        scorer = ScorerChain([scorer])
+    conn = conn or store.get_connection()
+    worker_id = worker_id or store.default_worker_id()
+    done, attempted, stopped = _drain_scores(
+        "semantic", scorer, max_items, sources, worker_id, conn
+    )
+
+    gemini = scorer.gemini
+    if not stopped and attempted < max_items and gemini is not None and gemini.available \
+            and gemini.unavailable_reason is None:
+        upgraded, _, _ = _drain_scores(
+            "semantic_upgrade", ScorerChain([gemini]), max_items - attempted, sources,
+            worker_id, conn,
+        )
+        if upgraded:
+            print(f"Backfill: {upgraded} locally-scored job(s) re-scored with Gemini")
+        done += upgraded
+    return done
+
+
+def _drain_scores(task, scorer, max_items, sources, worker_id, conn):
+    """(promoted, attempted, stopped_early) for one semantic queue task,
+    claiming at most `max_items` rows."""
+    from job_index import embedding_rows
+
+    store.enqueue_jobs(task, sources=sources, conn=conn)
+    resume_skill_set = scoring.resume_skills(store.get_resume(conn))
+
+    done = attempted = 0
+    while attempted < max_items:
+        batch = store.claim_work(
+            task, worker_id, limit=min(CLAIM_BATCH, max_items - attempted),
+            sources=sources, conn=conn,
+        )
+        if not batch:
+            break
+        attempted += len(batch)
+        described = []
+        for idx, job in enumerate(batch):
+            fetched = fetch_job_description(job["job_url"])
+            description = fetched["description"]
+            if not description:
+                # Posting expired / blocked scraping / not HTML. Counts as an
+                # attempt; the row is retried on later runs up to the cap.
+                store.fail_work(task, job["job_id"], worker_id, "no description", conn=conn)
+            else:
+                features = scoring.extract_features(job["job_title"], description)
+                store.set_features(job["job_id"], features, conn=conn)
+                described.append((job, description, features))
+            # Still holding: the fetched rows awaiting embedding + the rest.
+            store.heartbeat_work(
+                task,
+                [j["job_id"] for j, _, _ in described] + [j["job_id"] for j in batch[idx + 1:]],
+                worker_id, conn=conn,
+            )
+
+        # One batched scoring pass for the whole claim.
+        scored, embeddings = scorer.score_and_embed([d for _, d, _ in described])
+        if scorer.gemini is not None:
+            store.put_job_embeddings(
+                embedding_rows(
+                    [job["job_id"] for job, _, _ in described], embeddings,
+                    model=scorer.gemini.space,
+                ),
+                conn=conn,
+            )
+        unscored = []
+        for (job, _, features), (semantic_score, engine) in zip(described, scored):
+            if semantic_score is None:
+                unscored.append(job["job_id"])
+                continue
+            if job["keyword_score"] is not None:
+                # Built as rescore_jobs.rescore_row would: the keyword score,
+                # the semantic score and the resume boost from the features
+                # just stored (a locally-scored job's relevance_score already
+                # has the local score blended in).
+                boost = 0
+                if job["source"] in scoring.RESUME_BOOST_SOURCES:
+                    boost = scoring.skill_boost(resume_skill_set, features["skill_hits"])
+                score, confidence = scoring.final_score(job["keyword_score"], semantic_score, boost)
+            else:
+                score = scoring.blend_scores(job["relevance_score"], semantic_score)
+                confidence = scoring.compute_confidence(score, True)
+            store.promote_scores(
+                job["job_id"], score, confidence,
+                semantic_score=semantic_score, engine=engine, conn=conn,
+            )
+            store.complete_work(task, job["job_id"], worker_id, conn=conn)
+            done += 1
+        if unscored:
+            print("Backfill stopped early (semantic scoring unavailable)")
+            store.release_work(task, unscored, worker_id, conn=conn)
+            return done, attempted, True
+    return done, attempted, False
+
+
+def drain_describe(max_items=100, sources=None, worker_id=None, conn=None) -> int:
+    """Fetch and store descriptions for queued jobs, attempting at most
+    `max_items` (failures included). Returns the number stored."""
+    conn = conn or store.get_connection()
+    worker_id = worker_id or store.default_worker_id()
+    store.enqueue_jobs("describe", sources=sources, conn=conn)
+
+    done = attempted = 0
+    while attempted < max_items:
+        batch = store.claim_work(
+            "describe", worker_id, limit=min(CLAIM_BATCH, max_items - attempted),
+            sources=sources, conn=conn,
+        )
+        if not batch:
+            break
+        attempted += len(batch)
+        for idx, job in enumerate(batch):
+            description = fetch_job_description(job["job_url"])["description"]
+            if description:
+                store.set_description(job["job_id"], description, conn=conn)
+                store.set_features(
+                    job["job_id"], scoring.extract_features(job["job_title"], description), conn=conn
+                )
+                store.complete_work("describe", job["job_id"], worker_id, conn=conn)
+                done += 1
+            else:
+                store.fail_work("describe", job["job_id"], worker_id, "no description", conn=conn)
+            store.heartbeat_work(
+                "describe", [j["job_id"] for j in batch[idx + 1:]], worker_id, conn=conn
+            )
+    return done
+
+
+def main():
+    task = sys.argv[1] if len(sys.argv) > 1 else "semantic"
+    max_items = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    conn = store.get_connection()
+
+    if task == "semantic":
+        from semantic_scoring import scorer_for_settings
+
+        scorer = scorer_for_settings(
+            store.get_settings(conn), resume_text=store.get_resume(conn), conn=conn
+        )
+        n = drain_semantic(scorer, max_items=max_items, conn=conn)
+    elif task == "describe":
+        n = drain_describe(max_items=max_items, conn=conn)
+    else:
+        raise SystemExit(f"Unknown task {task!r} (expected semantic or describe)")
+
+    print(f"{task}: processed {n} job(s); queue now {store.work_queue_stats(task, conn)}")
+    if task == "semantic" and scorer.gemini is not None:
+        print("Embedding cache:", scorer.gemini.cache.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Streaming bulk import/export for the Turso datastore (NDJSON or CSV).
+
+Export streams rows straight from the DB to a file in one pass, so it works
+as a full backup without loading a table into memory:
+
+    PYTHONPATH=src python src/bulk_io.py export backup.ndjson
+    PYTHONPATH=src python src/bulk_io.py export jobs.csv --table jobs
+
+A full-database NDJSON export writes one {"table": ..., "row": {...}} object
+per line; a single-table export (NDJSON or CSV) writes bare rows.
+
+Import writes in batched transactions (store.import_rows) and checkpoints its
+position, so a large import that dies halfway resumes where it stopped when
+re-run with the same arguments:
+
+    PYTHONPATH=src python src/bulk_io.py import backup.ndjson --mode replace
+    PYTHONPATH=src python src/bulk_io.py import jobs.csv --table jobs --mode fill
+
+--mode fill    insert new rows; fill only NULL/empty cells on existing ones
+--mode replace overwrite whole rows (INSERT OR REPLACE)
+
+CSV can't tell NULL from "", so empty CSV cells import as NULL. BLOB values
+(the stored embedding vectors) round-trip as {"$base64": "..."} -- the
+object in NDJSON, its JSON text in a CSV cell.
+"""
+
+import argparse
+import base64
+import csv
+import json
+import os
+import sys
+
+import store
+
+
+def _encode(value):
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"$base64": base64.b64encode(bytes(value)).decode("ascii")}
+    return value
+
+
+def _decode(value):
+    if isinstance(value, dict) and "$base64" in value:
+        return base64.b64decode(value["$base64"])
+    return value
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return json.dumps(_encode(value))
+    return value
+
+
+def _csv_value(cell):
+    if cell == "":
+        return None
+    if cell.startswith('{"$base64"'):
+        return _decode(json.loads(cell))
+    return cell
+
+
+def _detect_format(path, explicit):
+    if explicit:
+        return explicit
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
+
+
+# ----------------------------
+# Export
+# ----------------------------
+
+def export(path, fmt=None, table=None, conn=None):
+    """Stream one table (or the whole database) to `path`. Returns row count."""
+    conn = conn or store.get_connection()
+    fmt = _detect_format(path, fmt)
+    if fmt == "csv" and not table:
+        raise SystemExit("CSV export needs --table (one table per file)")
+
+    tables = [table] if table else store.EXPORT_TABLES
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        if fmt == "csv":
+            writer = csv.DictWriter(fh, fieldnames=store.table_columns(table, conn))
+            writer.writeheader()
+            for row in store.iter_rows(table, conn=conn):
+                writer.writerow({k: _csv_cell(v) for k, v in row.items()})
+                count += 1
+            return count
+
+        for name in tables:
+            for row in store.iter_rows(name, conn=conn):
+                row = {k: _encode(v) for k, v in row.items()}
+                record = row if table else {"table": name, "row": row}
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+    return count
+
+
+# ----------------------------
+# Import
+# ----------------------------
+
+def _read_records(path, fmt, table):
+    """Yield (table, row) pairs from an NDJSON or CSV file, lazily."""
+    with open(path, "r", encoding="utf-8", newline="") as fh:
+        if fmt == "csv":
+            for row in csv.DictReader(fh):
+                yield table, {k: _csv_value(v) for k, v in row.items()}
+            return
+
+        for line_no, line in enumerate(fh, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            obj = json.loads(line)
+            if "table" in obj and "row" in obj and isinstance(obj["row"], dict):
+                target, row = obj["table"], obj["row"]
+            elif table:
+                target, row = table, obj
+            else:
+                raise SystemExit(
+                    f"{path}:{line_no}: bare row without --table "
+                    "(only full-database exports carry a table per line)"
+                )
+            if table and target != table:
+                continue
+            yield target, {k: _decode(v) for k, v in row.items()}
+
+
+def import_file(path, fmt=None, table=None, mode="fill", batch_size=None, conn=None):
+    conn = conn or store.get_connection()
+    fmt = _detect_format(path, fmt)
+    if fmt == "csv" and not table:
+        raise SystemExit("CSV import needs --table")
+
+    resume_key = f"bulk_import:{os.path.abspath(path)}:{table or '*'}:{mode}"
+    return store.import_rows(
+        _read_records(path, fmt, table),
+        mode=mode,
+        batch_size=batch_size or store.IMPORT_BATCH_SIZE,
+        resume_key=resume_key,
+        conn=conn,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export", help="stream rows to a file")
+    exp.add_argument("path")
+    exp.add_argument("--table", choices=store.EXPORT_TABLES)
+    exp.add_argument("--format", choices=["ndjson", "csv"])
+
+    imp = sub.add_parser("import", help="batched, resumable import from a file")
+    imp.add_argument("path")
+    imp.add_argument("--table", choices=store.EXPORT_TABLES)
+    imp.add_argument("--format", choices=["ndjson", "csv"])
+    imp.add_argument("--mode", choices=["fill", "replace"], default="fill")
+    imp.add_argument("--batch-size", type=int)
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        n = export(args.path, args.format, args.table)
+        print(f"Exported {n} row(s) to {args.path}")
+    else:
+        stats = import_file(args.path, args.format, args.table, args.mode, args.batch_size)
+        resumed = f" (resumed at record {stats['resumed_from']})" if stats["resumed_from"] else ""
+        print(f"Imported {stats['written']} row(s) from {args.path}{resumed}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
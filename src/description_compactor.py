@@ -0,0 +1,153 @@
+"""
+Shrinks a fetched posting description to the part worth embedding.
+
+description_fetcher returns up to MAX_DESCRIPTION_CHARS of page text with
+all whitespace collapsed -- for fallback pages that includes cookie
+banners, navigation and "share this job" links, and even clean JSON-LD
+descriptions spend much of their length on the company pitch, benefits
+and the EEO statement. None of that says anything about fit with a
+resume, but all of it is embedded (and paid for).
+
+compact_description():
+  1. splits the text into segments -- sentences, bullets, and known
+     section headings ending in a colon or opening a bullet list
+     ("Responsibilities:", "Benefits • ...", ...),
+  2. drops whole boilerplate sections (about us, benefits, compensation,
+     EEO / accommodations), legal and cookie-banner sentences wherever
+     they occur, and segments that are nothing but page chrome ("Sign in",
+     "Apply now", "Share this job", ...),
+  3. drops repeated segments,
+  4. fits the rest into COMPACT_MAX_TOKENS: responsibilities /
+     requirements segments first, then unsectioned text, kept in their
+     original order.
+
+Text that compacts to nothing is returned truncated rather than emptied.
+Stored descriptions are never compacted -- this only shapes what is sent
+to the embedding model (semantic_scoring.SemanticScorer).
+"""
+
+import re
+
+# Rough English average for Gemini's tokenizer; close enough for a budget.
+CHARS_PER_TOKEN = 4
+COMPACT_MAX_TOKENS = 600
+
+_KEEP, _DROP, _NEUTRAL = "keep", "drop", "neutral"
+
+# Section headings, matched at the start of a segment and only when followed
+# by a colon (or introducing a bullet list, which _segments rewrites to one):
+# otherwise "Legal Engineering is a team ..." or "Why Rust? We rewrote ..."
+# would switch sections. Case-sensitive on the first letter so ordinary
+# sentences ("benefits of the role: ...") don't either.
+_HEADINGS = [
+    (_KEEP, r"(?:Key |Main |Your |Primary )?Responsibilities"),
+    (_KEEP, r"What [Yy]ou(?:'|’)?ll [Dd]o|What [Yy]ou [Ww]ill [Dd]o|What [Yy]ou(?:'|’)ll [Bb]e [Dd]oing"),
+    (_KEEP, r"(?:Minimum |Basic |Preferred |Required |Desired )?(?:Qualifications|Requirements)"),
+    (_KEEP, r"What [Ww]e(?:'|’)re [Ll]ooking [Ff]or|Who [Yy]ou [Aa]re|You [Hh]ave|About [Yy]ou"),
+    (_KEEP, r"(?:Required |Preferred |Technical )?Skills(?: and| &) (?:Experience|Qualifications)|Skills"),
+    (_KEEP, r"About [Tt]he (?:Role|Position|Job|Team)|The Role|Your Role|Role Overview|Job Description|Overview"),
+    (_DROP, r"About [Uu]s|About [Tt]he [Cc]ompany|About [A-Z][\w&.\-]*(?: [A-Z][\w&.\-]*)?(?= ?:)|Who [Ww]e [Aa]re|Our (?:Culture|Mission|Story|Values)|Life [Aa]t \w+"),
+    (_DROP, r"(?:Benefits|Perks)(?: (?:and|&) (?:Perks|Benefits))?|What [Ww]e [Oo]ffer|Why [Jj]oin [Uu]s|Why [A-Z]\w+\??"),
+    (_DROP, r"(?:Compensation|Salary|Pay)(?: (?:and|&) Benefits| Range| Transparency)?"),
+    (_DROP, r"Equal (?:Employment )?Opportunity(?: Employer)?(?: Statement)?|EEO(?: Statement)?|Accommodations?|Diversity(?:,| and| &) Inclusion"),
+    (_DROP, r"(?:Privacy|Cookie)(?: Policy| Notice| Settings| Preferences)?|Legal|Disclaimer"),
+]
+_HEADING_RES = [
+    (kind, re.compile(rf"(?:{pattern})\s*:\s*"))
+    for kind, pattern in _HEADINGS
+]
+# Split points: before any heading (with its colon), after sentence ends,
+# around bullet characters.
+_HEADING_SPLIT_RE = re.compile(
+    r"\s+((?:" + "|".join(p for _, p in _HEADINGS) + r")\s*:)"
+)
+_LIST_HEADING_RE = re.compile(
+    r"(?:^|(?<=\s))((?:" + "|".join(p for _, p in _HEADINGS) + r"))\s*(?=[•·▪●◦])"
+)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?;])\s+(?=[\"'(A-Z0-9•·▪●◦])")
+_BULLET_SPLIT_RE = re.compile(r"\s*[•·▪●◦]\s*|\s+[-*]\s+(?=[A-Z])")
+
+# Boilerplate sentences, dropped wherever they occur: phrases that only turn
+# up in legal notices and cookie banners.
+_BOILERPLATE_RE = re.compile(
+    r"equal (?:employment )?opportunity|without regard to|regardless of (?:race|age|gender)"
+    r"|race, (?:color|colour)|sexual orientation|gender identity|protected veteran"
+    r"|reasonable accommodation|e-verify|affirmative action|pay transparency"
+    r"|we use cookies|(?:site|website) uses cookies|accept (?:all )?cookies|by clicking"
+    r"|our (?:privacy|cookie) (?:policy|notice)|all rights reserved|©"
+    r"|recruitment fraud|never ask (?:you )?for (?:payment|money)",
+    re.IGNORECASE,
+)
+# Page chrome: dropped only when it is the whole segment, so a duty like
+# "Build the login and sign up flows" is kept.
+_CHROME = (
+    r"(?:accept |reject |manage )?(?:all )?cookies?(?: policy| notice| settings| preferences)?"
+    r"|privacy(?: policy| notice| settings)?|terms (?:of use|of service|and conditions)"
+    r"|sign (?:in|up)(?: to apply)?|log ?in(?: to apply)?"
+    r"|apply(?: now| for this (?:job|position|role))?|share(?: this)? job|save(?: this)? job"
+    r"|back to (?:all )?jobs|(?:get |create (?:a )?)?job alerts?|similar jobs"
+    r"|skip to (?:main )?content|powered by(?: \S+){1,2}"
+)
+_CHROME_RE = re.compile(
+    rf"[\W_]*(?:{_CHROME})(?:[\W_]+(?:{_CHROME}))*[\W_]*", re.IGNORECASE
+)
+_SIGNATURE_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _segments(text: str) -> list:
+    out = []
+    text = _LIST_HEADING_RE.sub("\\1: ", text)
+    # Consuming the heading (not a lookahead) keeps "Minimum Qualifications:"
+    # from also splitting before "Qualifications:".
+    for part in _HEADING_SPLIT_RE.sub("\n\\1", text).split("\n"):
+        for sentence in _SENTENCE_SPLIT_RE.split(part):
+            out.extend(s.strip() for s in _BULLET_SPLIT_RE.split(sentence))
+    return [s for s in out if s]
+
+
+def _heading(segment: str):
+    """(kind, rest of the segment after the heading) or None."""
+    for kind, pattern in _HEADING_RES:
+        match = pattern.match(segment)
+        if match:
+            return kind, segment[match.end():].strip()
+    return None
+
+
+def compact_description(text: str, max_tokens: int = COMPACT_MAX_TOKENS) -> str:
+    """`text` with boilerplate sections/sentences and repeats removed, fitted
+    to `max_tokens` (see module docstring). "" stays ""."""
+    text = " ".join((text or "").split())  # also guarantees no "\n" for _segments
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if not text:
+        return ""
+
+    section = _NEUTRAL
+    kept = []  # (priority, index, segment)
+    seen = set()
+    for segment in _segments(text):
+        heading = _heading(segment)
+        if heading is not None:
+            section, segment = heading
+            if not segment:
+                continue
+        if section == _DROP or _BOILERPLATE_RE.search(segment) or _CHROME_RE.fullmatch(segment):
+            continue
+        signature = _SIGNATURE_RE.sub(" ", segment.lower()).strip()
+        if not signature or signature in seen:
+            continue
+        seen.add(signature)
+        kept.append((0 if section == _KEEP else 1, len(kept), segment))
+
+    if not kept:
+        return text[:max_chars]
+
+    chosen, size = [], 0
+    for priority, index, segment in sorted(kept):
+        if size + len(segment) + 1 > max_chars:
+            if not chosen:
+                chosen.append((index, segment[:max_chars]))
+            continue
+        chosen.append((index, segment))
+        size += len(segment) + 1
+    return " ".join(segment for _, segment in sorted(chosen))
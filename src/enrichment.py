@@ -0,0 +1,87 @@
+"""
+CPU-bound per-description enrichment for the ingestion runners: feature
+extraction, the start-date gate and the resume-match boost, which are pure
+regex work over up to 6000 chars per job. Run serially they keep one core
+busy while the rest idle; enrich_descriptions() fans them out over a
+process pool in chunks and returns exactly what the serial path would, in
+input order.
+
+Descriptions are fetched (I/O) before this stage and semantic scoring
+(API calls) happens after it -- neither belongs in a process pool.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+import scoring
+
+# Below this many jobs, pool start-up costs more than it saves.
+PARALLEL_MIN_JOBS = 64
+# Jobs per task sent to a worker. Each item is a ~6KB description, so small
+# chunks are dominated by pickling/IPC overhead; see _chunk_size.
+MIN_CHUNK_SIZE = 16
+
+
+def enrich_one(title: str, description: str, min_start_date=None, resume_skill_set=None) -> dict:
+    """
+    The description-dependent signals for one job, all from one
+    scoring.extract_features() pass:
+
+      passes_start_date -- scoring.passes_start_date_filter (True when no
+                           min_start_date is configured)
+      resume_boost      -- scoring.resume_match_boost over title + description
+      features          -- the extract_features() dict, for store.upsert_jobs
+    """
+    features = scoring.extract_features(title, description)
+    return {
+        "passes_start_date": (
+            scoring.timing_passes(features, min_start_date) if min_start_date else True
+        ),
+        "resume_boost": scoring.skill_boost(resume_skill_set, features["skill_hits"]),
+        "features": features,
+    }
+
+
+def _enrich_chunk(chunk, min_start_date, resume_skill_set):
+    return [enrich_one(title, description, min_start_date, resume_skill_set) for title, description in chunk]
+
+
+def _chunk_size(n_items, workers):
+    # ~4 chunks per worker keeps the pool balanced without paying per-item IPC.
+    return max(MIN_CHUNK_SIZE, n_items // (workers * 4) or 1)
+
+
+def enrich_descriptions(items, min_start_date=None, resume_skill_set=None, workers=None) -> list:
+    """
+    enrich_one() for every (title, description) pair in `items`, in order.
+
+    Uses a fork-based process pool when there's enough work and more than
+    one core; otherwise (or if the pool can't start) runs serially. Fork is
+    required: the runners are module-level scripts, and spawn/forkserver
+    workers would re-execute them on import.
+    """
+    items = list(items)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, max(1, len(items) // MIN_CHUNK_SIZE))
+
+    if (
+        workers <= 1
+        or len(items) < PARALLEL_MIN_JOBS
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        return _enrich_chunk(items, min_start_date, resume_skill_set)
+
+    size = _chunk_size(len(items), workers)
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as pool:
+            results = pool.map(_enrich_chunk, chunks, repeat(min_start_date), repeat(resume_skill_set))
+            return [info for chunk in results for info in chunk]
+    except (OSError, BrokenProcessPool) as e:
+        print(f"Parallel enrichment unavailable ({e}); running serially")
+        return _enrich_chunk(items, min_start_date, resume_skill_set)
@@ -0,0 +1,197 @@
+"""
+Columnar snapshot export: writes jobs, status_events and email_matches to
+Hive-partitioned Parquet so analytics ("which boards yield interviews",
+"score distribution by source") run offline on files instead of as row-by-row
+SQL against the live database.
+
+Layout under the output directory:
+
+    jobs/source=<source>/month=<YYYY-MM of date_found>/part-<stamp>-<n>.parquet
+    status_events/source=<source>/month=<YYYY-MM of created_at>/part-...
+    email_matches/month=<YYYY-MM of processed_at>/part-...
+    _watermarks.json
+
+Incremental: each table has a watermark column (jobs.last_updated,
+status_events.created_at, email_matches.processed_at). A run exports only
+rows past the watermark recorded in _watermarks.json, then advances it, so
+the first run is a full snapshot and later runs are cheap deltas. Those
+columns are ISO-8601 UTC timestamps, so string comparison is chronological.
+
+Because jobs rows are mutable, a re-exported job lands in a new part file
+next to its older copy -- readers should keep the latest last_updated per
+job_id, e.g.:
+
+    df = pd.read_parquet("snapshots/jobs")
+    df = df.sort_values("last_updated").drop_duplicates("job_id", keep="last")
+
+status_events is append-only and email_matches is keyed by email_id, so the
+same rule (latest per key) applies there too.
+
+Run: PYTHONPATH=src python src/export_parquet.py [out_dir] [--full]
+"""
+
+import json
+import os
+import re
+import sys
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import store
+
+DEFAULT_OUT_DIR = "snapshots"
+WATERMARK_FILE = "_watermarks.json"
+# Rows buffered per part file write; bounds memory on the first full export.
+CHUNK_ROWS = 5000
+
+# table -> (watermark column, partition columns, month source column)
+EXPORTS = {
+    "jobs": ("last_updated", ["source"], "date_found"),
+    "status_events": ("created_at", ["source"], "created_at"),
+    "email_matches": ("processed_at", [], "processed_at"),
+}
+
+_ARROW_TYPES = {
+    "INTEGER": pa.int64(),
+    "REAL": pa.float64(),
+    "BLOB": pa.binary(),
+}
+
+
+def _arrow_schema(table, conn):
+    """Arrow schema from the declared SQLite column types (TEXT by default)."""
+    fields = []
+    for _, name, decl, *_ in conn.execute(f'PRAGMA table_info("{table}")').fetchall():
+        fields.append(pa.field(name, _ARROW_TYPES.get((decl or "").upper(), pa.string())))
+    return pa.schema(fields)
+
+
+def _coerce(value, arrow_type):
+    """SQLite is loosely typed (legacy sheet rows hold '' in INTEGER columns);
+    coerce each value to the column's Arrow type, or None if it won't fit."""
+    if value is None or value == "":
+        return None
+    try:
+        if pa.types.is_integer(arrow_type):
+            return int(float(value))
+        if pa.types.is_floating(arrow_type):
+            return float(value)
+        if pa.types.is_binary(arrow_type):
+            return bytes(value) if not isinstance(value, str) else value.encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    return str(value)
+
+
+def _partition_value(value):
+    value = str(value or "").strip() or "unknown"
+    return re.sub(r"[^\w.\-]+", "_", value)
+
+
+def _month(value):
+    value = str(value or "")
+    return value[:7] if re.match(r"^\d{4}-\d{2}", value) else "unknown"
+
+
+def _load_watermarks(out_dir):
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_watermarks(out_dir, marks):
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(marks, fh, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def export_table(table, out_dir, watermark=None, conn=None, stamp=None):
+    """
+    Export rows of `table` newer than `watermark`. Returns (rows_written,
+    new_watermark); the watermark is unchanged when nothing was exported.
+    """
+    conn = conn or store.get_connection()
+    mark_col, part_cols, month_col = EXPORTS[table]
+    schema = _arrow_schema(table, conn)
+    if not len(schema):
+        return 0, watermark
+    types = {f.name: f.type for f in schema}
+    # Partition columns live in the directory names (Hive style), not in the
+    # files, so readers don't see two conflicting copies of e.g. `source`.
+    file_schema = pa.schema([f for f in schema if f.name not in part_cols])
+    stamp = stamp or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+
+    where, params = None, ()
+    if watermark:
+        where, params = f'"{mark_col}" > ?', (watermark,)
+
+    written = 0
+    part_no = 0
+    newest = watermark
+    buffer = []
+
+    def flush():
+        nonlocal part_no
+        partitions = {}
+        for row in buffer:
+            key = tuple(_partition_value(row.get(c)) for c in part_cols) + (
+                _month(row.get(month_col)),
+            )
+            partitions.setdefault(key, []).append(row)
+        for key, rows in partitions.items():
+            segments = [f"{c}={v}" for c, v in zip(part_cols + ["month"], key)]
+            directory = os.path.join(out_dir, table, *segments)
+            os.makedirs(directory, exist_ok=True)
+            columns = {
+                name: [_coerce(r.get(name), types[name]) for r in rows]
+                for name in file_schema.names
+            }
+            pq.write_table(
+                pa.table(columns, schema=file_schema),
+                os.path.join(directory, f"part-{stamp}-{part_no}.parquet"),
+                compression="zstd",
+            )
+            part_no += 1
+        buffer.clear()
+
+    for row in store.iter_rows(table, conn=conn, where=where, params=params):
+        buffer.append(row)
+        value = row.get(mark_col)
+        if value and (newest is None or str(value) > newest):
+            newest = str(value)
+        written += 1
+        if len(buffer) >= CHUNK_ROWS:
+            flush()
+    if buffer:
+        flush()
+    return written, newest
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    out_dir = args[0] if args else DEFAULT_OUT_DIR
+    full = "--full" in sys.argv
+    os.makedirs(out_dir, exist_ok=True)
+
+    conn = store.get_connection()
+    marks = {} if full else _load_watermarks(out_dir)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+
+    for table in EXPORTS:
+        count, newest = export_table(table, out_dir, marks.get(table), conn, stamp)
+        if newest:
+            marks[table] = newest
+        # Persist after each table so a crash doesn't re-export finished ones.
+        _save_watermarks(out_dir, marks)
+        print(f"{table}: exported {count} row(s) (watermark {marks.get(table) or '-'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Settings-derived candidate filters, compiled once per run and shared by every
+scraper.
+
+Each scraper used to re-read `self.settings` for every candidate and rebuild
+the same checks (`any(rt in title for rt in required_types)`, the us_only /
+remote_allowed branches, the age parse). A FilterPlan holds all of that
+pre-resolved -- keyword lists as compiled alternations, the location and
+remote gates as flags, the age cutoff as an int -- and evaluates a candidate
+in one call (FilterPlan.passes) or a whole result frame at once
+(FilterPlan.mask).
+
+Sources differ in WHICH gates apply (see each scraper's FILTER_RULES):
+
+  title_terms    -- required_job_type + keywords must each have a substring
+                    hit in the title (internship pipeline only)
+  age_gate       -- drop "Nmo" ages and ages past max_days_back
+  entry_gate     -- "entry": entry_level_only keeps scoring.is_new_grad_or_entry
+                    jobs; "not_senior": it only drops scoring.has_senior_title
+                    ones; None: ignored
+  exclude_canada -- us_only also drops locations mentioning Canada outright
+
+    plan = filter_plan.for_settings(settings, {"entry_gate": "entry"})
+    if plan.passes(title, location, description, is_remote=...):
+        ...
+
+Plans are immutable. for_settings caches by the settings dict's identity,
+so a settings dict must not be mutated once scraping starts -- build a new
+one instead (compile_plan always reads the current values).
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Pattern
+
+import scoring
+
+_AGE_DAYS_RE = re.compile(r"(\d+)")
+
+ENTRY_GATES = (None, "entry", "not_senior")
+
+# The entry_gate each stored job's source was ingested under (its scraper's
+# FILTER_RULES; JobSpy rows are stored under the board they came from), for
+# re-applying entry_level_only to stored jobs (store.entry_level_filter_sql).
+# Sources not listed -- simplify_github -- have no entry gate.
+SOURCE_ENTRY_GATES = {
+    "linkedin": "entry", "indeed": "entry", "glassdoor": "entry",
+    "zip_recruiter": "entry", "google": "entry", "jobspy": "entry",
+    "google_search": "entry",
+    "new_grad_github": "not_senior",
+}
+
+
+def _substring_alternation(terms) -> Optional[Pattern]:
+    """One regex matching wherever any of `terms` occurs (None if no terms):
+    .search() is True exactly when `any(t in text for t in terms)`."""
+    if not terms:
+        return None
+    return re.compile("|".join(re.escape(t) for t in dict.fromkeys(terms)))
+
+
+@dataclass(frozen=True)
+class FilterPlan:
+    """Immutable, precompiled form of the filter settings for one source."""
+
+    required_types: Optional[Pattern] = None
+    keywords: Optional[Pattern] = None
+    age_gate: bool = False
+    max_days_back: int = 999
+    entry_gate: Optional[str] = None
+    us_only: bool = False
+    exclude_canada: bool = False
+    remote_allowed: bool = True
+
+    def passes(self, title: str, location: str, description: str = "",
+               is_remote: bool = False, age: str = "") -> bool:
+        """True if one candidate survives every gate this plan applies."""
+        if self.age_gate:
+            if "mo" in age:
+                return False
+            match = _AGE_DAYS_RE.search(age)
+            if match and int(match.group(1)) > self.max_days_back:
+                return False
+
+        if self.required_types is not None or self.keywords is not None:
+            title_lower = title.lower()
+            if self.required_types is not None and not self.required_types.search(title_lower):
+                return False
+            if self.keywords is not None and not self.keywords.search(title_lower):
+                return False
+
+        location = location.lower()
+        if not self.remote_allowed and (is_remote or "remote" in location):
+            return False
+
+        if self.us_only:
+            if self.exclude_canada and "canada" in location:
+                return False
+            if not scoring.is_us_location(location):
+                return False
+
+        if self.entry_gate == "entry":
+            return scoring.is_new_grad_or_entry(title, description)
+        if self.entry_gate == "not_senior":
+            return not scoring.has_senior_title(title)
+        return True
+
+    def mask(self, titles, locations, descriptions=None, is_remote=None, ages=None):
+        """
+        passes() over aligned pandas Series, as a boolean Series on the same
+        index -- built from scoring's batch functions, so a frame is filtered
+        without a per-row Python call for the cached checks.
+        """
+        import pandas as pd
+
+        keep = pd.Series(True, index=titles.index)
+        if self.age_gate and ages is not None:
+            days = ages.str.extract(_AGE_DAYS_RE, expand=False)
+            too_old = days.notna() & (pd.to_numeric(days, errors="coerce") > self.max_days_back)
+            keep &= ~(ages.str.contains("mo", regex=False) | too_old)
+
+        if self.required_types is not None or self.keywords is not None:
+            title_lower = titles.str.lower()
+            if self.required_types is not None:
+                keep &= title_lower.str.contains(self.required_types)
+            if self.keywords is not None:
+                keep &= title_lower.str.contains(self.keywords)
+
+        loc_lower = locations.str.lower()
+        if not self.remote_allowed:
+            remote = loc_lower.str.contains("remote", regex=False)
+            if is_remote is not None:
+                remote |= is_remote.astype(bool)
+            keep &= ~remote
+
+        if self.us_only:
+            if self.exclude_canada:
+                keep &= ~loc_lower.str.contains("canada", regex=False)
+            keep &= scoring.us_location_mask(loc_lower)
+
+        if self.entry_gate == "entry":
+            if descriptions is None:
+                descriptions = pd.Series("", index=titles.index)
+            keep &= scoring.new_grad_or_entry_mask(titles, descriptions)
+        elif self.entry_gate == "not_senior":
+            keep &= ~titles.map(scoring.has_senior_title).astype(bool)
+        return keep
+
+
+@lru_cache(maxsize=64)
+def _compile(required_types, keywords, max_days_back, entry_level_only, us_only,
+             remote_allowed, title_terms, age_gate, entry_gate, exclude_canada):
+    return FilterPlan(
+        required_types=_substring_alternation(required_types) if title_terms else None,
+        keywords=_substring_alternation(keywords) if title_terms else None,
+        age_gate=age_gate,
+        max_days_back=max_days_back,
+        entry_gate=entry_gate if entry_level_only else None,
+        us_only=us_only,
+        exclude_canada=exclude_canada,
+        remote_allowed=remote_allowed,
+    )
+
+
+def compile_plan(settings: dict, title_terms: bool = False, age_gate: bool = False,
+                 entry_gate: str = None, exclude_canada: bool = False) -> FilterPlan:
+    """
+    The FilterPlan for `settings` (settings_reader._normalize_settings
+    output) under one source's rules. Compiled plans are memoized on the
+    setting values, so every scraper in a run shares the same regexes.
+    """
+    if entry_gate not in ENTRY_GATES:
+        raise ValueError(f"entry_gate must be one of {ENTRY_GATES}, got {entry_gate!r}")
+    return _compile(
+        tuple(settings.get("required_job_type") or ()),
+        tuple(settings.get("keywords") or ()),
+        settings.get("max_days_back", 999),
+        bool(settings.get("entry_level_only")),
+        bool(settings.get("us_only")),
+        bool(settings.get("remote_allowed")),
+        title_terms, age_gate, entry_gate, exclude_canada,
+    )
+
+
+_BY_SETTINGS = {}
+
+
+def for_settings(settings: dict, rules: dict) -> FilterPlan:
+    """
+    compile_plan(settings, **rules), keyed on the identity of both dicts so
+    repeat calls with a scraper's settings and its FILTER_RULES skip even
+    the key build -- cheap enough to call per candidate.
+    """
+    key = (id(settings), id(rules))
+    cached = _BY_SETTINGS.get(key)
+    if cached is not None and cached[0] is settings and cached[1] is rules:
+        return cached[2]
+    plan = compile_plan(settings, **rules)
+    if len(_BY_SETTINGS) > 64:
+        _BY_SETTINGS.clear()
+    # Holding both dicts keeps their ids from being reused by other objects.
+    _BY_SETTINGS[key] = (settings, rules, plan)
+    return plan
@@ -1,6 +1,8 @@
 """
 One-shot schema initializer. Applies schema.sql to the configured libSQL
-database (idempotent). Run: PYTHONPATH=src python src/init_db.py
+database (idempotent). store.get_connection() also does this on a process's
+first connection, so runners keep an older database migrated on their own.
+Run: PYTHONPATH=src python src/init_db.py
 """
 
 import store
@@ -0,0 +1,220 @@
+"""
+Stored job embeddings and the in-memory index that answers "jobs like this
+one" without any API call.
+
+Every Gemini embedding a job is scored from is kept in job_embeddings
+(store.put_job_embeddings), unit-normalized and quantized to int8 with one
+float scale per row -- 768 bytes for a 768-dim vector, 3 KB for the default
+3072, a quarter of float32. Cosine similarity doesn't depend on the scale,
+so the index compares the int8 rows directly and only needs each row's
+norm.
+
+    index = JobIndex(conn)
+    index.similar("job-id", k=10)      # [(job_id, similarity), ...]
+
+store.similar_jobs() keeps one JobIndex per connection and refreshes it
+incrementally: every write to job_embeddings takes the next seq, and a
+refresh reads only rows above the last seq it saw, so a query against an
+already-loaded index costs one matrix-vector product.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from semantic_scoring import EMBEDDING_MODEL
+
+QUANT_DTYPE = np.dtype("i1")
+QUANT_LEVELS = 127
+
+
+def quantize_vector(values):
+    """(scale, int8 blob) for `values` unit-normalized; None for an empty or
+    zero vector. scale * int8 values reconstructs the unit vector."""
+    vector = np.asarray(values, dtype=np.float32)
+    norm = float(np.linalg.norm(vector)) if vector.size else 0.0
+    if norm == 0 or not np.isfinite(norm):
+        return None
+    unit = vector / norm
+    peak = float(np.max(np.abs(unit)))
+    scale = peak / QUANT_LEVELS
+    quantized = np.clip(np.rint(unit / scale), -QUANT_LEVELS, QUANT_LEVELS).astype(QUANT_DTYPE)
+    return scale, quantized.tobytes()
+
+
+def dequantize_vector(blob: bytes, scale: float) -> np.ndarray:
+    return np.frombuffer(blob, dtype=QUANT_DTYPE).astype(np.float32) * np.float32(scale)
+
+
+def embedding_rows(job_ids, embeddings, model: str = EMBEDDING_MODEL) -> list:
+    """store.put_job_embeddings rows for the (job_id, embedding) pairs that
+    have an embedding."""
+    rows = []
+    for job_id, values in zip(job_ids, embeddings):
+        if job_id and values is not None and len(values):
+            packed = quantize_vector(values)
+            if packed is not None:
+                rows.append((job_id, model, len(values), packed[0], packed[1]))
+    return rows
+
+
+class JobIndex:
+    """
+    All stored embeddings for one model, as an int8 matrix plus row norms,
+    kept in step with job_embeddings by refresh().
+    """
+
+    def __init__(self, conn=None, model: str = EMBEDDING_MODEL):
+        self.conn = conn
+        self.model = model
+        self.dims = None
+        self._ids = []
+        self._pos = {}
+        self._rows = np.zeros((0, 0), dtype=QUANT_DTYPE)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._seen = None
+        self._dead = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids) - self._dead
+
+    @property
+    def ids(self) -> list:
+        """Job_ids in row order (aligned with similarities(); a dropped
+        job's row stays, with a NaN similarity)."""
+        return list(self._ids)
+
+    def refresh(self) -> int:
+        """Apply rows written since the last refresh. Returns how many. A job
+        re-embedded under another model or size (job_embeddings keeps one
+        row per job) is dropped from the index."""
+        import store
+
+        with self._lock:
+            if self._seen is None:
+                # Everything up to this seq is in the read below; later
+                # writes are picked up by the next refresh.
+                self._seen = store.job_embeddings_seq(conn=self.conn)
+                rows = store.iter_job_embeddings(self.model, conn=self.conn)
+            else:
+                rows = store.iter_job_embeddings(since=self._seen, conn=self.conn)
+            latest = {}
+            for job_id, model, dims, blob, seq in rows:
+                self._seen = max(self._seen, seq)
+                latest[job_id] = (model, dims, blob)
+            loaded = 0
+            new_ids, new_blobs = [], []
+            for job_id, (model, dims, blob) in latest.items():
+                if self.dims is None and model == self.model:
+                    self.dims = dims
+                pos = self._pos.get(job_id)
+                if model != self.model or dims != self.dims:
+                    if pos is not None:
+                        self._drop(pos, job_id)
+                    continue
+                if pos is None:
+                    self._pos[job_id] = len(self._ids) + len(new_ids)
+                    new_ids.append(job_id)
+                    new_blobs.append(blob)
+                else:
+                    vector = np.frombuffer(blob, dtype=QUANT_DTYPE)
+                    self._rows[pos] = vector
+                    self._norms[pos] = np.linalg.norm(vector.astype(np.float32))
+                loaded += 1
+            if new_ids:
+                block = np.frombuffer(b"".join(new_blobs), dtype=QUANT_DTYPE).reshape(-1, self.dims)
+                norms = np.sqrt(np.einsum("ij,ij->i", block, block, dtype=np.float32))
+                self._rows = block.copy() if not self._ids else np.vstack([self._rows, block])
+                self._norms = np.concatenate([self._norms, norms])
+                self._ids.extend(new_ids)
+            return loaded
+
+    def _drop(self, pos, job_id):
+        """Retire row `pos`: a zero norm makes its similarity NaN, so it is
+        never returned, and a later embedding of the job gets a new row."""
+        self._rows[pos] = 0
+        self._norms[pos] = 0
+        del self._pos[job_id]
+        self._dead += 1
+
+    def vector(self, job_id):
+        """The stored (dequantized-direction) vector for `job_id`, or None."""
+        pos = self._pos.get(job_id)
+        return None if pos is None else self._rows[pos].astype(np.float32)
+
+    def similarities(self, query) -> np.ndarray:
+        """Cosine similarity of `query` to every indexed row (NaN for zero rows)."""
+        query = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        sims = np.full(len(self._ids), np.nan, dtype=np.float32)
+        if not len(self._ids) or norm == 0 or query.shape != (self.dims,):
+            return sims
+        # einsum casts the int8 rows through a small buffer as it goes, so
+        # no float32 copy of the matrix is ever made.
+        sims = np.einsum("ij,j->i", self._rows, query / norm)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self._norms > 0, sims / self._norms, np.nan)
+
+    def top_k(self, query, k: int = 10, exclude=()) -> list:
+        """[(job_id, similarity)] for the `k` rows most similar to `query`,
+        best first, skipping ids in `exclude`."""
+        sims = self.similarities(query)
+        sims = np.where(np.isnan(sims), -np.inf, sims)
+        for job_id in exclude:
+            pos = self._pos.get(job_id)
+            if pos is not None:
+                sims[pos] = -np.inf
+        k = min(k, int(np.isfinite(sims).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top], kind="stable")]
+        return [(self._ids[i], float(sims[i])) for i in top]
+
+    def similar(self, job_id, k: int = 10, exclude=()) -> list:
+        """top_k() around a stored job's own embedding (excluding itself);
+        [] if the job has none."""
+        query = self.vector(job_id)
+        if query is None:
+            return []
+        return self.top_k(query, k, exclude={job_id, *exclude})
+
+
+# Loaded indexes, most recently used last. Each holds its connection, so the
+# cache is bounded rather than keeping every connection ever queried alive.
+INDEX_CACHE_SIZE = 4
+_INDEXES = OrderedDict()
+_SHARED_CONNECTIONS = {}
+_cache_lock = threading.Lock()
+
+
+def shared_connection():
+    """One process-wide connection to the configured database, so callers
+    without a connection of their own share a single loaded index."""
+    import store
+
+    url = os.environ.get("TURSO_DATABASE_URL")
+    with _cache_lock:
+        conn = _SHARED_CONNECTIONS.get(url)
+        if conn is None:
+            conn = _SHARED_CONNECTIONS[url] = store.get_connection()
+    return conn
+
+
+def index_for(conn=None, model: str = EMBEDDING_MODEL) -> JobIndex:
+    """The shared, freshly refreshed JobIndex for `conn` (shared_connection()
+    when None) and `model`."""
+    conn = conn or shared_connection()
+    key = (id(conn), model)
+    with _cache_lock:
+        index = _INDEXES.get(key)
+        if index is None or index.conn is not conn:
+            index = _INDEXES[key] = JobIndex(conn, model)
+        _INDEXES.move_to_end(key)
+        while len(_INDEXES) > INDEX_CACHE_SIZE:
+            _INDEXES.popitem(last=False)
+    index.refresh()
+    return index
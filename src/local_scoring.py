@@ -0,0 +1,137 @@
+"""
+Offline resume/description similarity: a hashing-vectorizer cosine computed
+with NumPy, no network and no API key. It stands in for the Gemini
+embeddings when they're unavailable (see semantic_scoring.build_scorer), so
+jobs still get a resume-based score instead of sitting keyword-only.
+
+Text is lower-cased and split into word tokens (keeping "c++", "c#",
+"node.js"); stopwords are dropped. Each distinct token is hashed (crc32, so
+the mapping is stable across processes and runs) into one of LOCAL_DIMS
+buckets with a +/-1 sign, weighted 1 + log(count). No IDF: a score must not
+depend on which other descriptions happen to be in the same batch.
+
+This is a bag-of-words match -- it rewards shared vocabulary, not meaning --
+so its scores are calibrated onto roughly the Gemini score range but are not
+interchangeable with them. Jobs scored here are tagged
+semantic_scored = SEMANTIC_LOCAL and are re-scored with Gemini once it is
+available again (backfill_worker.py).
+"""
+
+import re
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from semantic_scoring import DEFAULT_RESUME_PATH, SEMANTIC_LOCAL, load_resume
+
+LOCAL_DIMS = 1 << 18
+# Cosine -> 0-100: LOCAL_SIMILARITY_FLOOR and below map to 50 (where Gemini
+# puts unrelated text), LOCAL_SIMILARITY_CEILING and above to 100. Hashed
+# bag-of-words cosines between a resume and a posting in the same field
+# mostly land between 0.1 and 0.4.
+LOCAL_SIMILARITY_FLOOR = 0.0
+LOCAL_SIMILARITY_CEILING = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9]*(?:[+#]+|\.js\b|\.net\b)?")
+
+_STOPWORDS = frozenset("""
+a about above after all also am an and any are as at be been being below both
+but by can could did do does doing during each few for from further had has
+have having he her here hers him his how i if in into is it its itself just me
+more most my no nor not now of off on once only or other our ours out over own
+same she should so some such than that the their theirs them then there these
+they this those through to too under until up very was we were what when where
+which while who whom why will with would you your yours
+able across work working role team teams job jobs candidate candidates
+including etc e g ie eg per via well within without must may us new
+""".split())
+
+
+def tokenize(text: str) -> list:
+    """Lower-cased word tokens of `text`, stopwords removed."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+@lru_cache(maxsize=65536)
+def _bucket(token: str):
+    h = zlib.crc32(token.encode("utf-8"))
+    return h % LOCAL_DIMS, 1.0 if (h >> 31) & 1 else -1.0
+
+
+def hashed_features(text: str):
+    """
+    (indices, weights) of `text`'s sparse hashed vector: unique bucket
+    indices and their summed signed 1 + log(count) weights. Empty arrays
+    when the text has no tokens.
+    """
+    counts = {}
+    for token in tokenize(text or ""):
+        counts[token] = counts.get(token, 0) + 1
+    if not counts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    buckets = [_bucket(t) for t in counts]
+    idx = np.fromiter((b[0] for b in buckets), dtype=np.int64, count=len(buckets))
+    weights = np.fromiter(
+        (sign * (1.0 + np.log(n)) for (_, sign), n in zip(buckets, counts.values())),
+        dtype=np.float64, count=len(buckets),
+    )
+    # Colliding tokens share a bucket: sum them.
+    unique, inverse = np.unique(idx, return_inverse=True)
+    return unique, np.bincount(inverse, weights=weights)
+
+
+def similarity_to_score(similarity: float) -> int:
+    span = LOCAL_SIMILARITY_CEILING - LOCAL_SIMILARITY_FLOOR
+    scaled = (similarity - LOCAL_SIMILARITY_FLOOR) / span
+    return round(50 + 50 * max(0.0, min(1.0, scaled)))
+
+
+class LocalScorer:
+    """
+    Same interface as semantic_scoring.SemanticScorer (available, score,
+    score_many), with the resume's hashed vector built once, densely, so each
+    job costs one sparse gather-and-dot.
+    """
+
+    engine = SEMANTIC_LOCAL
+    unavailable_reason = None
+
+    def __init__(self, resume_path: str = DEFAULT_RESUME_PATH, resume_text: str = None):
+        self.resume_text = resume_text if resume_text is not None else load_resume(resume_path)
+        self._resume_dense = None
+
+    @property
+    def available(self) -> bool:
+        return bool(self.resume_text)
+
+    def _get_resume_dense(self):
+        if self._resume_dense is None:
+            idx, weights = hashed_features(self.resume_text)
+            norm = np.sqrt(weights @ weights)
+            dense = np.zeros(LOCAL_DIMS, dtype=np.float64)
+            if norm > 0:
+                dense[idx] = weights / norm
+            self._resume_dense = dense
+        return self._resume_dense
+
+    def score(self, job_description: str):
+        """A similarity score in [0, 100], or None (no resume / empty text)."""
+        return self.score_many([job_description])[0]
+
+    def score_many(self, job_descriptions) -> list:
+        job_descriptions = list(job_descriptions)
+        scores = [None] * len(job_descriptions)
+        if not self.available:
+            return scores
+        resume = self._get_resume_dense()
+        if not resume.any():
+            return scores
+        for i, text in enumerate(job_descriptions):
+            if not text:
+                continue
+            idx, weights = hashed_features(text)
+            norm = np.sqrt(weights @ weights)
+            if norm > 0:
+                scores[i] = similarity_to_score(float(resume[idx] @ weights) / norm)
+        return scores
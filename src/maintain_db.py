@@ -0,0 +1,64 @@
+"""
+Scheduled database upkeep: refresh planner statistics, reclaim free pages,
+run an integrity check and print a per-table / per-index size report (see
+store.maintain). Bounded in run time and safe to run while the scraper or
+dashboard is using the database.
+
+Exits non-zero if the integrity check reports problems, so a scheduled run
+surfaces corruption instead of silently passing.
+
+Run: PYTHONPATH=src python src/maintain_db.py [--full-integrity] [--enable-incremental-vacuum]
+"""
+
+import sys
+
+import store
+
+
+def _fmt_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def main():
+    report = store.maintain(
+        full_integrity="--full-integrity" in sys.argv,
+        enable_incremental_vacuum="--enable-incremental-vacuum" in sys.argv,
+    )
+    steps = report["steps"]
+
+    for step in ("optimize", "incremental_vacuum", "integrity"):
+        if step in steps:
+            print(f"{step}: {steps[step]}")
+    if report["skipped"]:
+        print("Skipped (time budget):", ", ".join(report["skipped"]))
+
+    print(
+        f"Free pages: {report['freelist_before']} -> {report['freelist_after']} "
+        f"(page_size={report['page_size']}, page_count={report['page_count']})"
+    )
+
+    sizes = steps.get("sizes")
+    if isinstance(sizes, dict):
+        print("Sizes:")
+        for name, info in sorted(
+            sizes.items(), key=lambda kv: (kv[1]["table"], kv[1]["type"] != "table", kv[0])
+        ):
+            rows = f", {info['rows']} rows" if info["rows"] is not None else ""
+            indent = "  " if info["type"] == "table" else "    "
+            print(f"{indent}{name} [{info['type']}]: {_fmt_bytes(info['bytes'])}{rows}")
+    elif sizes:
+        print(f"sizes: {sizes}")
+
+    print(f"Done in {report['elapsed']}s")
+
+    if steps.get("integrity") not in (None, "ok") and not str(steps["integrity"]).startswith("error"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
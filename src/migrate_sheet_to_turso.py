@@ -3,7 +3,8 @@ One-time migration: copy ALL current data from the Google Sheet into Turso.
 
 Moves every Jobs row (including user-owned columns: applied, date_applied,
 application_status, priority, notes), the Settings tab, and the Resume tab.
-Safe to re-run -- jobs are INSERT OR REPLACE by job_id, settings/resume upsert.
+Safe to re-run -- jobs are INSERT OR REPLACE by job_id (batched, and resumed
+from the last committed batch if a previous run failed), settings/resume upsert.
 
 Run: PYTHONPATH=src python src/migrate_sheet_to_turso.py
 
@@ -55,41 +56,42 @@ def migrate_jobs(conn):
             return ""
         return row[idx]
 
-    count = 0
-    for row in rows:
-        job_id = cell(row, "job_id")
-        if not job_id:
-            continue
-        applied = _is_true(cell(row, "applied"))
-        record = {
-            "job_id": job_id,
-            "job_title": cell(row, "job_title"),
-            "company": cell(row, "company"),
-            "location": cell(row, "location"),
-            "job_url": cell(row, "job_url"),
-            "source": cell(row, "source"),
-            "date_posted": cell(row, "date_posted"),
-            "date_found": cell(row, "date_found"),
-            "relevance_score": _int_or_none(cell(row, "relevance_score")),
-            "role_type": cell(row, "role_type"),
-            "confidence": _float_or_none(cell(row, "confidence")),
-            "semantic_scored": 1 if _is_true(cell(row, "semantic_scored")) else 0,
-            "archived": 1 if _is_true(cell(row, "archived")) else 0,
-            "last_updated": cell(row, "last_updated"),
-            "locked": 1 if _is_true(cell(row, "locked")) else 0,
-            "applied": 1 if applied else 0,
-            "date_applied": cell(row, "date_applied"),
-            "application_status": _norm_status(cell(row, "application_status"), applied),
-            "priority": cell(row, "priority"),
-            "notes": cell(row, "notes"),
-            "action_type": None,
-            "action_url": None,
-            "description_snippet": cell(row, "description_snippet"),
-        }
-        store.replace_job_full(record, conn)
-        count += 1
-    conn.commit()
-    return count, len(rows)
+    def records():
+        for row in rows:
+            job_id = cell(row, "job_id")
+            if not job_id:
+                continue
+            applied = _is_true(cell(row, "applied"))
+            yield "jobs", {
+                "job_id": job_id,
+                "job_title": cell(row, "job_title"),
+                "company": cell(row, "company"),
+                "location": cell(row, "location"),
+                "job_url": cell(row, "job_url"),
+                "source": cell(row, "source"),
+                "date_posted": cell(row, "date_posted"),
+                "date_found": cell(row, "date_found"),
+                "relevance_score": _int_or_none(cell(row, "relevance_score")),
+                "role_type": cell(row, "role_type"),
+                "confidence": _float_or_none(cell(row, "confidence")),
+                "semantic_scored": 1 if _is_true(cell(row, "semantic_scored")) else 0,
+                "archived": 1 if _is_true(cell(row, "archived")) else 0,
+                "last_updated": cell(row, "last_updated"),
+                "locked": 1 if _is_true(cell(row, "locked")) else 0,
+                "applied": 1 if applied else 0,
+                "date_applied": cell(row, "date_applied"),
+                "application_status": _norm_status(cell(row, "application_status"), applied),
+                "priority": cell(row, "priority"),
+                "notes": cell(row, "notes"),
+                "action_type": None,
+                "action_url": None,
+                "description_snippet": cell(row, "description_snippet"),
+            }
+
+    # Batched INSERT OR REPLACE with a checkpoint, so a migration that dies
+    # halfway (e.g. a dropped Turso connection) resumes instead of restarting.
+    stats = store.import_rows(records(), mode="replace", resume_key="migrate_sheet_jobs", conn=conn)
+    return stats["read"], len(rows)
 
 
 def migrate_settings(conn):
@@ -0,0 +1,101 @@
+"""
+Thread-safe request pacing for the API clients: a token-bucket limiter
+(steady rate + burst, plus a shared pause for 429 Retry-After) and a
+circuit breaker that tells every worker to stop once the API is clearly
+unavailable (credits depleted, bad key, repeated outages).
+
+    limiter = TokenBucket(rate=100 / 60, capacity=4)
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    if not breaker.open:
+        limiter.acquire()
+        ...              # request
+        breaker.record_success()   # or record_failure(reason) / trip(reason)
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    `rate` tokens per second, holding at most `capacity`. acquire() blocks
+    until a token is available; hold(seconds) makes every caller wait at
+    least that long (a 429's Retry-After applies to the whole client, not
+    just the request that got it).
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._held_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._held_until:
+                    wait = self._held_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def hold(self, seconds: float):
+        with self._lock:
+            until = self._clock() + seconds
+            if until > self._held_until:
+                self._held_until = until
+                # Nothing accrues during the pause.
+                self._tokens = 0.0
+                self._updated = until
+
+
+class CircuitBreaker:
+    """
+    Opens (for good -- callers build a new one per run) on trip(), or after
+    `failure_threshold` consecutive record_failure() calls. Once open, every
+    worker sharing it should stop sending requests.
+    """
+
+    def __init__(self, failure_threshold: int = 3):
+        self.failure_threshold = failure_threshold
+        self._failures = 0
+        self._reason = None
+        self._lock = threading.Lock()
+
+    @property
+    def open(self) -> bool:
+        return self._reason is not None
+
+    @property
+    def reason(self):
+        return self._reason
+
+    def trip(self, reason: str):
+        with self._lock:
+            if self._reason is None:
+                self._reason = reason
+                print(f"Circuit breaker open: {reason}")
+
+    def record_failure(self, reason: str):
+        with self._lock:
+            self._failures += 1
+            failures = self._failures
+        if failures >= self.failure_threshold:
+            self.trip(f"{failures} consecutive failures (last: {reason})")
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
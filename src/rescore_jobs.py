@@ -0,0 +1,293 @@
+"""
+Incremental rescoring: re-apply the current scoring rules to stored jobs
+whose scoring_version differs from scoring.rules_version(settings) -- after
+editing the keyword tables, title patterns, resume skills or the `keywords`
+setting -- without re-scraping or re-fetching anything.
+
+Each row is rebuilt from what the database already holds: the title's
+keywords, the entry-level bonus and the resume-match boost -- each only for
+the sources whose scraper/runner applies it -- with the bonus taken from the
+verdict stored in the row's features (the one ingestion scored with) and
+the boost from the stored description, else the features' skill hits. A
+stored semantic_score is re-blended, so resume-scored rows keep their
+semantic component. Rows with neither a description nor features (every
+JobSpy row the description pass didn't reach, and rows stored before
+features existed), and rows resume-scored before semantic_score was
+stored, can't be rebuilt -- their relevance_score/confidence (and
+semantic_score) are left as they are and only the title-derived columns
+are refreshed.
+
+Locked rows are skipped. Writes go out in batched transactions.
+
+--resume rescores every job against the current resume (store.get_resume)
+when its hash differs from the one last applied: the resume is embedded
+once, every stored job embedding (job_index) is compared against it in one
+vectorized pass, locally-scored rows with a stored description are re-run
+through local_scoring, and the blends and resume-match boosts are rebuilt
+from those. No page fetches, and no job is re-embedded. --force reruns it
+for an unchanged resume. When Gemini can't embed the resume, the rebuild
+still happens once and only the Gemini semantic recompute is retried on
+later runs. The first run against a database takes the current resume as
+already applied instead of rewriting every row.
+
+Run: PYTHONPATH=src python src/rescore_jobs.py [--all] [--dry-run]
+         [--resume [--force]]
+"""
+
+import hashlib
+import sys
+
+import scoring
+import store
+
+# agent_state keys holding resume_hash() of the resume last applied by
+# rescore_for_resume: the full rebuild, and the Gemini semantic scores (which
+# lag behind while the resume can't be embedded).
+RESUME_HASH_STATE = "resume_hash"
+RESUME_SEMANTIC_STATE = "resume_semantic_hash"
+
+RESCORE_BATCH = 500
+
+
+def rescore_row(row, resume_skill_set):
+    """(relevance_score, confidence, keyword_score, role_type) for a stored row."""
+    title = row.get("job_title") or ""
+    description = row.get("description") or ""
+    role = scoring.classify_role(title)
+    # Features stored at ingestion carry the entry-level verdict the score
+    # was actually built with, so they win over re-judging the description.
+    features = None
+    if row.get("features_at"):
+        features = store.row_features(
+            row.get("start_date"), row.get("grad_year"), row.get("immediate_start"),
+            row.get("entry_level"), row.get("senior_title"), row.get("skill_hits"),
+        )
+    elif not description:
+        # Only the title to go on: the entry bonus and resume boost the row
+        # was scored with (from a description since discarded) can't be
+        # rebuilt from it, so the stored scores stand.
+        return row.get("relevance_score"), row.get("confidence"), row.get("keyword_score"), role
+
+    keyword = scoring.keyword_score(
+        title, description, row.get("source") or "",
+        entry_level=features["entry_level"] if features else None,
+    )
+
+    if row.get("semantic_scored") and row.get("semantic_score") is None:
+        # Blended before the raw semantic score was kept: preserve it.
+        return row.get("relevance_score"), row.get("confidence"), keyword, role
+
+    if row.get("source") not in scoring.RESUME_BOOST_SOURCES:
+        boost = 0  # its runner never applies one
+    elif description:
+        boost = scoring.resume_match_boost(resume_skill_set, f"{title} {description}")
+    else:
+        boost = scoring.skill_boost(resume_skill_set, features["skill_hits"])
+    score, confidence = scoring.final_score(keyword, row.get("semantic_score"), boost)
+    return score, confidence, keyword, role
+
+
+def rescore(full=False, dry_run=False, conn=None, semantic=None, local_scorer=None,
+            engine=None):
+    """
+    Returns {"version", "examined", "changed", "restamped", "resemantic"}.
+
+    semantic     -- {job_id: new semantic_score} for Gemini-scored rows,
+                    re-blended in place of the stored one
+    local_scorer -- re-scores locally-scored rows that have a stored
+                    description (local_scoring.LocalScorer)
+    engine       -- only rows whose semantic_scored is this engine
+    """
+    from semantic_scoring import SEMANTIC_GEMINI, SEMANTIC_LOCAL
+
+    conn = conn or store.get_connection()
+    version = scoring.rules_version(store.get_settings(conn))
+    resume_skill_set = scoring.resume_skills(store.get_resume(conn))
+    semantic = semantic or {}
+
+    where, params = "locked = 0", ()
+    if not full:
+        where += " AND (scoring_version IS NULL OR scoring_version != ?)"
+        params = (version,)
+    if engine is not None:
+        where += " AND semantic_scored = ?"
+        params += (engine,)
+
+    stats = {"version": version, "examined": 0, "changed": 0, "restamped": 0, "resemantic": 0}
+    changed, restamp, resemantic = [], [], []
+
+    def flush():
+        if not dry_run:
+            store.apply_rescores(changed, restamp, version, semantic=resemantic, conn=conn)
+        stats["changed"] += len(changed)
+        stats["restamped"] += len(restamp)
+        stats["resemantic"] += len(resemantic)
+        changed.clear()
+        restamp.clear()
+        resemantic.clear()
+
+    for row in store.iter_rows("jobs", RESCORE_BATCH, conn=conn, where=where, params=params):
+        stats["examined"] += 1
+        scored_by = row.get("semantic_scored")
+        new_semantic = None
+        if scored_by == SEMANTIC_GEMINI:
+            new_semantic = semantic.get(row["job_id"])
+        elif scored_by == SEMANTIC_LOCAL and local_scorer is not None and row.get("description"):
+            new_semantic = local_scorer.score(row["description"])
+        # A row rescore_row can't rebuild keeps its semantic_score too, so
+        # the stored score stays the one its relevance_score was blended from.
+        rebuildable = row.get("description") or row.get("features_at")
+        if rebuildable and new_semantic is not None and new_semantic != row.get("semantic_score"):
+            row["semantic_score"] = new_semantic
+            resemantic.append((row["job_id"], new_semantic, scored_by))
+
+        new = rescore_row(row, resume_skill_set)
+        old = (row.get("relevance_score"), row.get("confidence"),
+               row.get("keyword_score"), row.get("role_type"))
+        if new != old:
+            changed.append((row["job_id"], *new))
+        else:
+            restamp.append(row["job_id"])
+        if len(changed) + len(restamp) >= RESCORE_BATCH:
+            flush()
+    flush()
+    return stats
+
+
+def resume_hash(text: str) -> str:
+    from semantic_scoring import normalize_text
+
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()[:16]
+
+
+def resume_semantic_scores(resume_text, conn, settings=None):
+    """
+    ({job_id: semantic_score}, resume_embedded): every stored job
+    embedding's score against the resume, in one pass over the job_index
+    matrix. Empty (and False) when the resume can't be embedded. Scores
+    come from the int8-stored vectors, so one can be 1 off what embedding
+    the job again would give. The resume is embedded at the embedding_dims
+    setting, against the job embeddings stored at that size.
+    """
+    import numpy as np
+
+    from job_index import index_for
+    from semantic_scoring import SemanticScorer, cache_for_settings
+
+    settings = settings or store.get_settings(conn)
+    scorer = SemanticScorer(
+        resume_text=resume_text, cache=cache_for_settings(settings, conn),
+        dims=settings["embedding_dims"],
+    )
+    resume_embedding = scorer.resume_embedding if scorer.available else None
+    if resume_embedding is None:
+        return {}, False
+    index = index_for(conn, scorer.space)
+    sims = index.similarities(resume_embedding)
+    # _similarity_to_score, vectorized (np.rint rounds half to even, like round()).
+    scores = np.rint((np.clip(sims, -1.0, 1.0) + 1) / 2 * 100)
+    return {
+        job_id: int(score)
+        for job_id, score in zip(index.ids, scores) if np.isfinite(score)
+    }, True
+
+
+def rescore_for_resume(force=False, dry_run=False, conn=None):
+    """
+    rescore(full=True) with semantic scores recomputed against the current
+    resume, when its hash changed since the last run (or `force`). Gemini
+    is only asked for the resume's embedding (one call, or none when it's
+    cached) unless the semantic_engine setting is "local". Returns None
+    when there was nothing to do, else rescore()'s stats plus
+    "resume_embedded", "semantic_pending" (the resume couldn't be embedded,
+    so Gemini-scored rows are retried on the next run) and "no_embedding"
+    (Gemini-scored rows with no stored embedding, which keep their old
+    semantic_score).
+
+    A resume already applied except for that retry only re-blends the
+    Gemini-scored rows, once the resume embeds.
+    """
+    from local_scoring import LocalScorer
+    from semantic_scoring import SEMANTIC_GEMINI, settings_space
+
+    conn = conn or store.get_connection()
+    resume_text = store.get_resume(conn)
+    digest = resume_hash(resume_text)
+    applied = store.get_state(RESUME_HASH_STATE, conn=conn)
+    if applied is None and not force:
+        # First run against this database: the stored scores stand for the
+        # current resume, rather than rewriting every row to find out.
+        if not dry_run:
+            store.set_state(RESUME_HASH_STATE, digest, conn=conn)
+            store.set_state(RESUME_SEMANTIC_STATE, digest, conn=conn)
+        return None
+    semantic_only = not force and applied == digest
+    if semantic_only and store.get_state(RESUME_SEMANTIC_STATE, conn=conn) == digest:
+        return None
+
+    settings = store.get_settings(conn)
+    use_gemini = resume_text and settings["semantic_engine"] != "local"
+    semantic, embedded = (
+        resume_semantic_scores(resume_text, conn, settings) if use_gemini else ({}, False)
+    )
+    # Without the resume embedding, Gemini-scored rows still hold scores for
+    # the old resume: leave the semantic hash behind so the next run retries.
+    pending = bool(use_gemini and not embedded and conn.execute(
+        "SELECT 1 FROM jobs WHERE semantic_scored = ? AND locked = 0 LIMIT 1",
+        (SEMANTIC_GEMINI,),
+    ).fetchone())
+    if semantic_only and not embedded:
+        if not dry_run and not pending:
+            store.set_state(RESUME_SEMANTIC_STATE, digest, conn=conn)
+        return None
+
+    if semantic_only:
+        stats = rescore(
+            full=True, dry_run=dry_run, conn=conn, semantic=semantic, engine=SEMANTIC_GEMINI,
+        )
+    else:
+        stats = rescore(
+            full=True, dry_run=dry_run, conn=conn, semantic=semantic,
+            local_scorer=LocalScorer(resume_text=resume_text) if resume_text else None,
+        )
+    stats["resume_embedded"] = embedded
+    stats["semantic_pending"] = pending
+    stats["no_embedding"] = conn.execute(
+        "SELECT COUNT(*) FROM jobs j WHERE j.semantic_scored = ? AND j.locked = 0 "
+        "AND NOT EXISTS (SELECT 1 FROM job_embeddings e "
+        "WHERE e.job_id = j.job_id AND e.model = ?)",
+        (SEMANTIC_GEMINI, settings_space(settings)),
+    ).fetchone()[0]
+    if not dry_run:
+        store.set_state(RESUME_HASH_STATE, digest, conn=conn)
+        if not pending:
+            store.set_state(RESUME_SEMANTIC_STATE, digest, conn=conn)
+    return stats
+
+
+def main():
+    prefix = "[dry run] " if "--dry-run" in sys.argv else ""
+    if "--resume" in sys.argv:
+        stats = rescore_for_resume(force="--force" in sys.argv, dry_run="--dry-run" in sys.argv)
+        if stats is None:
+            print("Resume already applied; nothing to do (--force to rerun).")
+            return
+        if stats["semantic_pending"]:
+            print("Resume could not be embedded (GEMINI_API_KEY / credits): Gemini "
+                  "semantic scores were left as they are and are retried next run.")
+        print(
+            f"{prefix}resume rescore: examined {stats['examined']} job(s), "
+            f"{stats['resemantic']} new semantic score(s), {stats['changed']} rescored, "
+            f"{stats['no_embedding']} Gemini-scored job(s) without a stored embedding kept"
+        )
+        return
+
+    stats = rescore(full="--all" in sys.argv, dry_run="--dry-run" in sys.argv)
+    print(
+        f"{prefix}rules {stats['version']}: examined {stats['examined']} job(s), "
+        f"{stats['changed']} rescored, {stats['restamped']} already current"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -114,6 +114,7 @@ results = refresh_jobs(
 )
 
 print("Results:", results)
+print("Scoring cache:", scoring.scoring_cache_summary())
 
 # ----------------------------
 # Backfill: resume-score previously-unscored jobs (fail-safe for past runs
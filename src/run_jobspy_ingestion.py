@@ -4,18 +4,38 @@ datastore (see store.py). The scraping + scoring pipeline is unchanged; only
 persistence (settings, resume, write, backfill) now goes through `store`.
 """
 
+import atexit
+import sys
+
 from scrapers.jobspy_source import JobSpyScraper
 from description_fetcher import fetch_job_description
-from semantic_scoring import SemanticScorer
+from semantic_scoring import SEMANTIC_GEMINI, SEMANTIC_LOCAL, SEMANTIC_NONE, scorer_for_settings
 from notifier import notify_summary
+from backfill_worker import BACKFILL_SOURCES, drain_semantic
+from enrichment import enrich_descriptions
+from rescore_jobs import rescore_for_resume
+import job_index
 import scoring
 import store
 
-# Sources eligible for resume-score backfill (JobSpy boards + legacy sources).
-BACKFILL_SOURCES = [
-    "linkedin", "indeed", "glassdoor", "zip_recruiter", "google",
-    "google_search", "new_grad_github",
-]
+# Single-flight guard: repeated "Refresh jobs" clicks dispatch overlapping
+# runs. Only one may scrape at a time; the rest exit immediately. The TTL
+# bounds how long a crashed run can block the next one.
+RUN_LEASE = "jobspy_scrape"
+RUN_LEASE_TTL = 2 * 60 * 60
+
+# ----------------------------
+# Acquire the run lease
+# ----------------------------
+lease_holder = store.default_worker_id()
+lease = store.acquire_run_lease(RUN_LEASE, lease_holder, RUN_LEASE_TTL)
+if not lease["acquired"]:
+    print(
+        f"Another scrape is already in progress (holder {lease['holder']}, "
+        f"lease expires at {lease['expires_at']}); exiting."
+    )
+    sys.exit(0)
+atexit.register(store.release_run_lease, RUN_LEASE, lease_holder)
 
 # ----------------------------
 # Load settings + resume from Turso
@@ -34,13 +54,21 @@ MAX_JOBS = settings["max_jobs"]
 raw_jobs = raw_jobs[:MAX_JOBS]
 print(f"Processing {len(raw_jobs)} jobs (max_jobs={MAX_JOBS})")
 
+# Keep the score's components so a later rules change can be re-applied
+# without a re-scrape (see rescore_jobs.py).
+scoring_version = scoring.rules_version(settings)
+for job in raw_jobs:
+    job["keyword_score"] = job["relevance_score"]
+    job["scoring_version"] = scoring_version
+
 # ----------------------------
-# Description-dependent enrichment: semantic scoring (optional — needs resume
-# + GEMINI_API_KEY) and the min_start_date filter. JobSpy no longer pre-fetches
+# Description-dependent enrichment: semantic scoring (optional — needs a resume;
+# Gemini and/or the offline local scorer per semantic_engine) and the
+# min_start_date filter. JobSpy no longer pre-fetches
 # LinkedIn descriptions, so this fetches the posting page for jobs missing one.
 # ----------------------------
 resume_text = store.get_resume()
-scorer = SemanticScorer(resume_text=resume_text)
+scorer = scorer_for_settings(settings, resume_text=resume_text)
 # Keyless resume-match boost: reward jobs that ask for the candidate's skills
 # (works with or without Gemini semantic scoring).
 resume_skill_set = scoring.resume_skills(resume_text)
@@ -49,85 +77,136 @@ if resume_skill_set:
 min_start_date = settings.get("min_start_date")
 
 if scorer.available:
-    print("Semantic scoring enabled — scoring descriptions against resume")
+    engine_names = {SEMANTIC_GEMINI: "Gemini", SEMANTIC_LOCAL: "local offline"}
+    print(
+        "Semantic scoring enabled — scoring descriptions against resume ("
+        + ", then ".join(engine_names[e] for e in scorer.engines) + ")"
+    )
 else:
-    print("Semantic scoring skipped (no resume and/or GEMINI_API_KEY set)")
+    print(f"Semantic scoring skipped (no resume, or engine {settings['semantic_engine']!r} unavailable)")
 
 if min_start_date:
     print(f"Start-date filter enabled — excluding jobs starting before {min_start_date}")
 
 if scorer.available or min_start_date:
-    kept_jobs = []
+    # 1. Fetch any missing descriptions (network-bound, serial).
+    descriptions = []
+    # The scraper's entry-level bonus and gate judged JobSpy's description,
+    # which may be empty or differ from the page fetched here: that verdict
+    # is the one stored with the features, so a rescore rebuilds the same
+    # score.
+    entry_verdicts = []
     for i, job in enumerate(raw_jobs, start=1):
         description = job.pop("description", "")
+        entry_verdicts.append(scoring.is_new_grad_or_entry(job["job_title"], description or ""))
         if not description:
             print(f"[{i}/{len(raw_jobs)}] Fetching description: {job['company']} - {job['job_title']}")
             fetched = fetch_job_description(job["job_url"])
             description = fetched["description"]
             if not job.get("date_posted") and fetched["date_posted"]:
                 job["date_posted"] = fetched["date_posted"]
+        descriptions.append(description)
 
-        if min_start_date and not scoring.passes_start_date_filter(
-            job["job_title"], description, min_start_date
-        ):
-            continue
-
+    # 2. Regex-heavy start-date gate + resume-match boost (CPU-bound, parallel).
+    enriched = enrich_descriptions(
+        [(job["job_title"], d) for job, d in zip(raw_jobs, descriptions)],
+        min_start_date=min_start_date,
+        resume_skill_set=resume_skill_set,
+    )
+    for info, entry_level in zip(enriched, entry_verdicts):
+        info["features"]["entry_level"] = entry_level
+
+    # 3. Semantic scoring (API-bound, batched) and the final score.
+    passing = [
+        (job, description, info)
+        for job, description, info in zip(raw_jobs, descriptions, enriched)
+        if info["passes_start_date"]
+    ]
+    semantic_scores, embeddings = (
+        scorer.score_and_embed([description for _, description, _ in passing])
+        if scorer.available else ([(None, SEMANTIC_NONE)] * len(passing), [None] * len(passing))
+    )
+    kept_jobs = []
+    for (job, description, info), (semantic_score, engine), embedding in zip(
+        passing, semantic_scores, embeddings
+    ):
+        if embedding is not None:
+            # Kept (quantized) after the upsert -- see job_index.py.
+            job["embedding"] = embedding
         if scorer.available:
-            semantic_score = scorer.score(description)
             blended = scoring.blend_scores(job["relevance_score"], semantic_score)
             job["relevance_score"] = blended
             job["confidence"] = scoring.compute_confidence(blended, True)
-            job["semantic_scored"] = semantic_score is not None
+            job["semantic_scored"] = engine
+            job["semantic_score"] = semantic_score
 
         # Resume-match boost (uses the full description here).
-        job["relevance_score"] = min(
-            100,
-            job["relevance_score"]
-            + scoring.resume_match_boost(resume_skill_set, f"{job['job_title']} {description}"),
-        )
+        job["relevance_score"] = min(100, job["relevance_score"] + info["resume_boost"])
+
+        # Persist what was extracted, so later filter/rescoring changes can
+        # be applied in SQL without the description (see apply_filters.py).
+        if description:
+            job["features"] = info["features"]
 
         kept_jobs.append(job)
 
     print(f"{len(kept_jobs)}/{len(raw_jobs)} jobs kept after description-based filtering/scoring")
     raw_jobs = kept_jobs
 else:
-    # No description pass -- apply the resume boost on the title alone.
-    for job in raw_jobs:
-        job["relevance_score"] = min(
-            100,
-            job["relevance_score"] + scoring.resume_match_boost(resume_skill_set, job["job_title"]),
-        )
+    # No description pass -- store features for the jobs JobSpy returned a
+    # description for and take their resume boost from those, as a rescore
+    # would; the rest get the boost on the title alone.
+    described = [job for job in raw_jobs if job.get("description")]
+    enriched = enrich_descriptions([(job["job_title"], job["description"]) for job in described])
+    for job, info in zip(described, enriched):
+        job["features"] = info["features"]
+    boosts = scoring.resume_match_boosts(resume_skill_set, [job["job_title"] for job in raw_jobs])
+    for job, boost in zip(raw_jobs, boosts):
+        if "features" in job:
+            boost = scoring.skill_boost(resume_skill_set, job["features"]["skill_hits"])
+        job["relevance_score"] = min(100, job["relevance_score"] + boost)
         job.pop("description", None)
 
 # ----------------------------
 # Write to Turso (upsert; user-owned columns and locked rows are preserved)
 # ----------------------------
 results = store.upsert_jobs(raw_jobs)
+embedded = [job for job in raw_jobs if "embedding" in job]
+if embedded:
+    store.put_job_embeddings(job_index.embedding_rows(
+        [job["job_id"] for job in embedded], [job.pop("embedding") for job in embedded],
+        model=scorer.gemini.space,
+    ))
 print("Results:", results)
+print("Scoring cache:", scoring.scoring_cache_summary())
+
+# ----------------------------
+# Resume edited since the last run: rescore every stored job against it from
+# the stored embeddings -- one resume embedding, no re-fetching/re-embedding.
+# ----------------------------
+resume_rescore = rescore_for_resume()
+if resume_rescore is not None:
+    print(
+        f"Resume changed: {resume_rescore['resemantic']} semantic score(s) recomputed, "
+        f"{resume_rescore['changed']}/{resume_rescore['examined']} job(s) rescored"
+    )
 
 # ----------------------------
 # Backfill: resume-score previously-unscored jobs (fail-safe for past runs
 # where Gemini credits were unavailable), newest-first, bounded per run.
+# Claims rows from the shared work queue, so an overlapping run (or a
+# standalone backfill_worker.py) never fetches/embeds the same job twice.
 # ----------------------------
 results["backfilled"] = 0
 if scorer.available:
-    candidates = store.get_unscored_jobs(
-        sources=BACKFILL_SOURCES, limit=settings.get("max_backfill", 25)
+    # Scraping + enrichment can be slow; re-extend our lease before draining.
+    store.acquire_run_lease(RUN_LEASE, lease_holder, RUN_LEASE_TTL)
+    results["backfilled"] = drain_semantic(
+        scorer, max_items=settings.get("max_backfill", 25), sources=BACKFILL_SOURCES
     )
-    print(f"Backfill: {len(candidates)} unscored jobs to process")
-    for job in candidates:
-        fetched = fetch_job_description(job["job_url"])
-        description = fetched["description"]
-        if not description:
-            continue
-        semantic_score = scorer.score(description)
-        if semantic_score is None:
-            print("Backfill stopped early (embedding unavailable)")
-            break
-        blended = scoring.blend_scores(job["relevance_score"], semantic_score)
-        store.promote_scores(job["job_id"], blended, scoring.compute_confidence(blended, True))
-        results["backfilled"] += 1
     print(f"Backfill: {results['backfilled']} job(s) resume-scored this run")
+    if scorer.gemini is not None:
+        print("Embedding cache:", scorer.gemini.cache.summary())
 
 # ----------------------------
 # Notify (ntfy.sh) — per-board collected-vs-blocked status + counts
@@ -11,10 +11,29 @@ backfill pass resume-scores them newest-first on later runs, since
 new_grad_github is an eligible backfill source.
 """
 
+import atexit
+import sys
+
 from scrapers.new_grad_github import NewGradGitHubScraper
 from notifier import notify_summary
+import scoring
 import store
 
+# Single-flight guard (see run_jobspy_ingestion.py): overlapping dispatches
+# exit instead of racing on the same upserts.
+RUN_LEASE = "new_grad_scrape"
+RUN_LEASE_TTL = 30 * 60
+
+lease_holder = store.default_worker_id()
+lease = store.acquire_run_lease(RUN_LEASE, lease_holder, RUN_LEASE_TTL)
+if not lease["acquired"]:
+    print(
+        f"Another new-grad ingestion is already in progress (holder "
+        f"{lease['holder']}); exiting."
+    )
+    sys.exit(0)
+atexit.register(store.release_run_lease, RUN_LEASE, lease_holder)
+
 # ----------------------------
 # Load settings from Turso
 # ----------------------------
@@ -34,8 +53,10 @@ raw_jobs = raw_jobs[:MAX_JOBS]
 print(f"Processing {len(raw_jobs)} jobs (max_jobs={MAX_JOBS})")
 
 # Descriptions aren't used by this path; drop them before persisting.
+scoring_version = scoring.rules_version(settings)
 for job in raw_jobs:
     job.pop("description", None)
+    job["scoring_version"] = scoring_version
 
 # ----------------------------
 # Write to Turso (upsert; user-owned columns and locked rows are preserved)
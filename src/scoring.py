@@ -6,8 +6,11 @@ Google Search scraper) score and classify jobs the same way instead of
 re-implementing this logic and drifting out of sync.
 """
 
+import hashlib
+import json
 import re
 from datetime import date
+from functools import lru_cache
 
 US_STATES = {
     "al", "ak", "az", "ar", "ca", "co", "ct", "de", "fl", "ga",
@@ -44,37 +47,79 @@ SENIOR_LEVEL_KEYWORDS = {
 }
 
 
-def is_us_location(location: str) -> bool:
-    """
-    True if location is remote, or resolves to a recognizable US state
-    (including the SimplifyJobs shorthand for NYC/SF).
+# Full state names, matched like the two-letter codes ("Austin, Texas").
+# Georgia is left out: "Tbilisi, Georgia" is as common as "Atlanta, Georgia",
+# and the US one nearly always comes through as "GA" anyway.
+US_STATE_NAMES = {
+    "alabama", "alaska", "arizona", "arkansas", "california", "colorado",
+    "connecticut", "delaware", "florida", "hawaii", "idaho",
+    "illinois", "indiana", "iowa", "kansas", "kentucky", "louisiana",
+    "maine", "maryland", "massachusetts", "michigan", "minnesota",
+    "mississippi", "missouri", "montana", "nebraska", "nevada",
+    "new hampshire", "new jersey", "new mexico", "new york",
+    "north carolina", "north dakota", "ohio", "oklahoma", "oregon",
+    "pennsylvania", "rhode island", "south carolina", "south dakota",
+    "tennessee", "texas", "utah", "vermont", "virginia", "washington",
+    "west virginia", "wisconsin", "wyoming", "district of columbia",
+}
+
+# Locations that name no state but are unambiguously US: SimplifyJobs
+# shorthand, country spellings, and major metros boards list bare.
+US_LOCATION_ALIASES = {
+    "nyc", "sf", "sfnyc",
+    "us", "usa", "u.s.", "u.s.a.", "united states", "united states of america",
+    "new york city", "san francisco", "bay area", "sf bay area",
+    "san francisco bay area", "silicon valley", "los angeles", "seattle",
+    "boston", "chicago", "austin", "washington dc", "washington d.c.",
+}
+
+_US_STATE_RE = re.compile(
+    r",\s*(?:" + "|".join(sorted(US_STATES | US_STATE_NAMES, key=len, reverse=True)) + r")\b"
+)
+_US_PARTS = US_STATES | US_STATE_NAMES | US_LOCATION_ALIASES
+_METRO_AFFIXES_RE = re.compile(r"^greater\s+|\s+(?:metropolitan|metro)?\s*area$")
 
-    Uses a word-boundary regex for state codes so e.g. "Toronto, Canada"
-    doesn't false-positive match the "ca" (California) code.
-    """
-    loc = location.lower()
 
+@lru_cache(maxsize=4096)
+def _resolve_us_location(loc: str) -> bool:
     if "canada" in loc:
         return False
 
     if "remote" in loc:
         return True
 
-    has_state = any(re.search(rf",\s*{s}\b", loc) for s in US_STATES)
-    if not has_state and loc in ("nyc", "sf", "sfnyc"):
-        has_state = True
+    if _US_STATE_RE.search(loc):
+        return True
 
-    return has_state
+    # Bare "Texas", "United States", "NYC", "Greater Seattle Area" -- or one
+    # followed only by US parts ("Boston, USA"); "Boston, Lincolnshire, UK"
+    # is not Boston, MA.
+    head, *rest = [part.strip() for part in loc.split(",")]
+    if any(part not in _US_PARTS for part in rest if part):
+        return False
+    if head in US_LOCATION_ALIASES or head in US_STATE_NAMES:
+        return True
+    head = _METRO_AFFIXES_RE.sub("", head)
+    return head in US_LOCATION_ALIASES
 
 
-def classify_role(title: str) -> str:
-    t = title.lower()
+def is_us_location(location: str) -> bool:
+    """
+    True if location is remote, or resolves to a recognizable US state --
+    by two-letter code or full name after a comma ("Austin, TX",
+    "Austin, Texas") -- or is a bare state name, "United States"/"USA", or
+    a known US city alias (including the SimplifyJobs shorthand for NYC/SF).
+
+    Uses a word-boundary regex for state codes so e.g. "Toronto, Canada"
+    doesn't false-positive match the "ca" (California) code. The same
+    location strings recur across a run, so verdicts are cached on the
+    normalized string.
+    """
+    return _resolve_us_location(" ".join((location or "").lower().split()))
 
-    if "intern" in t:
-        return "internship"
-    if "new grad" in t or "graduate" in t:
-        return "new_grad"
-    return "other"
+
+def classify_role(title: str) -> str:
+    return _title_profile(title.lower())[1]
 
 
 def is_entry_level(title: str, snippet: str = "") -> bool:
@@ -136,6 +181,149 @@ _ENTRY_DESC_PHRASES = (
 )
 
 
+# ---------------------------------------------------------------------------
+# Title profile + memoization.
+#
+# The same titles ("Software Engineer", "Software Engineer, New Grad") recur
+# across every (title x location) query and across boards, so everything the
+# title alone decides -- relevance score, role type, seniority, and the
+# title's new-grad/entry verdict -- is computed once per distinct lowercased
+# title by _title_profile() and cached. The description rescue phrase scan is
+# cached separately on the lowercased description (boards syndicate the same
+# posting). These and is_us_location's cache are bounded LRUs, and
+# scoring_cache_stats() reports their hit/miss counts. They are tied to the
+# rules: rules_version() -- which every runner and rescore computes before
+# scoring -- clears them whenever a table they were filled from has changed
+# since, so a keyword edit at runtime can't leave stale verdicts behind.
+#
+# The keyword tests stay plain `in` checks rather than one combined
+# alternation regex: on CPython, str's C-level substring search over a few
+# dozen short keywords beats a single-pass `re` scan of the same text
+# (measured 2-4x on 6000-char descriptions with plain, trie-factored and
+# lookahead alternations), and it keeps the exact substring semantics
+# ("ai" in "maintain") the scores were tuned against.
+# ---------------------------------------------------------------------------
+
+TITLE_CACHE_SIZE = 4096
+DESCRIPTION_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _title_profile(t: str) -> tuple:
+    """
+    (relevance_score, role_type, senior_title, entry_verdict, swe_hits,
+    ml_hits) for a lowercased title. entry_verdict is True/False when the
+    title decides new-grad/entry on its own, None when the description has to.
+    """
+    swe_hits = tuple(kw for kw in SWE_KEYWORDS if kw in t)
+    ml_hits = tuple(kw for kw in ML_KEYWORDS if kw in t)
+
+    intern = "intern" in t
+    score = 30 * len(swe_hits) + 15 * len(ml_hits) + (20 if intern else 0)
+
+    if intern:
+        role = "internship"
+    elif "new grad" in t or "graduate" in t:
+        role = "new_grad"
+    else:
+        role = "other"
+
+    senior = bool(_SENIOR_TITLE_RE.search(t))
+    if senior:
+        entry = False
+    elif _ENTRY_TITLE_RE.search(t):
+        entry = True
+    else:
+        entry = None
+
+    return max(min(score, 100), 0), role, senior, entry, swe_hits, ml_hits
+
+
+@lru_cache(maxsize=DESCRIPTION_CACHE_SIZE)
+def _has_entry_phrase(d: str) -> bool:
+    return any(phrase in d for phrase in _ENTRY_DESC_PHRASES)
+
+
+_SCORING_CACHES = {
+    "title": _title_profile,
+    "description": _has_entry_phrase,
+    "location": _resolve_us_location,
+}
+
+
+def scoring_cache_stats() -> dict:
+    """{cache: {"hits", "misses", "size"}} since start / the last clear."""
+    stats = {}
+    for name, fn in _SCORING_CACHES.items():
+        info = fn.cache_info()
+        stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+    return stats
+
+
+def scoring_cache_summary() -> str:
+    """One-line hit-rate summary for run logs."""
+    parts = []
+    for name, info in scoring_cache_stats().items():
+        lookups = info["hits"] + info["misses"]
+        if lookups:
+            parts.append(f"{name} {info['hits']}/{lookups} hits ({100 * info['hits'] // lookups}%)")
+    return ", ".join(parts) or "no lookups"
+
+
+def clear_scoring_caches():
+    """
+    Drop every memoized scoring decision. rules_version() does this itself
+    when the tables change; call it directly to measure cold caches.
+    """
+    for fn in _SCORING_CACHES.values():
+        fn.cache_clear()
+
+
+# Signature of the tables the caches were filled from (see rules_version).
+_cached_rules = None
+
+
+def _check_scoring_caches(rules: dict):
+    """Clear the caches if the tables they depend on differ from the ones
+    they were filled from."""
+    global _cached_rules
+    signature = (
+        rules["swe"], rules["ml"], rules["senior_title"], rules["entry_title"],
+        rules["entry_phrases"],
+        sorted(US_STATES), sorted(US_STATE_NAMES), sorted(US_LOCATION_ALIASES),
+    )
+    if signature != _cached_rules:
+        if _cached_rules is not None:
+            clear_scoring_caches()
+        _cached_rules = signature
+
+
+def text_signals(title: str, description: str = "") -> dict:
+    """
+    Every keyword-derived signal for one job, from one (cached) title profile
+    and at most one description scan (only when the title alone can't decide
+    new-grad/entry). Equivalent to calling the individual functions:
+
+      relevance_score   -- compute_relevance_score(title, ...)
+      role_type         -- classify_role(title)
+      senior_title      -- has_senior_title(title)
+      new_grad_or_entry -- is_new_grad_or_entry(title, description)
+      swe_hits, ml_hits -- the SWE / ML keywords the title contains
+    """
+    score, role, senior, entry, swe_hits, ml_hits = _title_profile((title or "").lower())
+    if entry is None:
+        entry = _has_entry_phrase((description or "").lower())
+
+    return {
+        "relevance_score": score,
+        "role_type": role,
+        "senior_title": senior,
+        "new_grad_or_entry": entry,
+        "swe_hits": list(swe_hits),
+        "ml_hits": list(ml_hits),
+    }
+
+
 def has_senior_title(title: str) -> bool:
     """
     True if the TITLE carries a seniority marker (senior/staff/principal/
@@ -148,7 +336,7 @@ def has_senior_title(title: str) -> bool:
     senior title that slips in ("Senior Software Engineer 1") still needs
     dropping.
     """
-    return bool(_SENIOR_TITLE_RE.search((title or "").lower()))
+    return _title_profile((title or "").lower())[2]
 
 
 def is_new_grad_or_entry(title: str, description: str = "") -> bool:
@@ -161,34 +349,14 @@ def is_new_grad_or_entry(title: str, description: str = "") -> bool:
       otherwise-plain title (so a "Software Engineer" req that says
       "New Grad, Class of 2027" is kept, but a generic one is dropped).
     """
-    t = (title or "").lower()
-
-    if _SENIOR_TITLE_RE.search(t):
-        return False
-
-    if _ENTRY_TITLE_RE.search(t):
-        return True
-
-    d = (description or "").lower()
-    return any(phrase in d for phrase in _ENTRY_DESC_PHRASES)
+    entry = _title_profile((title or "").lower())[3]
+    if entry is not None:
+        return entry
+    return _has_entry_phrase((description or "").lower())
 
 
 def compute_relevance_score(title: str, location: str) -> int:
-    t = title.lower()
-    score = 0
-
-    for kw in SWE_KEYWORDS:
-        if kw in t:
-            score += 30
-
-    for kw in ML_KEYWORDS:
-        if kw in t:
-            score += 15
-
-    if "intern" in t:
-        score += 20
-
-    return max(min(score, 100), 0)
+    return _title_profile(title.lower())[0]
 
 
 def compute_confidence(score: int, passed_filters: bool) -> float:
@@ -210,6 +378,52 @@ def compute_confidence(score: int, passed_filters: bool) -> float:
     return 0.3
 
 
+# ----------------------------
+# Column-wise (batch) scoring
+# ----------------------------
+# The rules above applied to whole pandas Series at once, for sources that
+# receive a DataFrame (JobSpy). Titles go through the same memoized title
+# profile as the per-job functions (a result frame is mostly repeats), and
+# description phrases are only checked for rows the title can't decide.
+# Inputs are str Series without missing values; every result is aligned to
+# the input's index. (This module never imports pandas itself.)
+
+def _title_profiles(titles):
+    return titles.str.lower().map(_title_profile)
+
+
+def relevance_scores(titles):
+    """compute_relevance_score for a Series of titles."""
+    return _title_profiles(titles).map(lambda p: p[0])
+
+
+def new_grad_or_entry_mask(titles, descriptions):
+    """is_new_grad_or_entry for aligned Series of titles and descriptions."""
+    verdict = _title_profiles(titles).map(lambda p: p[3])
+    undecided = verdict.isna()
+    entry = verdict.where(~undecided, False).astype(bool)
+    if undecided.any():
+        entry[undecided] = (
+            descriptions[undecided].str.lower().map(_has_entry_phrase).astype(bool)
+        )
+    return entry
+
+
+def role_types(titles):
+    """classify_role for a Series of titles."""
+    return _title_profiles(titles).map(lambda p: p[1])
+
+
+def us_location_mask(locations):
+    """is_us_location for a Series of locations (verdicts are cached)."""
+    return locations.map(is_us_location).astype(bool)
+
+
+def confidences(scores, passed_filters: bool = True):
+    """compute_confidence for a Series of scores."""
+    return scores.map(lambda score: compute_confidence(score, passed_filters))
+
+
 MONTH_NAMES = {
     "january": 1, "jan": 1,
     "february": 2, "feb": 2,
@@ -247,6 +461,22 @@ _SEASON_YEAR_RE = re.compile(
 _START_DATE_SEARCH_WINDOW = 40
 
 
+def _start_date_after(text: str, end: int):
+    window = text[end:end + _START_DATE_SEARCH_WINDOW]
+
+    month_year = _MONTH_YEAR_RE.search(window)
+    if month_year:
+        month = MONTH_NAMES[month_year.group("month").lower()]
+        return date(int(month_year.group("year")), month, 1)
+
+    season_year = _SEASON_YEAR_RE.search(window)
+    if season_year:
+        season = season_year.group("season").lower()
+        return date(int(season_year.group("year")), SEASON_MONTHS[season], 1)
+
+    return None
+
+
 def extract_start_date(text: str):
     """
     Best-effort extraction of a job's start date from free text (title +
@@ -262,17 +492,9 @@ def extract_start_date(text: str):
         return None
 
     for keyword_match in _START_KEYWORD_RE.finditer(text):
-        window = text[keyword_match.end():keyword_match.end() + _START_DATE_SEARCH_WINDOW]
-
-        month_year = _MONTH_YEAR_RE.search(window)
-        if month_year:
-            month = MONTH_NAMES[month_year.group("month").lower()]
-            return date(int(month_year.group("year")), month, 1)
-
-        season_year = _SEASON_YEAR_RE.search(window)
-        if season_year:
-            season = season_year.group("season").lower()
-            return date(int(season_year.group("year")), SEASON_MONTHS[season], 1)
+        start = _start_date_after(text, keyword_match.end())
+        if start is not None:
+            return start
 
     return None
 
@@ -315,6 +537,91 @@ def extract_grad_year(text: str):
     return None
 
 
+# All three anchor kinds in one alternation, so extract_timing() walks the
+# text once. Built from the individual patterns so they can't drift apart.
+# "immediate" is tried first because it usually begins with a start keyword
+# ("starting immediately"); the start keyword inside it is recovered by
+# re-matching _START_KEYWORD_RE on the consumed span.
+_TIMING_ANCHOR_RE = re.compile(
+    f"(?P<immediate>{_IMMEDIATE_START_RE.pattern})"
+    f"|(?P<start>{_START_KEYWORD_RE.pattern})"
+    f"|(?P<grad>{_GRAD_KEYWORD_RE.pattern})",
+    re.IGNORECASE,
+)
+# Every anchor match starts with one of these words. The leading \b (and
+# IGNORECASE) keep re from using its fast literal-prefix search, so a plain
+# finditer costs ~3x a str.find sweep; instead the anchors are only tried,
+# anchored, where a lead word occurs in the lowercased text.
+_TIMING_LEAD_WORDS = ("start", "begin", "immediate", "class", "graduat", "new")
+# Non-ASCII letters IGNORECASE equates with ASCII ones that .lower() does
+# not map to them (the other two, U+0130 and U+212A, change length or don't
+# matter here).
+_CASEFOLD_ODDITIES = ("\u017f", "\u0131")
+
+
+def _timing_anchors(text: str):
+    """Same matches as _TIMING_ANCHOR_RE.finditer(text), found faster."""
+    low = text.lower()
+    if len(low) != len(text) or any(ch in text for ch in _CASEFOLD_ODDITIES):
+        yield from _TIMING_ANCHOR_RE.finditer(text)
+        return
+
+    positions = set()
+    for word in _TIMING_LEAD_WORDS:
+        i = low.find(word)
+        while i != -1:
+            positions.add(i)
+            i = low.find(word, i + 1)
+
+    end = 0
+    for pos in sorted(positions):
+        if pos < end:
+            continue
+        anchor = _TIMING_ANCHOR_RE.match(text, pos)
+        if anchor:
+            end = anchor.end()
+            yield anchor
+
+
+def extract_timing(text: str) -> dict:
+    """
+    extract_start_date, extract_grad_year and the immediate-start check in
+    one pass over the text:
+
+      {"start_date": date | None, "grad_year": int | None,
+       "immediate_start": bool}
+
+    start_date / grad_year are exactly what the individual extractors return
+    (the first keyword, in text order, whose window yields a value).
+    """
+    result = {"start_date": None, "grad_year": None, "immediate_start": False}
+    if not text:
+        return result
+
+    for anchor in _timing_anchors(text):
+        kind = anchor.lastgroup
+        if kind == "grad":
+            if result["grad_year"] is None:
+                start = max(0, anchor.start() - _GRAD_YEAR_LOOKBEHIND)
+                year_match = _YEAR_RE.search(text[start:anchor.end() + _GRAD_YEAR_LOOKAHEAD])
+                if year_match:
+                    result["grad_year"] = int(year_match.group(1))
+            continue
+
+        if kind == "immediate":
+            result["immediate_start"] = True
+            keywords = _START_KEYWORD_RE.finditer(text, anchor.start(), anchor.end())
+        else:
+            keywords = (anchor,)
+        if result["start_date"] is None:
+            for keyword_match in keywords:
+                result["start_date"] = _start_date_after(text, keyword_match.end())
+                if result["start_date"] is not None:
+                    break
+
+    return result
+
+
 def passes_start_date_filter(title: str, description: str, min_start_date) -> bool:
     """
     "Smart new-grad" start-date gate. Returns True to KEEP a job, False to
@@ -330,17 +637,22 @@ def passes_start_date_filter(title: str, description: str, min_start_date) -> bo
       4. Else the start date is genuinely unknown -> keep (lenient), so the
          many legit postings that simply don't state a date aren't discarded.
     """
-    text = f"{title} {description}"
+    return timing_passes(extract_timing(f"{title} {description}"), min_start_date)
 
-    start = extract_start_date(text)
-    if start is not None:
-        return start >= min_start_date
 
-    grad_year = extract_grad_year(text)
-    if grad_year is not None:
-        return grad_year >= min_start_date.year
+def timing_passes(timing: dict, min_start_date) -> bool:
+    """
+    passes_start_date_filter's precedence applied to an already-extracted
+    extract_timing() result (or stored job features with the same keys).
+    store.start_date_filter_sql() is the SQL mirror of this.
+    """
+    if timing["start_date"] is not None:
+        return timing["start_date"] >= min_start_date
 
-    if _IMMEDIATE_START_RE.search(text):
+    if timing["grad_year"] is not None:
+        return timing["grad_year"] >= min_start_date.year
+
+    if timing["immediate_start"]:
         return False
 
     return True
@@ -391,12 +703,73 @@ _RESUME_SKILLS = [
 ]
 
 
+def _literal_prefixes(pattern: str) -> tuple:
+    """
+    The literal text each top-level branch of `pattern` must start with
+    (r"\bnode(\.js)?\b" -> ("node",), r"c#|\.net" -> ("c#", ".net")). An
+    empty string means the branch has no literal lead-in.
+    """
+    prefixes = []
+    for branch in pattern.split("|"):
+        branch = branch.replace(r"\b", "")
+        literal = ""
+        i = 0
+        while i < len(branch):
+            ch = branch[i]
+            if ch == "\\" and i + 1 < len(branch) and not branch[i + 1].isalnum():
+                literal += branch[i + 1]
+                i += 2
+                continue
+            if ch in "?*{":
+                literal = literal[:-1]  # the quantified char is optional
+                break
+            if ch in "()[]+.^$\\":
+                break
+            literal += ch
+            i += 1
+        prefixes.append(literal)
+    return tuple(prefixes)
+
+
+def _compile_skills(table):
+    return [(label, re.compile(pat), _literal_prefixes(pat)) for label, pat in table]
+
+
+# Compiled once. A pattern with a leading \b defeats re's literal-prefix scan
+# (~30x slower than a plain substring search over a 6000-char description),
+# so each skill is located by str.find on its literal prefix(es) and the full
+# pattern is only tried, anchored, at those offsets. Every match has to start
+# with one of its branches' prefixes, so this finds exactly what re.search
+# would. (One combined alternation + finditer was measured slower still, and
+# loses skills whose matches overlap.)
+_SKILL_MATCHERS = _compile_skills(_RESUME_SKILLS)
+
+
+def _has_skill(compiled, prefixes, low: str) -> bool:
+    if "" in prefixes:
+        return compiled.search(low) is not None
+    for literal in prefixes:
+        i = low.find(literal)
+        while i != -1:
+            if compiled.match(low, i):
+                return True
+            i = low.find(literal, i + 1)
+    return False
+
+
 def resume_skills(resume_text: str) -> set:
     """Set of skills present in the resume."""
     if not resume_text:
         return set()
     low = resume_text.lower()
-    return {label for label, pat in _RESUME_SKILLS if re.search(pat, low)}
+    return {label for label, compiled, prefixes in _SKILL_MATCHERS if _has_skill(compiled, prefixes, low)}
+
+
+def skill_boost(resume_skill_set: set, skill_hits, cap: int = 15) -> int:
+    """resume_match_boost from a job's precomputed resume_skills() hits."""
+    if not resume_skill_set or not skill_hits:
+        return 0
+    return min(len(resume_skill_set.intersection(skill_hits)) * 3, cap)
 
 
 def resume_match_boost(resume_skill_set: set, job_text: str, cap: int = 15) -> int:
@@ -406,9 +779,125 @@ def resume_match_boost(resume_skill_set: set, job_text: str, cap: int = 15) -> i
     """
     if not resume_skill_set or not job_text:
         return 0
-    low = job_text.lower()
-    hits = sum(
-        1 for label, pat in _RESUME_SKILLS
-        if label in resume_skill_set and re.search(pat, low)
+    return resume_match_boosts(resume_skill_set, [job_text], cap)[0]
+
+
+def resume_match_boosts(resume_skill_set: set, job_texts, cap: int = 15) -> list:
+    """
+    resume_match_boost for many job texts against one resume skill set; the
+    resume's matchers are selected once for the whole batch.
+    """
+    matchers = [m for m in _SKILL_MATCHERS if m[0] in (resume_skill_set or ())]
+    boosts = []
+    for text in job_texts:
+        if not matchers or not text:
+            boosts.append(0)
+            continue
+        low = text.lower()
+        hits = sum(1 for _, compiled, prefixes in matchers if _has_skill(compiled, prefixes, low))
+        boosts.append(min(hits * 3, cap))
+    return boosts
+
+
+# ----------------------------
+# Stored-score reconstruction + rules versioning
+# ----------------------------
+# Every stored relevance_score is stamped with the rules_version() that
+# produced it, so src/rescore_jobs.py can recompute just the rows scored
+# under older rules from their stored title/description/semantic_score.
+
+# Sources whose scrapers add ENTRY_LEVEL_BONUS for new-grad/entry postings
+# (JobSpy boards + Google Jobs). The curated GitHub lists don't.
+ENTRY_BONUS_SOURCES = {
+    "linkedin", "indeed", "glassdoor", "zip_recruiter", "google", "jobspy",
+    "google_search",
+}
+ENTRY_LEVEL_BONUS = 20
+
+# Sources whose runner adds the resume-match boost (run_jobspy_ingestion).
+# The Google Search and GitHub-list runners store their scores without it.
+RESUME_BOOST_SOURCES = {
+    "linkedin", "indeed", "glassdoor", "zip_recruiter", "google", "jobspy",
+}
+
+# Bump when scoring arithmetic changes in code (weights, caps, bonuses) --
+# edits to the keyword tables / patterns are picked up automatically.
+SCORING_RULES_REVISION = 1
+
+
+def keyword_score(title: str, description: str = "", source: str = "", entry_level=None) -> int:
+    """
+    The pre-semantic score a scraper assigns (the relevance_score it
+    emits): title keywords, plus the entry-level bonus for sources
+    that apply it. `entry_level` short-circuits is_new_grad_or_entry with a
+    stored verdict.
+    """
+    score = compute_relevance_score(title or "", "")
+    if source in ENTRY_BONUS_SOURCES:
+        if entry_level is None:
+            entry_level = is_new_grad_or_entry(title, description)
+        if entry_level:
+            score = min(score + ENTRY_LEVEL_BONUS, 100)
+    return score
+
+
+def final_score(keyword: int, semantic_score=None, boost: int = 0):
+    """(relevance_score, confidence) exactly as the ingestion runner builds
+    them: blend with the semantic score, confidence from the blend, then the
+    resume-match boost on top."""
+    base = blend_scores(keyword, semantic_score)
+    return min(100, base + boost), compute_confidence(base, True)
+
+
+def rules_version(settings: dict = None) -> str:
+    """
+    Short hash of everything that determines a stored relevance_score: the
+    keyword tables, title/description patterns, resume skill table, the
+    code revision above and the `keywords` setting. Changes whenever a
+    rules edit would change scores. Also clears the scoring caches if the
+    tables behind them changed since they were filled.
+    """
+    rules = {
+        "revision": SCORING_RULES_REVISION,
+        "swe": sorted(SWE_KEYWORDS),
+        "ml": sorted(ML_KEYWORDS),
+        "senior_title": _SENIOR_TITLE_RE.pattern,
+        "entry_title": _ENTRY_TITLE_RE.pattern,
+        "entry_phrases": list(_ENTRY_DESC_PHRASES),
+        "entry_bonus": [ENTRY_LEVEL_BONUS, sorted(ENTRY_BONUS_SOURCES)],
+        "resume_boost": sorted(RESUME_BOOST_SOURCES),
+        "resume_skills": _RESUME_SKILLS,
+        "keywords": sorted((settings or {}).get("keywords") or []),
+    }
+    _check_scoring_caches(rules)
+    blob = json.dumps(rules, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(blob).hexdigest()[:12]
+
+
+# ----------------------------
+# Persisted job features
+# ----------------------------
+
+def extract_features(title: str, description: str = "") -> dict:
+    """
+    Every description-derived signal worth keeping on the job row, so
+    filters and rescoring can run later without the description:
+
+      start_date, grad_year, immediate_start -- extract_timing(title + description)
+      entry_level  -- is_new_grad_or_entry(title, description)
+      senior_title -- has_senior_title(title)
+      skill_hits   -- sorted resume_skills(title + description) labels
+
+    timing_passes(features, min_start_date) and skill_boost(resume_skill_set,
+    features["skill_hits"]) reproduce passes_start_date_filter and
+    resume_match_boost from these.
+    """
+    text = f"{title} {description}"
+    signals = text_signals(title, description)
+    features = extract_timing(text)
+    features.update(
+        entry_level=signals["new_grad_or_entry"],
+        senior_title=signals["senior_title"],
+        skill_hits=sorted(resume_skills(text)),
     )
-    return min(hits * 3, cap)
+    return features
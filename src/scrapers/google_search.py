@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 
 import requests
 
+import filter_plan
 import scoring
 
 SERPAPI_URL = "https://serpapi.com/search.json"
@@ -39,6 +40,9 @@ class GoogleSearchScraper:
 
     SOURCE_NAME = "google_search"
 
+    # Which filter_plan gates this source applies (see _passes_filters).
+    FILTER_RULES = {"entry_gate": "entry"}
+
     def __init__(self, api_key=None):
         self.api_key = api_key or os.environ.get("SERPAPI_API_KEY")
 
@@ -170,37 +174,26 @@ class GoogleSearchScraper:
         # SimplifyJobs internship pipeline ("must contain 'intern'", "must
         # contain one of these SWE keywords") and would fight against this
         # source's actual targeting, which already happens via job_titles
-        # (what we search for) and entry_level_only (below).
-        settings = self.settings
-        location = candidate["location"].lower()
-        description = candidate.get("description", "")
-
+        # (what we search for) and entry_level_only (FILTER_RULES).
         # Only full-time roles -- drop internships/part-time/contract, and
         # drop postings where Google didn't detect a schedule type at all
         # rather than letting them through ambiguously.
         if candidate.get("schedule_type", "").strip().lower() != "full-time":
             return False
 
-        if settings.get("entry_level_only") and not scoring.is_new_grad_or_entry(
-            candidate["job_title"], description
-        ):
-            return False
-
-        if settings.get("us_only") and not scoring.is_us_location(location):
-            return False
-
-        if not settings.get("remote_allowed") and "remote" in location:
-            return False
-
-        return True
+        plan = filter_plan.for_settings(self.settings, self.FILTER_RULES)
+        return plan.passes(
+            candidate["job_title"], candidate["location"], candidate.get("description", "")
+        )
 
     def _build_raw_job(self, candidate):
         title = candidate["job_title"]
         location = candidate["location"]
         description = candidate.get("description", "")
 
-        score = scoring.compute_relevance_score(title, location)
-        if scoring.is_new_grad_or_entry(title, description):
+        signals = scoring.text_signals(title, description)
+        score = signals["relevance_score"]
+        if signals["new_grad_or_entry"]:
             score = min(score + 20, 100)
 
         return {
@@ -216,6 +209,6 @@ class GoogleSearchScraper:
             # full description. sheet_reader ignores unrecognized keys.
             "description": description,
             "relevance_score": score,
-            "role_type": scoring.classify_role(title),
+            "role_type": signals["role_type"],
             "confidence": scoring.compute_confidence(score, True),
         }
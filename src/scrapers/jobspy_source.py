@@ -4,6 +4,7 @@ import re
 import pandas as pd
 from jobspy import scrape_jobs
 
+import filter_plan
 import scoring
 
 
@@ -109,6 +110,9 @@ class JobSpyScraper:
 
     SOURCE_NAME = "jobspy"
 
+    # Which filter_plan gates this source applies (see _frame_to_jobs).
+    FILTER_RULES = {"entry_gate": "entry"}
+
     # Boards to pull from. Kept in code for now; can be promoted to the
     # Settings tab later without touching the rest of the pipeline.
     SITES = ["google", "linkedin", "indeed", "glassdoor", "zip_recruiter"]
@@ -170,13 +174,7 @@ class JobSpyScraper:
                     handler.errors, err_before,
                 )
 
-                for _, row in df.iterrows():
-                    candidate = self._parse_row(row, location)
-                    if not candidate:
-                        continue
-                    if not self._passes_filters(candidate):
-                        continue
-                    raw_jobs.append(self._build_raw_job(candidate))
+                raw_jobs.extend(self._frame_to_jobs(df, location))
         finally:
             _detach_board_handler(handler, attached)
 
@@ -302,39 +300,89 @@ class JobSpyScraper:
     # Result parsing
     # ----------------------------
 
-    def _parse_row(self, row, query_location):
-        title = self._clean(row.get("title"))
-        company = self._clean(row.get("company"))
-        location = self._normalize_location(
-            self._clean(row.get("location")) or query_location
-        )
-        # Prefer the direct employer link when JobSpy resolved one.
-        link = self._clean(row.get("job_url_direct")) or self._clean(
-            row.get("job_url")
-        )
-        description = self._clean(row.get("description"))
-        date_posted = self._parse_date(row.get("date_posted"))
-        is_remote = bool(row.get("is_remote")) if pd.notna(
-            row.get("is_remote")
-        ) else False
-        # The actual board JobSpy scraped this row from (linkedin, indeed,
-        # glassdoor, zip_recruiter, google) -- used as the `source`.
-        site_raw = self._clean(row.get("site"))
-        source = _SITE_BY_NORM.get(_norm(site_raw), site_raw) or self.SOURCE_NAME
-
-        if not title or not company or not link:
-            return None
-
-        return {
-            "job_title": title,
-            "company": company,
+    def _frame_to_jobs(self, df, query_location):
+        """
+        Raw-job dicts for one result frame, in row order: cleaning,
+        filtering and scoring run as Series operations / boolean masks
+        (scoring's batch API), and only the surviving rows are turned into
+        dicts. benchmarks/jobspy_reference.py keeps the row-by-row version
+        this must stay equivalent to (checked by bench_scoring.py).
+        """
+        if df is None or df.empty:
+            return []
+        df = df.reset_index(drop=True)
+
+        link = self._clean_column(df, "job_url_direct")
+        link = link.where(link != "", self._clean_column(df, "job_url"))
+        location = self._clean_column(df, "location")
+        location = location.where(location != "", query_location).map(self._normalize_location)
+        if "is_remote" in df.columns:
+            is_remote = df["is_remote"].where(df["is_remote"].notna(), False).astype(bool)
+        else:
+            is_remote = pd.Series(False, index=df.index)
+        site_raw = self._clean_column(df, "site")
+
+        cand = pd.DataFrame({
+            "job_title": self._clean_column(df, "title"),
+            "company": self._clean_column(df, "company"),
             "location": location,
             "job_url": link,
-            "description": description,
-            "date_posted": date_posted,
+            "description": self._clean_column(df, "description"),
             "is_remote": is_remote,
-            "source": source,
-        }
+            "source": site_raw.map(
+                lambda s: _SITE_BY_NORM.get(_norm(s), s) or self.SOURCE_NAME
+            ),
+        })
+        cand = cand[(cand["job_title"] != "") & (cand["company"] != "") & (cand["job_url"] != "")]
+
+        # Filters. Unlike GoogleSearchScraper there is no strict
+        # schedule_type == "full-time" gate: JobSpy frequently leaves job_type
+        # empty, and we already pass job_type="fulltime" to scrape_jobs, so
+        # hard-dropping empties would kill most legitimate results.
+        if not cand.empty:
+            plan = filter_plan.for_settings(self.settings, self.FILTER_RULES)
+            cand = cand[plan.mask(
+                cand["job_title"], cand["location"], cand["description"], cand["is_remote"]
+            )]
+        if cand.empty:
+            return []
+
+        # Scoring on the survivors only (title keywords, +20 for an
+        # entry-level verdict); the entry verdicts are memoized, so
+        # re-asking after the filter is cheap.
+        entry = scoring.new_grad_or_entry_mask(cand["job_title"], cand["description"])
+        score = scoring.relevance_scores(cand["job_title"])
+        score = score.mask(entry, (score + 20).clip(upper=100))
+        date_posted = (
+            df.loc[cand.index, "date_posted"].map(self._parse_date)
+            if "date_posted" in df.columns else ""
+        )
+
+        out = pd.DataFrame({
+            "job_title": cand["job_title"],
+            "company": cand["company"],
+            "location": cand["location"],
+            "job_url": cand["job_url"],
+            # The board this posting actually came from (e.g. "linkedin",
+            # "indeed"), not a generic "jobspy" tag.
+            "source": cand["source"],
+            "date_posted": date_posted,
+            # Not a sheet column -- read by the runner for semantic scoring /
+            # start-date filtering without a separate page fetch, since
+            # JobSpy already gives us the full description.
+            "description": cand["description"],
+            "relevance_score": score,
+            "role_type": scoring.role_types(cand["job_title"]),
+            "confidence": scoring.confidences(score),
+        })
+        return out.to_dict("records")
+
+    @classmethod
+    def _clean_column(cls, df, name):
+        """_clean applied to a whole column ("" for a missing column)."""
+        if name not in df.columns:
+            return pd.Series("", index=df.index, dtype=object)
+        return df[name].map(cls._clean).astype(object)
 
     @staticmethod
     def _clean(value):
@@ -375,60 +423,3 @@ class JobSpyScraper:
             return pd.Timestamp(value).date().isoformat()
         except (ValueError, TypeError):
             return str(value)[:10]
-
-    # ----------------------------
-    # Filtering + scoring
-    # ----------------------------
-
-    def _passes_filters(self, candidate):
-        # Mirrors GoogleSearchScraper._passes_filters, minus the strict
-        # schedule_type == "full-time" gate: JobSpy frequently leaves
-        # job_type empty, and we already pass job_type="fulltime" to
-        # scrape_jobs, so hard-dropping empties here would kill most
-        # legitimate results. Deliberate, documented deviation.
-        settings = self.settings
-        location = candidate["location"].lower()
-        description = candidate.get("description", "")
-
-        if settings.get("entry_level_only") and not scoring.is_new_grad_or_entry(
-            candidate["job_title"], description
-        ):
-            return False
-
-        if settings.get("us_only") and not scoring.is_us_location(location):
-            return False
-
-        if not settings.get("remote_allowed") and (
-            candidate.get("is_remote") or "remote" in location
-        ):
-            return False
-
-        return True
-
-    def _build_raw_job(self, candidate):
-        title = candidate["job_title"]
-        location = candidate["location"]
-        description = candidate.get("description", "")
-
-        score = scoring.compute_relevance_score(title, location)
-        if scoring.is_new_grad_or_entry(title, description):
-            score = min(score + 20, 100)
-
-        return {
-            "job_title": title,
-            "company": candidate["company"],
-            "location": location,
-            "job_url": candidate["job_url"],
-            # The board this posting actually came from (e.g. "linkedin",
-            # "indeed"), not a generic "jobspy" tag.
-            "source": candidate.get("source") or self.SOURCE_NAME,
-            "date_posted": candidate.get("date_posted", ""),
-            # Not a sheet column -- read by the runner for semantic scoring /
-            # start-date filtering without a separate page fetch, since
-            # JobSpy already gives us the full description. sheet_reader
-            # ignores unrecognized keys.
-            "description": description,
-            "relevance_score": score,
-            "role_type": scoring.classify_role(title),
-            "confidence": scoring.compute_confidence(score, True),
-        }
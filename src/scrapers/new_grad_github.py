@@ -27,12 +27,16 @@ from datetime import datetime, timedelta, timezone
 import requests
 from bs4 import BeautifulSoup
 
+import filter_plan
 import scoring
 
 
 class NewGradGitHubScraper:
     SOURCE_NAME = "new_grad_github"
 
+    # Which filter_plan gates this source applies (see _passes_filters).
+    FILTER_RULES = {"entry_gate": "not_senior", "exclude_canada": True}
+
     RAW_URL = (
         "https://raw.githubusercontent.com/"
         "SimplifyJobs/New-Grad-Positions/dev/README.md"
@@ -234,29 +238,13 @@ class NewGradGitHubScraper:
         likewise skipped -- the repo lists newest-first and the max_jobs cap in
         the runner keeps only the freshest roles.
         """
-        settings = self.settings
-        title = row.get("role", "")
-        location = row.get("location", "").lower()
-
         # Seniority gate (negative only, honoring entry_level_only). The repo
         # is curated new-grad, so trust its positive signal -- keep "Software
         # Engineer 1" -- but drop the odd senior title ("Senior Software
-        # Engineer 1") that slips in.
-        if settings.get("entry_level_only") and scoring.has_senior_title(title):
-            return False
-
-        # US-only filter
-        if settings.get("us_only"):
-            if "canada" in location:
-                return False
-            if not scoring.is_us_location(location):
-                return False
-
-        # Remote allowed
-        if not settings.get("remote_allowed") and "remote" in location:
-            return False
-
-        return True
+        # Engineer 1") that slips in. Then us_only (never Canada) and
+        # remote_allowed.
+        plan = filter_plan.for_settings(self.settings, self.FILTER_RULES)
+        return plan.passes(row.get("role", ""), row.get("location", ""))
 
     def _build_raw_job(self, row: dict):
         title = row.get("role", "")
@@ -3,11 +3,15 @@ import re
 from datetime import datetime, timedelta, timezone
 from bs4 import BeautifulSoup
 
+import filter_plan
 import scoring
 
 class SimplifyGitHubScraper:
     SOURCE_NAME = "simplify_github"
 
+    # Which filter_plan gates this source applies.
+    FILTER_RULES = {"title_terms": True, "age_gate": True, "exclude_canada": True}
+
     RAW_URL = (
         "https://raw.githubusercontent.com/"
         "SimplifyJobs/Summer2026-Internships/dev/README.md"
@@ -106,60 +110,12 @@ class SimplifyGitHubScraper:
         return posted_date.date().isoformat()
 
     def _passes_filters(self, row: dict) -> bool:
-        title = row.get("role", "").lower()
-        location = row.get("location", "").lower()
-        age_str = row.get("age", "")
-
-
-        if "mo" in age_str:
-            return False
-
-        settings = self.settings
-
-        # ──────────────────────────────
-        # 1. Required job type (MANDATORY)
-        # ──────────────────────────────
-        required_types = settings.get("required_job_type", [])
-
-        if required_types:
-            if not any(rt in title for rt in required_types):
-                return False
-
-        # ──────────────────────────────
-        # 2. Keywords (at least one must match)
-        # ──────────────────────────────
-        keywords = settings.get("keywords", [])
-        if keywords:
-            if not any(kw in title for kw in keywords):
-                return False
-
-        # ──────────────────────────────
-        # 3. Max days back
-        # ──────────────────────────────
-        match = re.search(r"(\d+)", age_str)
-        if match:
-            days_ago = int(match.group(1))
-            if days_ago > settings.get("max_days_back", 999):
-                return False
-
-        # ──────────────────────────────
-        # 4. US-only filter
-        # ──────────────────────────────
-        if settings.get("us_only"):
-
-            if "canada" in location:
-                return False
-
-            if not scoring.is_us_location(location):
-                return False
-
-        # ──────────────────────────────
-        # 5. Remote allowed
-        # ──────────────────────────────
-        if not settings.get("remote_allowed") and "remote" in location:
-            return False
-
-        return True
+        # Internship pipeline: required_job_type + keywords in the title, the
+        # max_days_back age cutoff, us_only (never Canada), remote_allowed.
+        plan = filter_plan.for_settings(self.settings, self.FILTER_RULES)
+        return plan.passes(
+            row.get("role", ""), row.get("location", ""), age=row.get("age", "")
+        )
 
     def _build_raw_job(self, row: dict):
         title = row.get("role", "")
@@ -7,6 +7,10 @@ empty description, or a failed embedding request all result in `None`
 rather than an exception -- callers should fall back to the existing
 keyword-based score in that case (see scoring.blend_scores).
 
+build_scorer() wraps this with the offline local_scoring.LocalScorer per
+the semantic_engine setting, so a job Gemini can't score still gets a
+(bag-of-words) resume score; semantic_scored records which engine it was.
+
 NOTE: the older "text-embedding-004" model was retired by Google and now
 404s; the current embedding model is "gemini-embedding-001" (verified
 against the live ListModels endpoint). Google occasionally renames/
@@ -17,20 +21,79 @@ this model requires a billing-enabled project -- an unfunded key returns
 degrades to keyword-only scoring rather than crashing the run.
 """
 
+import hashlib
 import math
 import os
 
+import numpy as np
 import requests
 
+from description_compactor import compact_description
+from rate_limit import CircuitBreaker, TokenBucket
+
 GEMINI_API_KEY_ENV = "GEMINI_API_KEY"
 EMBEDDING_MODEL = "gemini-embedding-001"
 EMBEDDING_URL = (
     "https://generativelanguage.googleapis.com/v1beta/models/"
     f"{EMBEDDING_MODEL}:embedContent"
 )
+BATCH_EMBEDDING_URL = (
+    "https://generativelanguage.googleapis.com/v1beta/models/"
+    f"{EMBEDDING_MODEL}:batchEmbedContents"
+)
+# batchEmbedContents accepts at most this many requests per call.
+EMBED_BATCH_LIMIT = 100
 DEFAULT_RESUME_PATH = "resume.txt"
 REQUEST_TIMEOUT = 15
 
+# Request pacing (see GeminiEmbedder). 100/min is gemini-embedding-001's
+# lowest published tier; raise it for a higher-tier project.
+EMBED_REQUESTS_PER_MINUTE = 100
+EMBED_WORKERS = 4
+# A 429 asking us to wait longer than this (or more than this many times)
+# means the quota is gone for this run.
+MAX_RETRY_AFTER = 60
+MAX_RATE_LIMIT_RETRIES = 3
+# Consecutive network/5xx failures before the pass gives up on the API.
+EMBED_FAILURES_TO_TRIP = 3
+
+# Embedding cache bound: ~12 KB per 3072-dim float32 vector, so 10k rows is
+# ~120 MB of database. Least-recently-used rows beyond this are evicted.
+EMBEDDING_CACHE_MAX_ROWS = 10000
+# Check the bound after this many new rows rather than on every write.
+EMBEDDING_CACHE_EVICT_EVERY = 100
+
+# gemini-embedding-001 returns 3072 dims unless a request sets
+# outputDimensionality; it is trained so that shorter outputs stay good
+# embeddings (768 and 1536 are the recommended sizes). None means the model
+# default. benchmarks/eval_embedding_dims.py measures what each size costs
+# in ranking quality.
+EMBEDDING_DIMS = None
+
+# Vectors are kept as little-endian float32 in memory. The cache stores them
+# as float32 (exact), float16 (half the bytes) or int8 with one float scale
+# per vector (a quarter) -- see EmbeddingCache.
+VECTOR_DTYPE = np.dtype("<f4")
+VECTOR_ENCODINGS = ("float32", "float16", "int8")
+# similarity_scores keeps unit vectors in float32 (dot products accumulate
+# in float64), which puts its similarity within ~1e-6 of the exact one. A
+# score closer than this to a rounding boundary (k + 0.5) is recomputed
+# with the exact _cosine_similarity path, so the 0-100 result never
+# differs from it.
+ROUNDING_MARGIN = 1e-3
+# Rows per float64 block in similarity_scores (bounds its temporary memory).
+SIMILARITY_BLOCK_ROWS = 1024
+
+# jobs.semantic_scored values: which engine the semantic_score came from.
+SEMANTIC_NONE = 0
+SEMANTIC_GEMINI = 1
+SEMANTIC_LOCAL = 2  # local_scoring.LocalScorer (offline bag-of-words)
+
+# The semantic_engine setting: "gemini" or "local" alone, or "auto" --
+# Gemini first, with the local scorer filling whatever Gemini couldn't score.
+SEMANTIC_ENGINES = ("auto", "gemini", "local")
+DEFAULT_SEMANTIC_ENGINE = "auto"
+
 
 def load_resume(path: str = DEFAULT_RESUME_PATH) -> str:
     """
@@ -45,29 +108,344 @@ def load_resume(path: str = DEFAULT_RESUME_PATH) -> str:
         return ""
 
 
-def _embed_text(text: str, api_key: str):
-    if not text or not api_key:
-        return None
+def _retry_after_seconds(response):
+    """
+    Seconds a 429 asks us to wait: the Retry-After header, else the
+    RetryInfo retryDelay ("20s") Google puts in the error body. None when
+    neither is present -- e.g. "prepayment credits are depleted", which
+    waiting won't fix.
+    """
+    header = response.headers.get("retry-after")
+    if header:
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            from email.utils import parsedate_to_datetime
+            from datetime import datetime, timezone
 
+            try:
+                when = parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                return None
+            return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
     try:
-        response = requests.post(
-            EMBEDDING_URL,
-            params={"key": api_key},
-            json={"content": {"parts": [{"text": text}]}},
-            timeout=REQUEST_TIMEOUT,
-        )
-        response.raise_for_status()
-    except requests.RequestException as exc:
-        print(f"Embedding request failed: {exc}")
+        details = response.json().get("error", {}).get("details", [])
+    except ValueError:
         return None
+    for detail in details:
+        delay = str((detail or {}).get("retryDelay", ""))
+        if delay.endswith("s"):
+            try:
+                return float(delay[:-1])
+            except ValueError:
+                pass
+    return None
+
+
+class GeminiEmbedder:
+    """
+    Gemini embedding transport shared by a SemanticScorer's workers.
+
+    Every request goes through one TokenBucket (EMBED_REQUESTS_PER_MINUTE by
+    default) and one CircuitBreaker. A 429 with a short Retry-After pauses
+    the whole limiter and retries; a 429 without one (credits depleted), an
+    auth/model error, or repeated network/5xx failures opens the breaker,
+    and from then on every request in the pass returns None without being
+    sent. A 400 only fails the text(s) in that request.
+
+    embed_many() sends batchEmbedContents requests (EMBED_BATCH_LIMIT texts
+    each) or, with batch=False, one embedContent per text -- either way
+    spread over `workers` threads. `dims` sets outputDimensionality on
+    every request (None: the model default).
+    """
+
+    def __init__(self, api_key: str, workers: int = None, requests_per_minute: float = None,
+                 batch: bool = True, dims: int = None):
+        self.api_key = api_key
+        self.dims = dims
+        self.workers = max(1, workers or EMBED_WORKERS)
+        self.batch = batch
+        rpm = requests_per_minute or EMBED_REQUESTS_PER_MINUTE
+        self.limiter = TokenBucket(rate=rpm / 60, capacity=min(self.workers, rpm))
+        self.breaker = CircuitBreaker(failure_threshold=EMBED_FAILURES_TO_TRIP)
+
+    def _post(self, url: str, payload: dict, what: str):
+        """(response JSON or None, HTTP status or None)."""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            if self.breaker.open:
+                return None, None
+            self.limiter.acquire()
+            try:
+                response = requests.post(
+                    url, params={"key": self.api_key}, json=payload, timeout=REQUEST_TIMEOUT
+                )
+            except requests.RequestException as exc:
+                print(f"{what} failed: {exc}")
+                self.breaker.record_failure(str(exc)[:200])
+                return None, None
+
+            status = response.status_code
+            if status == 429:
+                wait = _retry_after_seconds(response)
+                if wait is not None and wait <= MAX_RETRY_AFTER and attempt < MAX_RATE_LIMIT_RETRIES:
+                    print(f"{what}: 429, retrying in {wait:.0f}s")
+                    self.limiter.hold(wait)
+                    continue
+                self.breaker.trip(f"429 from Gemini ({response.text[:200]})")
+                return None, status
+            if status == 400:
+                print(f"{what} rejected (400): {response.text[:200]}")
+                return None, status
+            if status >= 500:
+                print(f"{what} failed: {status}")
+                self.breaker.record_failure(f"HTTP {status}")
+                return None, status
+            if status >= 300:
+                # 401/403 bad key, 404 retired model: nothing later will work.
+                self.breaker.trip(f"HTTP {status} from Gemini ({response.text[:200]})")
+                return None, status
+
+            self.breaker.record_success()
+            try:
+                return response.json(), status
+            except ValueError:
+                return None, status
+        return None, None
+
+    def _request(self, text: str) -> dict:
+        request = {"content": {"parts": [{"text": text}]}}
+        if self.dims:
+            request["outputDimensionality"] = self.dims
+        return request
+
+    def embed_one(self, text: str):
+        if not text or not self.api_key:
+            return None
+        data, _ = self._post(EMBEDDING_URL, self._request(text), "Embedding request")
+        return ((data or {}).get("embedding") or {}).get("values") or None
+
+    def _embed_batch(self, texts):
+        """(vectors aligned with texts, or None if the request failed; status)."""
+        data, status = self._post(
+            BATCH_EMBEDDING_URL,
+            {"requests": [
+                {"model": f"models/{EMBEDDING_MODEL}", **self._request(t)} for t in texts
+            ]},
+            f"Batch embedding request ({len(texts)} texts)",
+        )
+        if data is None:
+            return None, status
+        embeddings = data.get("embeddings") or []
+        vectors = [(e or {}).get("values") or None for e in embeddings[:len(texts)]]
+        vectors.extend([None] * (len(texts) - len(vectors)))
+        return vectors, status
+
+    def _embed_chunk(self, texts) -> list:
+        """
+        Vectors for one batch. A batch rejected as a bad request (e.g. one
+        oversized text) is split in half and each half retried, so one bad
+        text costs O(log n) extra requests and the rest still embed.
+        """
+        if len(texts) == 1:
+            # A lone text (the resume, a single score() call) uses embedContent.
+            return [self.embed_one(texts[0])]
+        vectors, status = self._embed_batch(texts)
+        if vectors is not None:
+            return vectors
+        if status != 400 or self.breaker.open:
+            return [None] * len(texts)
+        mid = len(texts) // 2
+        return self._embed_chunk(texts[:mid]) + self._embed_chunk(texts[mid:])
+
+    def embed_many(self, texts) -> list:
+        """
+        Embeddings aligned with `texts`, None for any text that couldn't be
+        embedded (empty text, missing values, failed request, open breaker).
+        """
+        out = [None] * len(texts)
+        if not self.api_key:
+            return out
+        todo = [i for i, t in enumerate(texts) if t]
+        size = EMBED_BATCH_LIMIT if self.batch else 1
+        groups = [todo[start:start + size] for start in range(0, len(todo), size)]
+        if not groups:
+            return out
+
+        def run(idxs):
+            return self._embed_chunk([texts[i] for i in idxs])
+
+        if len(groups) == 1 or self.workers == 1:
+            results = map(run, groups)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(groups))) as pool:
+                results = list(pool.map(run, groups))
+        for idxs, vectors in zip(groups, results):
+            for i, values in zip(idxs, vectors):
+                out[i] = values
+        return out
+
+
+def normalize_text(text: str) -> str:
+    """Whitespace-collapsed text: what the embedding cache is keyed on, so
+    the same posting re-scraped with different line breaks is one entry."""
+    return " ".join((text or "").split())
+
+
+def embedding_space(model: str = EMBEDDING_MODEL, dims: int = None) -> str:
+    """
+    Name for the vectors `model` returns at `dims` (None: its default size),
+    e.g. "gemini-embedding-001" or "gemini-embedding-001@768". Cached and
+    stored embeddings are tagged with it, so vectors of different sizes are
+    never compared.
+    """
+    return f"{model}@{dims}" if dims else model
+
+
+def embedding_key(model: str, text: str) -> str:
+    """Content address of `text`'s embedding under `model`."""
+    return hashlib.sha256(f"{model}\n{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+def _pack_vector(values, encoding: str = "float32"):
+    """(blob, scale) storing `values` as `encoding`. scale is None except
+    for int8, where the vector is scale * the int8 values."""
+    vector = np.asarray(values, dtype=VECTOR_DTYPE)
+    if encoding == "float16":
+        return vector.astype("<f2").tobytes(), None
+    if encoding == "int8":
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = peak / 127 if peak > 0 and np.isfinite(peak) else 1.0
+        return np.clip(np.rint(vector / scale), -127, 127).astype("i1").tobytes(), scale
+    return vector.tobytes(), None
+
+
+def _unpack_vector(blob: bytes, encoding: str = "float32", scale: float = None) -> np.ndarray:
+    if encoding == "float16":
+        return np.frombuffer(blob, dtype="<f2").astype(VECTOR_DTYPE)
+    if encoding == "int8":
+        return np.frombuffer(blob, dtype="i1").astype(VECTOR_DTYPE) * VECTOR_DTYPE.type(scale)
+    return np.frombuffer(blob, dtype=VECTOR_DTYPE)
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache in the libSQL database (the embedding_cache
+    table, see store.py), keyed by embedding_key(model, text) where `model`
+    is the embedding_space() cached. Vectors are stored as `encoding` --
+    float32 by default, float16 or int8 to cut storage -- and a fresh
+    embedding goes through the same encoding before it is used, so a job
+    scores the same whether its vector came from the API or the cache.
+
+    Like the rest of this module it never raises: a database error is
+    printed once and the cache behaves as empty from then on.
+    """
+
+    def __init__(self, conn=None, model: str = EMBEDDING_MODEL,
+                 max_rows: int = EMBEDDING_CACHE_MAX_ROWS, encoding: str = "float32"):
+        if encoding not in VECTOR_ENCODINGS:
+            raise ValueError(f"encoding must be one of {VECTOR_ENCODINGS}, got {encoding!r}")
+        self._conn = conn
+        self.model = model
+        self.encoding = encoding
+        # float32 entries keep the keys they always had.
+        self._key_model = model if encoding == "float32" else f"{model}/{encoding}"
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evicted = 0
+        self.disabled = False
+
+    def _connection(self):
+        if self._conn is None:
+            import store
+
+            self._conn = store.get_connection()
+        return self._conn
+
+    def _fail(self, exc):
+        print(f"Embedding cache unavailable ({exc}); embedding without it")
+        self.disabled = True
+
+    def get(self, text: str):
+        """The cached vector for `text`, or None."""
+        return self.get_many([text])[0]
+
+    def get_many(self, texts) -> list:
+        """Cached vectors aligned with `texts` (None for misses), one query."""
+        out = [None] * len(texts)
+        if self.disabled:
+            return out
+        import store
+
+        keys = [embedding_key(self._key_model, t) if t else None for t in texts]
+        try:
+            found = store.get_embeddings({k for k in keys if k}, conn=self._connection())
+        except Exception as exc:  # libSQL/Turso errors aren't one exception type
+            self._fail(exc)
+            return out
+        for i, key in enumerate(keys):
+            if key is None:
+                continue
+            if key in found:
+                self.hits += 1
+                _, blob, encoding, scale = found[key]
+                out[i] = _unpack_vector(blob, encoding, scale)
+            else:
+                self.misses += 1
+        return out
 
-    values = response.json().get("embedding", {}).get("values")
-    return values or None
+    def put(self, text: str, values):
+        """Store `values` for `text`; returns them as the cache reads them back."""
+        return self.put_many([text], [values])[0]
+
+    def put_many(self, texts, vectors) -> list:
+        """Store each non-None vector for its text, in one write. Returns the
+        vectors as the cache reads them back (None stays None)."""
+        packed = [_pack_vector(v, self.encoding) if v is not None else None for v in vectors]
+        rows = [
+            (embedding_key(self._key_model, t), self.model, len(v), p[0], self.encoding, p[1])
+            for t, v, p in zip(texts, vectors, packed) if p is not None and t
+        ]
+        if rows and not self.disabled:
+            import store
+
+            try:
+                conn = self._connection()
+                store.put_embeddings(rows, conn=conn)
+                before = self.writes
+                self.writes += len(rows)
+                if self.writes // EMBEDDING_CACHE_EVICT_EVERY != before // EMBEDDING_CACHE_EVICT_EVERY:
+                    self.evicted += store.evict_embeddings(self.max_rows, conn=conn)
+            except Exception as exc:
+                self._fail(exc)
+        return [_unpack_vector(p[0], self.encoding, p[1]) if p is not None else None for p in packed]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evicted": self.evicted,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+    def summary(self) -> str:
+        s = self.stats()
+        rate = "-" if s["hit_rate"] is None else f"{s['hit_rate']:.0%}"
+        return f"{s['hits']} hits / {s['misses']} misses ({rate}), {s['writes']} stored"
 
 
 def _cosine_similarity(a, b):
-    if not a or not b or len(a) != len(b):
+    if a is None or b is None or len(a) == 0 or len(b) == 0 or len(a) != len(b):
         return None
+    if isinstance(a, np.ndarray):
+        a = a.tolist()
+    if isinstance(b, np.ndarray):
+        b = b.tolist()
 
     dot = sum(x * y for x, y in zip(a, b))
     norm_a = math.sqrt(sum(x * x for x in a))
@@ -79,53 +457,302 @@ def _cosine_similarity(a, b):
     return dot / (norm_a * norm_b)
 
 
+def _similarity_to_score(similarity) -> int:
+    similarity = max(-1.0, min(1.0, similarity))
+    return round((similarity + 1) / 2 * 100)
+
+
+def unit_matrix(vectors):
+    """
+    (matrix, norms): `vectors` stacked as an (n, dims) float32 array with
+    every row scaled to unit length, plus the original row norms (0 rows
+    are left as zeros).
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    # Norms of the float32 rows, accumulated in float64.
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix, dtype=np.float64))
+    scale = (1 / np.where(norms > 0, norms, 1)).astype(np.float32)
+    return matrix * scale[:, None], norms
+
+
+def similarity_scores(resume_embedding, job_embeddings, resume_unit=None) -> list:
+    """
+    score()'s 0-100 result for each job embedding (None where it has none,
+    or its length doesn't match the resume's), as matrix-vector products
+    over float32 unit vectors instead of a Python loop per job. Scores
+    within ROUNDING_MARGIN of a rounding boundary -- and zero/degenerate
+    vectors -- go through the exact _cosine_similarity path, so every
+    result is identical to it. `resume_unit` is the resume's unit vector,
+    when the caller already has it.
+    """
+    scores = [None] * len(job_embeddings)
+    if resume_embedding is None or len(resume_embedding) == 0:
+        return scores
+    dims = len(resume_embedding)
+    idx = [i for i, v in enumerate(job_embeddings) if v is not None and len(v) == dims]
+    if not idx:
+        return scores
+
+    if resume_unit is None:
+        resume_unit, resume_norm = unit_matrix([resume_embedding])
+        resume_unit, resume_norm = resume_unit[0], resume_norm[0]
+    else:
+        resume_norm = 1.0
+    resume_unit = np.asarray(resume_unit, dtype=np.float64)
+    sims, norms = [], []
+    for start in range(0, len(idx), SIMILARITY_BLOCK_ROWS):
+        rows = [job_embeddings[i] for i in idx[start:start + SIMILARITY_BLOCK_ROWS]]
+        block, block_norms = unit_matrix(rows)
+        sims.append(block.astype(np.float64) @ resume_unit)
+        norms.append(block_norms)
+    sims, norms = np.concatenate(sims), np.concatenate(norms)
+    raw = (np.clip(sims, -1.0, 1.0) + 1) / 2 * 100
+    exact = (
+        (np.abs(raw - np.floor(raw) - 0.5) < ROUNDING_MARGIN)
+        | ~(norms > 0) | ~np.isfinite(raw) | (resume_norm == 0)
+    )
+    for k, i in enumerate(idx):
+        if exact[k]:
+            similarity = _cosine_similarity(resume_embedding, job_embeddings[i])
+            scores[i] = None if similarity is None else _similarity_to_score(similarity)
+        else:
+            scores[i] = int(round(raw[k]))
+    return scores
+
+
 class SemanticScorer:
     """
     Embeds the resume once (lazily, on first use) and reuses it for
-    every job scored in a run.
+    every job scored in a run. With an EmbeddingCache, every embedding --
+    the resume's included -- is looked up there first and stored after a
+    successful request, so repeat texts never hit the network across runs.
+
+    Requests go through a GeminiEmbedder: batched by default, spread over
+    `workers` threads, paced to `requests_per_minute`, and cut off for the
+    rest of the run by its circuit breaker once the API is clearly
+    unavailable (see `unavailable_reason`).
+
+    Job descriptions are compacted first (description_compactor) unless
+    `compact` is False; the resume is embedded as is. `dims` asks for
+    reduced-size embeddings (outputDimensionality), named by `space`.
     """
 
+    engine = SEMANTIC_GEMINI
+
     def __init__(
         self,
         resume_path: str = DEFAULT_RESUME_PATH,
         api_key: str = None,
         resume_text: str = None,
+        cache: EmbeddingCache = None,
+        workers: int = None,
+        requests_per_minute: float = None,
+        batch: bool = True,
+        compact: bool = True,
+        dims: int = EMBEDDING_DIMS,
     ):
         self.api_key = api_key or os.environ.get(GEMINI_API_KEY_ENV)
+        self.space = embedding_space(EMBEDDING_MODEL, dims)
+        if cache is not None and cache.model != self.space:
+            raise ValueError(f"cache holds {cache.model!r} vectors, scorer embeds {self.space!r}")
+        self.cache = cache
+        self.compact = compact
+        self.embedder = GeminiEmbedder(
+            self.api_key, workers=workers, requests_per_minute=requests_per_minute, batch=batch,
+            dims=dims,
+        )
         # Prefer resume text passed in directly (e.g. read from the Resume
         # sheet tab); fall back to the file only when none was provided.
         self.resume_text = resume_text if resume_text is not None else load_resume(resume_path)
         self._resume_embedding = None
+        self._resume_unit = None
         self._resume_embedding_attempted = False
 
     @property
     def available(self) -> bool:
         return bool(self.resume_text and self.api_key)
 
+    @property
+    def unavailable_reason(self):
+        """Why the embedder's circuit breaker opened this run, or None."""
+        return self.embedder.breaker.reason
+
+    @property
+    def resume_embedding(self):
+        """The resume's embedding (embedded on first use), or None."""
+        return self._get_resume_embedding()
+
     def _get_resume_embedding(self):
         if not self._resume_embedding_attempted:
             self._resume_embedding_attempted = True
             if self.available:
-                self._resume_embedding = _embed_text(self.resume_text, self.api_key)
+                self._resume_embedding = self._embed(self.resume_text)
+                if self._resume_embedding is not None and len(self._resume_embedding):
+                    unit, norm = unit_matrix([self._resume_embedding])
+                    if norm[0] > 0:
+                        self._resume_unit = unit[0]
 
         return self._resume_embedding
 
+    def _embed(self, text: str):
+        return self._embed_many([text])[0]
+
+    def _embed_many(self, texts) -> list:
+        if self.cache is None:
+            return self.embedder.embed_many(texts)
+        vectors = self.cache.get_many(texts)
+        missing = [i for i, v in enumerate(vectors) if v is None and texts[i]]
+        if missing:
+            fresh = self.embedder.embed_many([texts[i] for i in missing])
+            stored = self.cache.put_many([texts[i] for i in missing], fresh)
+            for i, values in zip(missing, stored):
+                vectors[i] = values
+        return vectors
+
     def score(self, job_description: str):
         """
         Returns a similarity score in [0, 100], or None if semantic
         scoring isn't available for this job.
         """
-        if not job_description:
-            return None
+        return self.score_many([job_description])[0]
+
+    def score_many(self, job_descriptions) -> list:
+        """
+        score() for many descriptions, aligned with the input: cached
+        embeddings are read in one query and the rest are embedded with
+        batchEmbedContents (EMBED_BATCH_LIMIT per request, concurrently).
+        Any item that can't be scored is None; the others are unaffected.
+        """
+        return self.score_and_embed(job_descriptions)[0]
+
+    def score_and_embed(self, job_descriptions):
+        """(scores, embeddings): score_many() plus the job embeddings it
+        scored from (None where there's no score), e.g. to store them."""
+        job_descriptions = list(job_descriptions)
+        nothing = [None] * len(job_descriptions)
+        if not any(job_descriptions):
+            return nothing, list(nothing)
 
         resume_embedding = self._get_resume_embedding()
         if resume_embedding is None:
-            return None
+            return nothing, list(nothing)
+
+        if self.compact:
+            job_descriptions = [compact_description(d) for d in job_descriptions]
+        embeddings = self._embed_many(job_descriptions)
+        scores = similarity_scores(resume_embedding, embeddings, self._resume_unit)
+        return scores, [v if s is not None else None for s, v in zip(scores, embeddings)]
+
+
+class ScorerChain:
+    """
+    Several scorers behind the single-scorer interface: each item goes to the
+    first available scorer, and whatever it can't score falls through to the
+    next. score_many_tagged also reports which engine scored each item.
+    """
+
+    def __init__(self, scorers):
+        self.scorers = list(scorers)
+
+    @property
+    def available(self) -> bool:
+        return any(s.available for s in self.scorers)
+
+    @property
+    def engines(self) -> list:
+        """Engine tags of the available scorers, in order."""
+        return [s.engine for s in self.scorers if s.available]
+
+    @property
+    def gemini(self):
+        """The SemanticScorer in the chain, or None."""
+        return next((s for s in self.scorers if s.engine == SEMANTIC_GEMINI), None)
+
+    @property
+    def unavailable_reason(self):
+        gemini = self.gemini
+        return gemini.unavailable_reason if gemini is not None else None
+
+    def score(self, job_description: str):
+        return self.score_many([job_description])[0]
+
+    def score_many(self, job_descriptions) -> list:
+        return [score for score, _ in self.score_many_tagged(job_descriptions)]
+
+    def score_many_tagged(self, job_descriptions) -> list:
+        """[(score, engine)] aligned with the input; (None, SEMANTIC_NONE)
+        for an item no scorer could score."""
+        return self.score_and_embed(job_descriptions)[0]
+
+    def score_and_embed(self, job_descriptions):
+        """(score_many_tagged() result, the Gemini embedding behind each
+        Gemini-scored item -- None for the rest)."""
+        job_descriptions = list(job_descriptions)
+        out = [(None, SEMANTIC_NONE)] * len(job_descriptions)
+        embeddings = [None] * len(job_descriptions)
+        todo = [i for i, text in enumerate(job_descriptions) if text]
+        for scorer in self.scorers:
+            if not todo or not scorer.available:
+                continue
+            texts = [job_descriptions[i] for i in todo]
+            if scorer.engine == SEMANTIC_GEMINI:
+                scores, vectors = scorer.score_and_embed(texts)
+            else:
+                scores, vectors = scorer.score_many(texts), [None] * len(texts)
+            left = []
+            for i, score, vector in zip(todo, scores, vectors):
+                if score is None:
+                    left.append(i)
+                else:
+                    out[i] = (score, scorer.engine)
+                    embeddings[i] = vector
+            todo = left
+        return out, embeddings
+
+
+def build_scorer(engine: str = DEFAULT_SEMANTIC_ENGINE, resume_text: str = None,
+                 cache: EmbeddingCache = None, resume_path: str = DEFAULT_RESUME_PATH,
+                 dims: int = EMBEDDING_DIMS) -> ScorerChain:
+    """
+    The ScorerChain for the semantic_engine setting: "gemini" (SemanticScorer
+    only), "local" (local_scoring.LocalScorer only) or "auto" (both, Gemini
+    first). `dims` is the Gemini embedding size (see SemanticScorer).
+    """
+    from local_scoring import LocalScorer
+
+    if engine not in SEMANTIC_ENGINES:
+        raise ValueError(f"semantic_engine must be one of {SEMANTIC_ENGINES}, got {engine!r}")
+    scorers = []
+    if engine in ("auto", "gemini"):
+        scorers.append(SemanticScorer(
+            resume_path=resume_path, resume_text=resume_text, cache=cache, dims=dims
+        ))
+    if engine in ("auto", "local"):
+        scorers.append(LocalScorer(resume_path=resume_path, resume_text=resume_text))
+    return ScorerChain(scorers)
+
+
+def settings_space(settings: dict) -> str:
+    """embedding_space() for the embedding_dims setting."""
+    return embedding_space(EMBEDDING_MODEL, settings.get("embedding_dims") or EMBEDDING_DIMS)
+
+
+def cache_for_settings(settings: dict, conn=None) -> EmbeddingCache:
+    """EmbeddingCache on `conn` for the embedding_dims / embedding_encoding
+    settings."""
+    return EmbeddingCache(
+        conn, model=settings_space(settings),
+        encoding=settings.get("embedding_encoding") or "float32",
+    )
 
-        job_embedding = _embed_text(job_description, self.api_key)
-        similarity = _cosine_similarity(resume_embedding, job_embedding)
-        if similarity is None:
-            return None
 
-        similarity = max(-1.0, min(1.0, similarity))
-        return round((similarity + 1) / 2 * 100)
+def scorer_for_settings(settings: dict, resume_text: str = None, conn=None) -> ScorerChain:
+    """build_scorer() as configured in `settings` (settings_reader output):
+    semantic_engine, embedding_dims and a cache_for_settings() cache."""
+    return build_scorer(
+        settings.get("semantic_engine") or DEFAULT_SEMANTIC_ENGINE,
+        resume_text=resume_text, cache=cache_for_settings(settings, conn),
+        dims=settings.get("embedding_dims") or EMBEDDING_DIMS,
+    )
@@ -130,6 +130,26 @@ def _normalize_settings(raw_settings: dict):
     # Bounds how much of the unscored backlog each run drains. Defaults to 25.
     settings["max_backfill"] = _int_setting(raw_settings, "max_backfill", 25)
 
+    # Semantic scoring engine: "gemini", "local" (offline, no API key) or
+    # "auto" (Gemini, with the local scorer for whatever Gemini can't score).
+    # Anything else falls back to "auto".
+    engine = raw_settings.get("semantic_engine", "").strip().lower()
+    settings["semantic_engine"] = engine if engine in ("auto", "gemini", "local") else "auto"
+
+    # Gemini embedding size (outputDimensionality), e.g. 768 -- smaller is
+    # cheaper to store and compare at some cost in ranking quality (see
+    # benchmarks/eval_embedding_dims.py). Blank, 0 or anything outside
+    # 128-3072 means the model default (3072).
+    dims = _int_setting(raw_settings, "embedding_dims", 0)
+    settings["embedding_dims"] = dims if 128 <= dims <= 3072 else None
+
+    # How cached embeddings are stored: "float32" (exact, the default),
+    # "float16" (half the space) or "int8" (a quarter).
+    encoding = raw_settings.get("embedding_encoding", "").strip().lower()
+    settings["embedding_encoding"] = (
+        encoding if encoding in ("float32", "float16", "int8") else "float32"
+    )
+
     # US-only flag (bool)
     settings["us_only"] = raw_settings.get(
         "us_only", "false"
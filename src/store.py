@@ -13,6 +13,7 @@ fields (applied / date_applied / application_status / priority / notes) or a
 row the user has locked.
 """
 
+import json
 import os
 
 import libsql_experimental as libsql
@@ -22,8 +23,11 @@ _SYSTEM_UPSERT = """
 INSERT INTO jobs (
     job_id, job_title, company, location,
     job_url, source, date_posted, date_found,
-    relevance_score, role_type, confidence, semantic_scored, last_updated
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    relevance_score, role_type, confidence, semantic_scored, last_updated,
+    keyword_score, semantic_score, scoring_version,
+    start_date, grad_year, immediate_start, entry_level, senior_title,
+    skill_hits, features_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 ON CONFLICT(job_id) DO UPDATE SET
     job_url = excluded.job_url,
     source = excluded.source,
@@ -31,15 +35,39 @@ ON CONFLICT(job_id) DO UPDATE SET
     relevance_score = excluded.relevance_score,
     role_type = excluded.role_type,
     confidence = excluded.confidence,
-    -- never downgrade a job that was already resume-scored
-    semantic_scored = MAX(jobs.semantic_scored, excluded.semantic_scored),
-    last_updated = excluded.last_updated
+    -- never downgrade a job that was already resume-scored: not to unscored,
+    -- and a Gemini score (1) never to a local one (2)
+    semantic_scored = CASE WHEN jobs.semantic_scored = 1 OR excluded.semantic_scored = 0
+                           THEN jobs.semantic_scored ELSE excluded.semantic_scored END,
+    last_updated = excluded.last_updated,
+    keyword_score = excluded.keyword_score,
+    semantic_score = CASE WHEN jobs.semantic_scored = 1 AND excluded.semantic_scored != 1
+                          THEN jobs.semantic_score
+                          ELSE COALESCE(excluded.semantic_score, jobs.semantic_score) END,
+    scoring_version = excluded.scoring_version,
+    -- features are only replaced by a re-scrape that extracted them again
+    start_date = CASE WHEN excluded.features_at IS NULL THEN jobs.start_date ELSE excluded.start_date END,
+    grad_year = CASE WHEN excluded.features_at IS NULL THEN jobs.grad_year ELSE excluded.grad_year END,
+    immediate_start = CASE WHEN excluded.features_at IS NULL THEN jobs.immediate_start ELSE excluded.immediate_start END,
+    entry_level = CASE WHEN excluded.features_at IS NULL THEN jobs.entry_level ELSE excluded.entry_level END,
+    senior_title = CASE WHEN excluded.features_at IS NULL THEN jobs.senior_title ELSE excluded.senior_title END,
+    skill_hits = CASE WHEN excluded.features_at IS NULL THEN jobs.skill_hits ELSE excluded.skill_hits END,
+    features_at = COALESCE(excluded.features_at, jobs.features_at)
 WHERE jobs.locked = 0
 """
 
 
+# Database URLs whose schema this process has already brought up to date.
+_SCHEMA_READY = set()
+
+
 def get_connection():
-    """Open a libSQL connection from env (hosted Turso or a local file)."""
+    """
+    Open a libSQL connection from env (hosted Turso or a local file). The
+    first connection to each database in a process also applies
+    init_schema(), so a database created by an older release gains new
+    tables/columns before any runner writes to them.
+    """
     url = os.environ.get("TURSO_DATABASE_URL")
     token = os.environ.get("TURSO_AUTH_TOKEN")
     if not url:
@@ -48,23 +76,73 @@ def get_connection():
             "or file:local.db for local development)."
         )
     if url.startswith(("libsql://", "https://", "http://")):
-        return libsql.connect(database=url, auth_token=token)
-    # Local file path (file:jobs.db or a bare path).
-    return libsql.connect(url.replace("file:", "", 1))
+        conn = libsql.connect(database=url, auth_token=token)
+    else:
+        # Local file path (file:jobs.db or a bare path).
+        conn = libsql.connect(url.replace("file:", "", 1))
+    if url not in _SCHEMA_READY:
+        init_schema(conn)
+        _SCHEMA_READY.add(url)
+    return conn
 
 
 # ----------------------------
 # Schema
 # ----------------------------
 
+# Columns added to existing tables after their first release. CREATE TABLE IF
+# NOT EXISTS leaves an older table as it was, so init_schema ALTERs in any of
+# these that are missing -- before running schema.sql, whose indexes may
+# reference them.
+_ADDED_COLUMNS = {
+    "jobs": [
+        ("keyword_score", "INTEGER"),
+        ("semantic_score", "INTEGER"),
+        ("scoring_version", "TEXT"),
+        ("start_date", "TEXT"),
+        ("grad_year", "INTEGER"),
+        ("immediate_start", "INTEGER"),
+        ("entry_level", "INTEGER"),
+        ("senior_title", "INTEGER"),
+        ("skill_hits", "TEXT"),
+        ("features_at", "TEXT"),
+    ],
+    "embedding_cache": [
+        ("encoding", "TEXT"),
+        ("scale", "REAL"),
+    ],
+    "job_embeddings": [
+        ("seq", "INTEGER"),
+    ],
+}
+
+
+def _add_missing_columns(conn):
+    for table, columns in _ADDED_COLUMNS.items():
+        have = {r[1] for r in conn.execute(f'PRAGMA table_info("{table}")').fetchall()}
+        if not have:  # fresh database: schema.sql creates the full table
+            continue
+        for name, decl in columns:
+            if name not in have:
+                try:
+                    conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{name}" {decl}')
+                except Exception:
+                    # Another worker migrating the same database got there first.
+                    have = {r[1] for r in conn.execute(f'PRAGMA table_info("{table}")').fetchall()}
+                    if name not in have:
+                        raise
+
+
 def init_schema(conn=None, schema_path=None):
-    """Apply schema.sql (idempotent -- all CREATE ... IF NOT EXISTS)."""
+    """Apply schema.sql (idempotent -- all CREATE ... IF NOT EXISTS), first
+    adding any columns introduced since an existing database was created."""
     conn = conn or get_connection()
     if schema_path is None:
         schema_path = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
             "schema.sql",
         )
+    _add_missing_columns(conn)
     with open(schema_path, "r", encoding="utf-8") as fh:
         conn.executescript(fh.read())
     conn.commit()
@@ -83,12 +161,38 @@ def _to_int(value):
     return int(value)
 
 
+def _feature_params(features, extracted_at=None):
+    """
+    scoring.extract_features() output as the column values (start_date,
+    grad_year, immediate_start, entry_level, senior_title, skill_hits,
+    features_at). All NULL when `features` is None -- nothing was extracted.
+    """
+    if features is None:
+        return (None,) * 7
+    if extracted_at is None:
+        from datetime import datetime, timezone
+        extracted_at = datetime.now(timezone.utc).isoformat()
+    start = features.get("start_date")
+    grad_year = features.get("grad_year")
+    return (
+        start.isoformat() if start is not None else None,
+        int(grad_year) if grad_year is not None else None,
+        _to_int(features.get("immediate_start")),
+        _to_int(features.get("entry_level")),
+        _to_int(features.get("senior_title")),
+        json.dumps(list(features.get("skill_hits") or [])),
+        extracted_at,
+    )
+
+
 def upsert_jobs(raw_jobs, conn=None):
     """
     Insert new jobs / update system columns on existing ones. Mirrors the old
     refresh_jobs contract: returns {"appended", "updated", "locked_skipped"}.
     User-owned columns are only set (to their defaults) on first insert; on
     conflict they are left untouched, and locked rows are not updated at all.
+    A job carrying "features" (scoring.extract_features) also writes the
+    feature columns; one without leaves any stored features alone.
     """
     from datetime import datetime, timezone
     from sheet_reader import generate_job_id
@@ -135,6 +239,10 @@ def upsert_jobs(raw_jobs, conn=None):
                 job.get("confidence"),
                 _to_int(job.get("semantic_scored", 0)),
                 job.get("last_updated", ""),
+                job.get("keyword_score", job.get("relevance_score")),
+                job.get("semantic_score"),
+                job.get("scoring_version"),
+                *_feature_params(job.get("features")),
             ),
         )
         if jid not in existing:
@@ -190,7 +298,7 @@ _JOB_COLUMNS = [
 
 def replace_job_full(row: dict, conn=None):
     """INSERT OR REPLACE a complete job row including user-owned columns.
-    Used only by the one-time Sheet -> Turso migration."""
+    Single-row form; bulk loads should use import_rows(mode="replace")."""
     conn = conn or get_connection()
     cols = ",".join(_JOB_COLUMNS)
     placeholders = ",".join("?" * len(_JOB_COLUMNS))
@@ -336,22 +444,334 @@ def get_unscored_jobs(sources=None, limit=25, conn=None):
     return [{"job_id": r[0], "job_url": r[1], "relevance_score": r[2] or 0} for r in rows]
 
 
-def promote_scores(job_id, relevance_score, confidence, conn=None):
-    """Set the blended score + confidence and mark the job semantic_scored."""
+def promote_scores(job_id, relevance_score, confidence, semantic_score=None,
+                   engine=1, conn=None):
+    """Set the blended score + confidence and mark the job semantic_scored
+    with `engine` (1 Gemini, 2 local -- see semantic_scoring.SEMANTIC_*).
+    `semantic_score` (the raw similarity) is kept so rescoring can re-blend."""
     from datetime import datetime, timezone
 
     conn = conn or get_connection()
     conn.execute(
         """
         UPDATE jobs SET relevance_score = ?, confidence = ?,
-               semantic_scored = 1, last_updated = ?
+               semantic_scored = ?, last_updated = ?,
+               semantic_score = COALESCE(?, semantic_score)
         WHERE job_id = ?
         """,
-        (relevance_score, confidence, datetime.now(timezone.utc).isoformat(), job_id),
+        (relevance_score, confidence, engine, datetime.now(timezone.utc).isoformat(),
+         semantic_score, job_id),
+    )
+    conn.commit()
+
+
+def apply_rescores(changed, restamp_ids, version, semantic=(), conn=None):
+    """
+    Batch-write one batch of rescoring results in a single transaction.
+
+    changed     -- (job_id, relevance_score, confidence, keyword_score,
+                   role_type) rows whose values moved; last_updated is bumped.
+    restamp_ids -- job_ids whose scores are already right; only their
+                   scoring_version is updated (last_updated untouched, so
+                   incremental exports don't re-ship them).
+    semantic    -- (job_id, semantic_score, semantic_scored) rows re-scored
+                   against a new resume; last_updated is bumped.
+
+    Locked rows are never touched.
+    """
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    now = datetime.now(timezone.utc).isoformat()
+    if changed:
+        conn.executemany(
+            """
+            UPDATE jobs SET relevance_score = ?, confidence = ?, keyword_score = ?,
+                   role_type = ?, scoring_version = ?, last_updated = ?
+            WHERE job_id = ? AND locked = 0
+            """,
+            [(score, conf, kw, role, version, now, jid) for jid, score, conf, kw, role in changed],
+        )
+    if restamp_ids:
+        conn.executemany(
+            "UPDATE jobs SET scoring_version = ? WHERE job_id = ? AND locked = 0",
+            [(version, jid) for jid in restamp_ids],
+        )
+    if semantic:
+        conn.executemany(
+            """
+            UPDATE jobs SET semantic_score = ?, semantic_scored = ?, last_updated = ?
+            WHERE job_id = ? AND locked = 0
+            """,
+            [(score, engine, now, jid) for jid, score, engine in semantic],
+        )
+    conn.commit()
+
+
+def set_description(job_id, description, conn=None):
+    """Store a fetched posting description (fill-only: never clobbers one)."""
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    conn.execute(
+        """
+        UPDATE jobs SET description = ?, last_updated = ?
+        WHERE job_id = ? AND (description IS NULL OR description = '')
+        """,
+        (description, datetime.now(timezone.utc).isoformat(), job_id),
+    )
+    conn.commit()
+
+
+# ----------------------------
+# Persisted job features
+# ----------------------------
+
+def set_features(job_id, features, conn=None):
+    """Store scoring.extract_features() output on a job (locked rows skipped)."""
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    conn.execute(
+        """
+        UPDATE jobs SET start_date = ?, grad_year = ?, immediate_start = ?,
+               entry_level = ?, senior_title = ?, skill_hits = ?, features_at = ?,
+               last_updated = ?
+        WHERE job_id = ? AND locked = 0
+        """,
+        (*_feature_params(features), datetime.now(timezone.utc).isoformat(), job_id),
+    )
+    conn.commit()
+
+
+def row_features(start_date, grad_year, immediate_start, entry_level, senior_title, skill_hits):
+    """Stored feature columns back into scoring.extract_features() form."""
+    from datetime import date
+
+    return {
+        "start_date": date.fromisoformat(start_date) if start_date else None,
+        "grad_year": grad_year,
+        "immediate_start": bool(immediate_start),
+        "entry_level": bool(entry_level),
+        "senior_title": bool(senior_title),
+        "skill_hits": json.loads(skill_hits) if skill_hits else [],
+    }
+
+
+def start_date_filter_sql(min_start_date):
+    """
+    (sql, params): a WHERE fragment over the jobs feature columns that keeps
+    exactly the rows scoring.timing_passes() keeps -- a stated start date
+    decides, then a grad year, then "start ASAP" fails; nothing stated
+    passes. Jobs whose features were never extracted pass too (unknown).
+    """
+    return (
+        "(features_at IS NULL OR start_date >= ? OR (start_date IS NULL AND "
+        "(grad_year >= ? OR (grad_year IS NULL AND COALESCE(immediate_start, 0) = 0))))",
+        [min_start_date.isoformat(), min_start_date.year],
+    )
+
+
+def entry_level_filter_sql():
+    """
+    (sql, params) keeping the jobs entry_level_only keeps at ingestion, per
+    source (filter_plan.SOURCE_ENTRY_GATES): entry-level ones for "entry"
+    sources, non-senior titles for "not_senior" ones, everything from
+    ungated sources -- plus jobs never feature-extracted.
+    """
+    from filter_plan import SOURCE_ENTRY_GATES
+
+    entry = [s for s, gate in SOURCE_ENTRY_GATES.items() if gate == "entry"]
+    not_senior = [s for s, gate in SOURCE_ENTRY_GATES.items() if gate == "not_senior"]
+    entry_marks = ",".join("?" * len(entry))
+    not_senior_marks = ",".join("?" * len(not_senior))
+    return (
+        "(features_at IS NULL"
+        f" OR source IS NULL OR source NOT IN ({entry_marks},{not_senior_marks})"
+        f" OR (source IN ({entry_marks}) AND entry_level = 1)"
+        f" OR (source IN ({not_senior_marks}) AND COALESCE(senior_title, 0) = 0))",
+        [*entry, *not_senior, *entry, *not_senior],
+    )
+
+
+# ----------------------------
+# Embedding cache (see semantic_scoring.EmbeddingCache)
+# ----------------------------
+
+def get_embeddings(keys, conn=None):
+    """{key: (dims, vector_blob, encoding, scale)} for the cached keys among
+    `keys`, marking each hit as just used (eviction is least-recently-used
+    first). Rows written before encodings existed read as float32."""
+    import time
+
+    conn = conn or get_connection()
+    found = {}
+    for chunk in _chunks(list(keys), 400):
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(
+            f"SELECT key, dims, vector, encoding, scale FROM embedding_cache "
+            f"WHERE key IN ({placeholders})",
+            tuple(chunk),
+        ).fetchall()
+        found.update((r[0], (r[1], bytes(r[2]), r[3] or "float32", r[4])) for r in rows)
+    if found:
+        now = int(time.time())
+        conn.executemany(
+            "UPDATE embedding_cache SET last_used_at = ? WHERE key = ?",
+            [(now, key) for key in found],
+        )
+        conn.commit()
+    return found
+
+
+def put_embeddings(rows, conn=None):
+    """Store (key, model, dims, vector_blob, encoding, scale) rows; an
+    existing key is kept."""
+    import time
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    if not rows:
+        return
+    now = int(time.time())
+    created = datetime.now(timezone.utc).isoformat()
+    conn.executemany(
+        """
+        INSERT INTO embedding_cache
+            (key, model, dims, vector, encoding, scale, created_at, last_used_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET last_used_at = excluded.last_used_at
+        """,
+        [(key, model, dims, blob, encoding, scale, created, now)
+         for key, model, dims, blob, encoding, scale in rows],
+    )
+    conn.commit()
+
+
+def evict_embeddings(max_rows, conn=None):
+    """Delete least-recently-used cache rows beyond `max_rows`. Returns the
+    number deleted."""
+    conn = conn or get_connection()
+    excess = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0] - max_rows
+    if excess <= 0:
+        return 0
+    conn.execute(
+        """
+        DELETE FROM embedding_cache WHERE key IN (
+            SELECT key FROM embedding_cache ORDER BY last_used_at ASC LIMIT ?
+        )
+        """,
+        (excess,),
+    )
+    conn.commit()
+    return excess
+
+
+def embedding_cache_stats(conn=None):
+    """{"rows", "bytes", "models": {model: rows}} for the stored cache."""
+    conn = conn or get_connection()
+    rows, size = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embedding_cache"
+    ).fetchone()
+    models = dict(conn.execute(
+        "SELECT model, COUNT(*) FROM embedding_cache GROUP BY model"
+    ).fetchall())
+    return {"rows": rows, "bytes": size, "models": models}
+
+
+def put_job_embeddings(rows, conn=None):
+    """
+    Store (job_id, model, dims, scale, int8_blob) rows (job_index.
+    embedding_rows), replacing any earlier embedding of the same job. Each
+    row gets the next seq -- assigned inside the write, so it follows commit
+    order across writers whatever their clocks say.
+    """
+    import time
+
+    conn = conn or get_connection()
+    if not rows:
+        return
+    now = time.time_ns() // 1_000_000
+    conn.executemany(
+        """
+        INSERT INTO job_embeddings (job_id, model, dims, scale, vector, updated_at, seq)
+        VALUES (?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM job_embeddings))
+        ON CONFLICT(job_id) DO UPDATE SET
+            model = excluded.model, dims = excluded.dims, scale = excluded.scale,
+            vector = excluded.vector, updated_at = excluded.updated_at, seq = excluded.seq
+        """,
+        [(job_id, model, dims, scale, blob, now) for job_id, model, dims, scale, blob in rows],
     )
     conn.commit()
 
 
+def iter_job_embeddings(model=None, since=None, conn=None):
+    """[(job_id, model, dims, int8_blob, seq)] in write order: those stored
+    for `model` (every model when None), only those with seq > `since` when
+    given. Rows stored before seq existed read as seq 0."""
+    conn = conn or get_connection()
+    sql = "SELECT job_id, model, dims, vector, COALESCE(seq, 0) FROM job_embeddings WHERE 1 = 1"
+    params = []
+    if model is not None:
+        sql += " AND model = ?"
+        params.append(model)
+    if since is not None:
+        sql += " AND seq > ?"
+        params.append(since)
+    rows = conn.execute(sql + " ORDER BY seq", tuple(params)).fetchall()
+    return [(r[0], r[1], r[2], bytes(r[3]), r[4]) for r in rows]
+
+
+def job_embeddings_seq(conn=None):
+    """The highest seq stored in job_embeddings (0 when none)."""
+    conn = conn or get_connection()
+    return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM job_embeddings").fetchone()[0]
+
+
+def similar_jobs(job_id, k=10, include_archived=False, conn=None):
+    """
+    The `k` stored jobs whose embeddings are closest to `job_id`'s, best
+    first: [{"job_id", "similarity", "job_title", "company", "job_url",
+    "relevance_score", "applied"}]. Served from the in-memory job_index
+    (no API calls); [] if the job has no stored embedding at the configured
+    embedding_dims.
+    """
+    from job_index import index_for, shared_connection
+    from semantic_scoring import settings_space
+
+    # Not get_connection(): a fresh connection would mean loading a fresh
+    # index on every call.
+    conn = conn or shared_connection()
+    index = index_for(conn, settings_space(get_settings(conn)))
+    want = k
+    while True:
+        hits = index.similar(job_id, want)
+        if not hits:
+            return []
+        details = {}
+        for chunk in _chunks([h[0] for h in hits], 400):
+            placeholders = ",".join("?" * len(chunk))
+            sql = (
+                "SELECT job_id, job_title, company, job_url, relevance_score, applied "
+                f"FROM jobs WHERE job_id IN ({placeholders})"
+            )
+            if not include_archived:
+                sql += " AND archived = 0"
+            for r in conn.execute(sql, tuple(chunk)).fetchall():
+                details[r[0]] = {
+                    "job_title": r[1], "company": r[2], "job_url": r[3],
+                    "relevance_score": r[4], "applied": bool(r[5]),
+                }
+        out = [
+            {"job_id": jid, "similarity": round(sim, 4), **details[jid]}
+            for jid, sim in hits if jid in details
+        ]
+        # Archived/deleted jobs were dropped: widen the search until k remain.
+        if len(out) >= k or len(hits) < want:
+            return out[:k]
+        want *= 4
+
+
 # ----------------------------
 # Email dedupe/audit
 # ----------------------------
@@ -378,3 +798,580 @@ def mark_email_processed(email_id, job_id, classified_status, confidence, conn=N
          datetime.now(timezone.utc).isoformat()),
     )
     conn.commit()
+
+
+# ----------------------------
+# Work queue (lease/claim so parallel workers never double-process a job)
+# ----------------------------
+
+# How long a claimed row stays reserved before another worker may take it
+# over. Workers heartbeat while they hold a batch, so this only matters when
+# a worker crashes mid-batch.
+DEFAULT_LEASE_SECONDS = 600
+# A row that fails this many times (e.g. posting expired, page unfetchable) is
+# parked as 'failed' instead of being retried on every run forever.
+MAX_WORK_ATTEMPTS = 3
+
+# Which jobs are eligible for each queued task. Checked both when enqueuing
+# and again at claim time, so a job scored inline since it was queued is
+# never picked up twice.
+_TASK_ELIGIBILITY = {
+    "semantic": "j.semantic_scored = 0",
+    # Scored offline (local_scoring); re-scored once Gemini is available.
+    "semantic_upgrade": "j.semantic_scored = 2",
+    "describe": "(j.description IS NULL OR j.description = '')",
+    "enrich": "j.enriched_at IS NULL",
+}
+_ELIGIBLE_BASE = (
+    "j.archived = 0 AND j.locked = 0 "
+    "AND j.job_url != '' AND j.job_url IS NOT NULL"
+)
+
+
+def default_worker_id():
+    """A holder id unique per process (and per Actions run when available)."""
+    import socket
+
+    run_id = os.environ.get("GITHUB_RUN_ID")
+    base = f"{socket.gethostname()}:{os.getpid()}"
+    return f"gha-{run_id}:{base}" if run_id else base
+
+
+def _eligible_where(task, sources, params):
+    if task not in _TASK_ELIGIBILITY:
+        raise ValueError(f"Unknown work-queue task: {task!r}")
+    where = f"{_ELIGIBLE_BASE} AND {_TASK_ELIGIBILITY[task]}"
+    if sources:
+        placeholders = ",".join("?" * len(sources))
+        where += f" AND j.source IN ({placeholders})"
+        params.extend(sources)
+    return where
+
+
+def enqueue_jobs(task, sources=None, conn=None):
+    """
+    Queue every currently-eligible job for `task`. Idempotent: jobs already in
+    the queue (pending, leased, done or failed) are left as they are. Returns
+    the number of newly queued rows.
+    """
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    now = datetime.now(timezone.utc).isoformat()
+    params = [task, now, now]
+    where = _eligible_where(task, list(sources or []), params)
+    cur = conn.execute(
+        f"""
+        INSERT INTO work_queue (task, job_id, status, priority, attempts,
+                                created_at, updated_at)
+        SELECT ?, j.job_id, 'pending', j.date_found, 0, ?, ?
+        FROM jobs j WHERE {where}
+        ON CONFLICT(task, job_id) DO NOTHING
+        """,
+        tuple(params),
+    )
+    conn.commit()
+    return max(getattr(cur, "rowcount", 0) or 0, 0)
+
+
+def claim_work(task, worker_id, limit=25, lease_seconds=DEFAULT_LEASE_SECONDS,
+               sources=None, conn=None):
+    """
+    Atomically lease up to `limit` rows for `task`, newest-first. A row is
+    claimable when it is pending, or leased but its lease has expired (the
+    holder crashed). The claim is a single UPDATE, so two workers racing on
+    the same queue can never both get the same job.
+
+    Returns [{"job_id", "job_url", "relevance_score", "attempts", "job_title",
+    "keyword_score", "source"}] -- the same shape as get_unscored_jobs, plus
+    the attempt count, title, pre-blend keyword score and source.
+    """
+    import time
+    import uuid
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    now = int(time.time())
+    token = uuid.uuid4().hex
+    claimable = "(q.status = 'pending' OR (q.status = 'leased' AND q.lease_expires < ?))"
+
+    params = [
+        worker_id, token, now + lease_seconds,
+        datetime.now(timezone.utc).isoformat(), task,
+    ]
+    sub_params = [task, MAX_WORK_ATTEMPTS, now]
+    where = _eligible_where(task, list(sources or []), sub_params)
+    sub_params.append(limit)
+    params.extend(sub_params)
+    params.append(now)
+
+    conn.execute(
+        f"""
+        UPDATE work_queue AS q
+        SET status = 'leased', lease_owner = ?, lease_token = ?,
+            lease_expires = ?, updated_at = ?
+        WHERE q.task = ? AND q.job_id IN (
+            SELECT q.job_id FROM work_queue q JOIN jobs j ON j.job_id = q.job_id
+            WHERE q.task = ? AND q.attempts < ? AND {claimable}
+              AND {where}
+            ORDER BY q.priority DESC LIMIT ?
+        ) AND {claimable}
+        """,
+        tuple(params),
+    )
+    conn.commit()
+
+    rows = conn.execute(
+        """
+        SELECT q.job_id, j.job_url, j.relevance_score, q.attempts, j.job_title,
+               j.keyword_score, j.source
+        FROM work_queue q JOIN jobs j ON j.job_id = q.job_id
+        WHERE q.task = ? AND q.lease_token = ?
+        ORDER BY q.priority DESC
+        """,
+        (task, token),
+    ).fetchall()
+    return [
+        {"job_id": r[0], "job_url": r[1], "relevance_score": r[2] or 0,
+         "attempts": r[3] or 0, "job_title": r[4] or "", "keyword_score": r[5],
+         "source": r[6]}
+        for r in rows
+    ]
+
+
+def heartbeat_work(task, job_ids, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS, conn=None):
+    """Extend the lease on rows this worker still holds. Returns rows renewed."""
+    import time
+
+    conn = conn or get_connection()
+    renewed = 0
+    for chunk in _chunks(list(job_ids), 400):
+        placeholders = ",".join("?" * len(chunk))
+        cur = conn.execute(
+            f"""
+            UPDATE work_queue SET lease_expires = ?
+            WHERE task = ? AND status = 'leased' AND lease_owner = ?
+              AND job_id IN ({placeholders})
+            """,
+            (int(time.time()) + lease_seconds, task, worker_id, *chunk),
+        )
+        renewed += max(getattr(cur, "rowcount", 0) or 0, 0)
+    conn.commit()
+    return renewed
+
+
+def complete_work(task, job_id, worker_id, conn=None):
+    """Mark a leased row done. No-op if the lease was lost to another worker."""
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    conn.execute(
+        """
+        UPDATE work_queue
+        SET status = 'done', lease_owner = NULL, lease_token = NULL,
+            lease_expires = NULL, last_error = NULL, updated_at = ?
+        WHERE task = ? AND job_id = ? AND lease_owner = ?
+        """,
+        (datetime.now(timezone.utc).isoformat(), task, job_id, worker_id),
+    )
+    conn.commit()
+
+
+def fail_work(task, job_id, worker_id, error="", conn=None):
+    """
+    Record a failed attempt and release the lease. The row goes back to
+    pending for a later run, or is parked as 'failed' after MAX_WORK_ATTEMPTS.
+    """
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    conn.execute(
+        """
+        UPDATE work_queue
+        SET attempts = attempts + 1,
+            status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END,
+            last_error = ?, lease_owner = NULL, lease_token = NULL,
+            lease_expires = NULL, updated_at = ?
+        WHERE task = ? AND job_id = ? AND lease_owner = ?
+        """,
+        (MAX_WORK_ATTEMPTS, (error or "")[:500],
+         datetime.now(timezone.utc).isoformat(), task, job_id, worker_id),
+    )
+    conn.commit()
+
+
+def release_work(task, job_ids, worker_id, conn=None):
+    """
+    Hand still-leased rows back to the queue without counting an attempt --
+    used when a worker stops early (e.g. the embedding API went away).
+    """
+    conn = conn or get_connection()
+    for chunk in _chunks(list(job_ids), 400):
+        placeholders = ",".join("?" * len(chunk))
+        conn.execute(
+            f"""
+            UPDATE work_queue
+            SET status = 'pending', lease_owner = NULL, lease_token = NULL,
+                lease_expires = NULL
+            WHERE task = ? AND status = 'leased' AND lease_owner = ?
+              AND job_id IN ({placeholders})
+            """,
+            (task, worker_id, *chunk),
+        )
+    conn.commit()
+
+
+def work_queue_stats(task, conn=None):
+    """{status: count} for one task, e.g. {"pending": 40, "done": 12}."""
+    conn = conn or get_connection()
+    rows = conn.execute(
+        "SELECT status, COUNT(*) FROM work_queue WHERE task = ? GROUP BY status",
+        (task,),
+    ).fetchall()
+    return {status: count for status, count in rows}
+
+
+# ----------------------------
+# Run-level single-flight lease
+# ----------------------------
+
+def acquire_run_lease(name, holder, ttl_seconds, conn=None):
+    """
+    Try to take the named run lease for `ttl_seconds`. Succeeds when nobody
+    holds it, the previous holder's lease has expired (crashed run), or
+    `holder` already holds it (which extends it). Returns
+    {"acquired": bool, "holder": str, "expires_at": int} describing whoever
+    holds the lease afterwards.
+    """
+    import time
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    now = int(time.time())
+    conn.execute(
+        """
+        INSERT INTO run_leases (name, holder, acquired_at, expires_at)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            holder = excluded.holder,
+            acquired_at = CASE WHEN run_leases.holder = excluded.holder
+                               THEN run_leases.acquired_at
+                               ELSE excluded.acquired_at END,
+            expires_at = excluded.expires_at
+        WHERE run_leases.expires_at < ? OR run_leases.holder = excluded.holder
+        """,
+        (name, holder, datetime.now(timezone.utc).isoformat(), now + ttl_seconds, now),
+    )
+    conn.commit()
+    row = conn.execute(
+        "SELECT holder, expires_at FROM run_leases WHERE name = ?", (name,)
+    ).fetchone()
+    return {
+        "acquired": bool(row) and row[0] == holder,
+        "holder": row[0] if row else "",
+        "expires_at": row[1] if row else 0,
+    }
+
+
+def release_run_lease(name, holder, conn=None):
+    """Drop the lease if (and only if) `holder` still owns it."""
+    conn = conn or get_connection()
+    conn.execute(
+        "DELETE FROM run_leases WHERE name = ? AND holder = ?", (name, holder)
+    )
+    conn.commit()
+
+
+# ----------------------------
+# Maintenance (statistics, free-page reclaim, integrity + size report)
+# ----------------------------
+
+# Upper bounds that keep a scheduled maintenance pass cheap: ANALYZE samples at
+# most this many rows per index, and one pass reclaims at most this many free
+# pages. Anything left over is picked up by the next run.
+ANALYSIS_LIMIT = 1000
+VACUUM_PAGES_PER_RUN = 2000
+
+
+def maintain(conn=None, time_budget=60.0, full_integrity=False,
+             enable_incremental_vacuum=False):
+    """
+    Routine database upkeep, safe to run on a schedule. Steps, in order:
+
+      1. PRAGMA optimize (with a bounded analysis_limit) so the planner's
+         statistics track the growing jobs table.
+      2. Incremental vacuum of up to VACUUM_PAGES_PER_RUN free pages. Needs
+         auto_vacuum=INCREMENTAL; a database created without it is reported
+         as such and only converted (one full VACUUM) when
+         enable_incremental_vacuum=True.
+      3. quick_check (or the slower integrity_check when full_integrity=True).
+      4. Per-table and per-index size report (dbstat when available, else
+         row counts).
+
+    Every step is best-effort: hosted Turso rejects some PRAGMAs, so a failing
+    step is recorded in the report instead of raising. Steps that would start
+    after `time_budget` seconds are skipped. Returns the report dict.
+    """
+    import time
+
+    conn = conn or get_connection()
+    started = time.monotonic()
+    report = {"steps": {}, "skipped": []}
+
+    def run(step, fn):
+        if time.monotonic() - started > time_budget:
+            report["skipped"].append(step)
+            return
+        try:
+            report["steps"][step] = fn()
+        except Exception as exc:  # unsupported PRAGMA on this backend, etc.
+            report["steps"][step] = f"error: {exc}"
+
+    def pragma(sql):
+        cur = conn.execute(sql)
+        rows = cur.fetchall() if cur is not None else None
+        return rows or []
+
+    report["freelist_before"] = _pragma_int(conn, "freelist_count")
+
+    def optimize():
+        pragma(f"PRAGMA analysis_limit = {int(ANALYSIS_LIMIT)}")
+        pragma("PRAGMA optimize")
+        return "ok"
+
+    def vacuum():
+        mode = _pragma_int(conn, "auto_vacuum")
+        if mode != 2 and enable_incremental_vacuum:
+            pragma("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            return "converted to auto_vacuum=INCREMENTAL (full VACUUM)"
+        if mode != 2:
+            return "skipped (auto_vacuum is not INCREMENTAL)"
+        pragma(f"PRAGMA incremental_vacuum({int(VACUUM_PAGES_PER_RUN)})")
+        return "ok"
+
+    def integrity():
+        check = "integrity_check" if full_integrity else "quick_check"
+        rows = pragma(f"PRAGMA {check}")
+        problems = [r[0] for r in rows if r and r[0] != "ok"]
+        return "ok" if not problems else problems[:20]
+
+    run("optimize", optimize)
+    run("incremental_vacuum", vacuum)
+    run("integrity", integrity)
+    run("sizes", lambda: _size_report(conn))
+    conn.commit()
+
+    report["freelist_after"] = _pragma_int(conn, "freelist_count")
+    report["page_size"] = _pragma_int(conn, "page_size")
+    report["page_count"] = _pragma_int(conn, "page_count")
+    report["elapsed"] = round(time.monotonic() - started, 2)
+    return report
+
+
+def _pragma_int(conn, name):
+    try:
+        row = conn.execute(f"PRAGMA {name}").fetchone()
+    except Exception:
+        return None
+    return int(row[0]) if row and row[0] is not None else None
+
+
+def _size_report(conn):
+    """
+    {name: {"type", "table", "bytes", "pages", "rows"}} for every table and
+    index. Bytes/pages come from the dbstat virtual table when the backend
+    exposes it; row counts are always included for tables.
+    """
+    objects = conn.execute(
+        "SELECT name, type, tbl_name FROM sqlite_master "
+        "WHERE type IN ('table', 'index') AND name NOT LIKE 'sqlite_%'"
+    ).fetchall()
+    report = {
+        name: {"type": kind, "table": tbl, "bytes": None, "pages": None, "rows": None}
+        for name, kind, tbl in objects
+    }
+
+    try:
+        for name, size, pages in conn.execute(
+            "SELECT name, SUM(pgsize), COUNT(*) FROM dbstat GROUP BY name"
+        ).fetchall():
+            if name in report:
+                report[name]["bytes"] = int(size or 0)
+                report[name]["pages"] = int(pages or 0)
+    except Exception:
+        pass  # dbstat not compiled in / not allowed remotely
+
+    for name, info in report.items():
+        if info["type"] == "table":
+            info["rows"] = conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0]
+    return report
+
+
+# ----------------------------
+# Agent bookkeeping (key/value)
+# ----------------------------
+
+def get_state(key, default=None, conn=None):
+    conn = conn or get_connection()
+    row = conn.execute("SELECT value FROM agent_state WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+def set_state(key, value, conn=None, commit=True):
+    from datetime import datetime, timezone
+
+    conn = conn or get_connection()
+    conn.execute(
+        "INSERT OR REPLACE INTO agent_state (key, value, updated_at) VALUES (?, ?, ?)",
+        (key, None if value is None else str(value), datetime.now(timezone.utc).isoformat()),
+    )
+    if commit:
+        conn.commit()
+
+
+def delete_state(key, conn=None):
+    conn = conn or get_connection()
+    conn.execute("DELETE FROM agent_state WHERE key = ?", (key,))
+    conn.commit()
+
+
+# ----------------------------
+# Bulk import / export (streaming, batched, resumable)
+# ----------------------------
+
+# Conflict key per table, used by the fill-only-if-empty import mode.
+TABLE_KEYS = {
+    "jobs": ("job_id",),
+    "status_events": ("id",),
+    "email_matches": ("email_id",),
+    "settings": ("key",),
+    "resume": ("id",),
+    "work_queue": ("task", "job_id"),
+    "run_leases": ("name",),
+    "agent_state": ("key",),
+    "embedding_cache": ("key",),
+    "job_embeddings": ("job_id",),
+}
+
+# Full-database export order: parents before children so a restore of the
+# same file never trips a foreign key. The embedding tables are included so a
+# restore doesn't have to pay to re-embed every job (vectors round-trip as
+# base64 BLOBs).
+EXPORT_TABLES = [
+    "jobs", "status_events", "email_matches", "settings", "resume",
+    "work_queue", "run_leases", "agent_state", "embedding_cache", "job_embeddings",
+]
+
+IMPORT_BATCH_SIZE = 500
+
+
+def table_columns(table, conn=None):
+    conn = conn or get_connection()
+    if table not in TABLE_KEYS:
+        raise ValueError(f"Unknown table: {table!r}")
+    return [r[1] for r in conn.execute(f'PRAGMA table_info("{table}")').fetchall()]
+
+
+def iter_rows(table, batch_size=IMPORT_BATCH_SIZE, conn=None, where=None, params=()):
+    """
+    Stream every row of `table` as a dict, keyset-paginated on rowid so a
+    large table is never held in memory (or in one long-lived remote cursor).
+    `where`/`params` optionally restrict the rows (e.g. an incremental
+    watermark).
+    """
+    conn = conn or get_connection()
+    cols = table_columns(table, conn)
+    if not cols:  # table not created yet on this database
+        return
+    select = ", ".join(f'"{c}"' for c in cols)
+    extra = f" AND ({where})" if where else ""
+    last = -(2 ** 63)
+    while True:
+        rows = conn.execute(
+            f'SELECT rowid, {select} FROM "{table}" WHERE rowid > ?{extra} '
+            f"ORDER BY rowid LIMIT ?",
+            (last, *params, batch_size),
+        ).fetchall()
+        if not rows:
+            return
+        for r in rows:
+            yield dict(zip(cols, r[1:]))
+        last = rows[-1][0]
+
+
+def _import_sql(table, cols, mode):
+    col_list = ", ".join(f'"{c}"' for c in cols)
+    placeholders = ", ".join("?" * len(cols))
+    if mode == "replace":
+        return f'INSERT OR REPLACE INTO "{table}" ({col_list}) VALUES ({placeholders})'
+    if mode != "fill":
+        raise ValueError(f"Unknown import mode: {mode!r} (expected fill or replace)")
+
+    keys = TABLE_KEYS[table]
+    missing = [k for k in keys if k not in cols]
+    if missing:
+        raise ValueError(f"fill import into {table} needs key column(s) {missing}")
+    updates = [
+        f'"{c}" = CASE WHEN ("{table}"."{c}" IS NULL OR "{table}"."{c}" = \'\') '
+        f'AND excluded."{c}" IS NOT NULL THEN excluded."{c}" ELSE "{table}"."{c}" END'
+        for c in cols if c not in keys
+    ]
+    conflict = ", ".join(f'"{k}"' for k in keys)
+    action = f"DO UPDATE SET {', '.join(updates)}" if updates else "DO NOTHING"
+    return (
+        f'INSERT INTO "{table}" ({col_list}) VALUES ({placeholders}) '
+        f"ON CONFLICT({conflict}) {action}"
+    )
+
+
+def import_rows(records, mode="fill", batch_size=IMPORT_BATCH_SIZE,
+                resume_key=None, conn=None):
+    """
+    Write a stream of (table, row_dict) records in batched transactions.
+
+    mode="fill"    -- insert new rows; on an existing row only fill columns that
+                      are NULL/empty (never overwrites dashboard edits).
+    mode="replace" -- INSERT OR REPLACE the whole row.
+
+    With `resume_key`, the number of input records already committed is
+    checkpointed in agent_state inside each batch's transaction, so a failed
+    import re-run with the same key skips straight to where it stopped. The
+    checkpoint is cleared once the stream is fully consumed.
+
+    Unknown columns are ignored. Returns {"read", "written", "resumed_from"}.
+    """
+    conn = conn or get_connection()
+    start = int(get_state(resume_key, 0, conn) or 0) if resume_key else 0
+    known = {}
+    stats = {"read": 0, "written": 0, "resumed_from": start}
+    batch = []
+
+    def flush():
+        groups = {}
+        for table, row in batch:
+            if table not in known:
+                known[table] = set(table_columns(table, conn))
+            cols = tuple(c for c in row if c in known[table])
+            if cols:
+                groups.setdefault((table, cols), []).append(tuple(row[c] for c in cols))
+        for (table, cols), values in groups.items():
+            conn.executemany(_import_sql(table, cols, mode), values)
+            stats["written"] += len(values)
+        if resume_key:
+            set_state(resume_key, stats["read"], conn, commit=False)
+        conn.commit()
+        batch.clear()
+
+    for position, record in enumerate(records):
+        if position < start:
+            continue
+        batch.append(record)
+        stats["read"] = position + 1
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    if resume_key:
+        delete_state(resume_key, conn)
+    return stats